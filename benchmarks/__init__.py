@@ -0,0 +1 @@
+"""Local benchmark suite — run with `python -m benchmarks --help`."""
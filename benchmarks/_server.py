@@ -0,0 +1,218 @@
+"""In-process stand-in for the Hotmart API, served through httpx.MockTransport.
+
+Serves paginated /sales/history, /sales/commissions, /subscriptions and club /students
+payloads shaped like the real API, with configurable page size, page count, latency and
+RateLimit-* headers. Every request is timed, so the runner can report latency percentiles.
+
+Servidor Hotmart simulado em memória, servido via httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+TOKEN_PATH = "/security/oauth/token"
+
+
+@dataclass
+class ServerConfig:
+    pages: int = 20
+    page_size: int = 500
+    latency: float = 0.0  # seconds added to every response
+    rate_limit: int = 1_000_000  # RateLimit-Limit per window; keep it high unless pacing is benchmarked
+    window: float = 60.0
+
+
+def _sale(n: int) -> dict[str, Any]:
+    return {
+        "product": {"id": 1000 + n % 7, "name": f"Course {n % 7}"},
+        "buyer": {"name": f"Buyer {n}", "email": f"buyer{n}@example.com", "ucode": f"B{n:08d}"},
+        "producer": {"name": "Producer", "ucode": "P00000001"},
+        "purchase": {
+            "transaction": f"HP{n:010d}",
+            "order_date": 1_700_000_000_000 + n * 1000,
+            "approved_date": 1_700_000_000_000 + n * 1000 + 500,
+            "status": "APPROVED" if n % 10 else "REFUNDED",
+            "recurrency_number": 1,
+            "is_subscription": n % 3 == 0,
+            "commission_as": "PRODUCER",
+            "price": {"value": 197.0 + n % 50, "currency_code": "BRL"},
+            "payment": {"method": "CREDIT_CARD", "installments_number": 1 + n % 12, "type": "CREDIT_CARD"},
+            "tracking": {"source": "ORGANIC", "source_sck": None, "external_code": None},
+            "offer": {"code": f"off{n % 5}", "payment_mode": "UNIQUE_PAYMENT"},
+            "hotmart_fee": {"total": 19.7, "fixed": 1.0, "base": 18.7, "percentage": 9.9, "currency_code": "BRL"},
+            "warranty_expire_date": 1_700_600_000_000 + n * 1000,
+        },
+    }
+
+
+def _commission(n: int) -> dict[str, Any]:
+    return {
+        "transaction": f"HP{n:010d}",
+        "product": {"id": 1000 + n % 7, "name": f"Course {n % 7}"},
+        "exchange_rate_currency_payout": 1.0,
+        "commissions": [
+            {
+                "commission": {"value": 150.0, "currency_code": "BRL"},
+                "user": {"ucode": "P00000001"},
+                "source": "PRODUCER",
+            },
+            {
+                "commission": {"value": 27.3, "currency_code": "BRL"},
+                "user": {"ucode": f"A{n % 20:08d}"},
+                "source": "AFFILIATE",
+            },
+        ],
+    }
+
+
+def _subscription(n: int) -> dict[str, Any]:
+    return {
+        "subscriber_code": f"S{n:08d}",
+        "subscription_id": n,
+        "status": "ACTIVE" if n % 4 else "CANCELLED_BY_CUSTOMER",
+        "accession_date": 1_690_000_000_000 + n * 1000,
+        "end_accession_date": None,
+        "request_date": 1_690_000_000_000 + n * 1000,
+        "date_next_charge": 1_710_000_000_000,
+        "trial": False,
+        "transaction": f"HP{n:010d}",
+        "plan": {"name": "Monthly", "id": 10, "recurrency_period": 30, "max_charge_cycles": None},
+        "product": {"id": 2000, "name": "Membership", "ucode": "prod-ucode"},
+        "price": {"value": 49.9, "currency_code": "BRL"},
+        "subscriber": {"name": f"Subscriber {n}", "email": f"sub{n}@example.com", "ucode": f"U{n:08d}", "id": n},
+    }
+
+
+def _student(n: int) -> dict[str, Any]:
+    return {
+        "user_id": f"U{n:08d}",
+        "name": f"Student {n}",
+        "email": f"student{n}@example.com",
+        "role": "STUDENT",
+        "status": "ACTIVE",
+        "first_access_date": 1_700_000_000_000,
+        "last_access_date": 1_700_500_000_000,
+        "access_count": n % 90,
+        "progress": {"completed_percentage": n % 100, "total": 120, "completed": n % 120},
+        "locale": "pt_BR",
+        "is_deletable": False,
+    }
+
+
+_PAGED = {
+    "/payments/api/v1/sales/history": _sale,
+    "/payments/api/v1/sales/commissions": _commission,
+    "/payments/api/v1/subscriptions": _subscription,
+}
+
+
+@dataclass
+class MockHotmart:
+    """Builds payloads once per page index and serves them from memory, so the server side
+    costs almost nothing and the measurements reflect the SDK."""
+
+    config: ServerConfig = field(default_factory=ServerConfig)
+    latencies: list[float] = field(default_factory=list)
+    requests: int = 0
+    bytes_sent: int = 0
+
+    def __post_init__(self) -> None:
+        self._cache: dict[tuple[str, int], bytes] = {}
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.latencies.clear()
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def warm(self) -> None:
+        """Build every page up front so payload generation is not measured."""
+        for path in _PAGED:
+            for page in range(self.config.pages):
+                self._page(path, page)
+        self._page("/club/api/v1/students", 0)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._ahandle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        return self._respond(request, start)
+
+    async def _ahandle(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        return self._respond(request, start)
+
+    def _respond(self, request: httpx.Request, start: float) -> httpx.Response:
+        path = request.url.path
+        if path == TOKEN_PATH:
+            body = json.dumps({"access_token": "bench", "token_type": "bearer", "expires_in": 86400}).encode()
+            return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+        if path in _PAGED:
+            token = request.url.params.get("page_token")
+            page = int(token) if token else 0
+            body = self._page(path, page)
+        elif path == "/club/api/v1/students":
+            body = self._page(path, 0)
+        else:
+            return httpx.Response(404)
+
+        headers = {"Content-Type": "application/json", **self._rate_limit_headers()}
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += len(body)
+            self.latencies.append(time.perf_counter() - start)
+        return httpx.Response(200, content=body, headers=headers)
+
+    def _page(self, path: str, page: int) -> bytes:
+        key = (path, page)
+        body = self._cache.get(key)
+        if body is not None:
+            return body
+        size = self.config.page_size
+        if path == "/club/api/v1/students":
+            body = json.dumps([_student(n) for n in range(size)]).encode()
+        else:
+            items = [_PAGED[path](page * size + n) for n in range(size)]
+            has_next = page + 1 < self.config.pages
+            page_info = {
+                "total_results": self.config.pages * size,
+                "results_per_page": size,
+                **({"next_page_token": str(page + 1)} if has_next else {}),
+            }
+            body = json.dumps({"items": items, "page_info": page_info}).encode()
+        self._cache[key] = body
+        return body
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.config.window:
+                self._window_start, self._used = now, 0
+            self._used += 1
+            remaining = max(self.config.rate_limit - self._used, 0)
+            reset = self.config.window - (now - self._window_start)
+        return {
+            "RateLimit-Limit": str(self.config.rate_limit),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(int(reset) + 1),
+        }
@@ -0,0 +1,253 @@
+"""Throughput / latency / memory benchmarks for the SDK against the in-process mock server.
+
+    python -m benchmarks                      # full run
+    python -m benchmarks --quick              # small sizes, for CI smoke runs
+    python -m benchmarks -s history_raw -s history_prefetch --latency-ms 20
+    python -m benchmarks --json results.json  # machine-readable output for comparisons
+
+Each scenario runs twice: once for timing and once under tracemalloc for peak memory
+(tracemalloc slows Python down, so it is kept out of the timed pass). Latency percentiles are
+measured per HTTP round trip through httpx event hooks on the injected client.
+
+Benchmarks de vazão, latência e memória do SDK contra o servidor simulado.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from hotmart import AsyncHotmart, Hotmart
+
+from ._server import MockHotmart, ServerConfig
+
+CREDENTIALS = {"client_id": "bench", "client_secret": "bench", "basic": "Basic YmVuY2g6YmVuY2g="}
+
+
+@dataclass
+class Result:
+    scenario: str
+    requests: int
+    items: int
+    seconds: float
+    requests_per_sec: float
+    items_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    peak_mib: float | None
+
+
+class _Timer:
+    """httpx event hooks recording the duration of every round trip."""
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+
+    def request(self, request: httpx.Request) -> None:
+        request.extensions["bench_start"] = time.perf_counter()
+
+    def response(self, response: httpx.Response) -> None:
+        self.samples.append(time.perf_counter() - response.request.extensions["bench_start"])
+
+    async def arequest(self, request: httpx.Request) -> None:
+        self.request(request)
+
+    async def aresponse(self, response: httpx.Response) -> None:
+        self.response(response)
+
+
+def _percentile(samples: list[float], q: int) -> float:
+    if len(samples) < 2:
+        return samples[0] * 1000 if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1] * 1000
+
+
+def _sync_client(server: MockHotmart, timer: _Timer, **options: Any) -> Hotmart:
+    http = httpx.Client(
+        transport=server.transport(),
+        event_hooks={"request": [timer.request], "response": [timer.response]},
+    )
+    return Hotmart(**CREDENTIALS, http_client=http, **options)
+
+
+def _async_client(server: MockHotmart, timer: _Timer, **options: Any) -> AsyncHotmart:
+    http = httpx.AsyncClient(
+        transport=server.async_transport(),
+        event_hooks={"request": [timer.arequest], "response": [timer.aresponse]},
+    )
+    return AsyncHotmart(**CREDENTIALS, http_client=http, **options)
+
+
+# Scenarios receive (server, timer, workdir) and return the number of items consumed.
+Scenario = Callable[[MockHotmart, _Timer, Path], int]
+
+
+def _history(mode: str, prefetch: int = 0) -> Scenario:
+    def run(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+        client = _sync_client(server, timer, response_mode=mode)
+        return sum(1 for _ in client.sales.history_autopaginate(prefetch=prefetch))
+
+    return run
+
+
+def _subscriptions(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+    client = _sync_client(server, timer)
+    return sum(1 for _ in client.subscriptions.list_autopaginate())
+
+
+def _commissions(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+    client = _sync_client(server, timer)
+    return sum(1 for _ in client.sales.commissions_autopaginate())
+
+
+def _club_students(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+    client = _sync_client(server, timer)
+    return sum(len(client.club.students(subdomain="bench")) for _ in range(server.config.pages))
+
+
+def _export(fmt: str) -> Scenario:
+    def run(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+        client = _sync_client(server, timer)
+        return client.sales.export_history(workdir / f"history.{fmt}", format=fmt)  # type: ignore[arg-type]
+
+    return run
+
+
+def _async_history(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+    async def main() -> int:
+        async with _async_client(server, timer) as client:
+            return sum([1 async for _ in client.sales.history_autopaginate()])
+
+    return asyncio.run(main())
+
+
+def _async_concurrent(server: MockHotmart, timer: _Timer, workdir: Path) -> int:
+    # Four independent streams on one client: history, commissions, subscriptions, history (raw).
+    async def drain(iterator: Any) -> int:
+        return sum([1 async for _ in iterator])
+
+    async def main() -> int:
+        async with _async_client(server, timer) as client:
+            counts = await asyncio.gather(
+                drain(client.sales.history_autopaginate()),
+                drain(client.sales.commissions_autopaginate()),
+                drain(client.subscriptions.list_autopaginate()),
+                drain(client.with_options(response_mode="raw").sales.history_autopaginate()),
+            )
+        return sum(counts)
+
+    return asyncio.run(main())
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "history_validate": _history("validate"),
+    "history_construct": _history("construct"),
+    "history_raw": _history("raw"),
+    "history_prefetch": _history("validate", prefetch=2),
+    "subscriptions_validate": _subscriptions,
+    "commissions_validate": _commissions,
+    "club_students": _club_students,
+    "export_ndjson": _export("ndjson"),
+    "export_csv": _export("csv"),
+    "export_parquet": _export("parquet"),
+    "async_history": _async_history,
+    "async_concurrent": _async_concurrent,
+}
+
+
+def run_scenario(name: str, config: ServerConfig, *, memory: bool = True) -> Result:
+    scenario = SCENARIOS[name]
+    with tempfile.TemporaryDirectory() as tmp:
+        server, timer = MockHotmart(config), _Timer()
+        server.warm()
+        start = time.perf_counter()
+        items = scenario(server, timer, Path(tmp))
+        seconds = time.perf_counter() - start
+        requests = server.requests
+
+        peak_mib: float | None = None
+        if memory:
+            server.reset_stats()
+            tracemalloc.start()
+            try:
+                scenario(server, _Timer(), Path(tmp))
+                peak_mib = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+    return Result(
+        scenario=name,
+        requests=requests,
+        items=items,
+        seconds=seconds,
+        requests_per_sec=requests / seconds if seconds else 0.0,
+        items_per_sec=items / seconds if seconds else 0.0,
+        p50_ms=_percentile(timer.samples, 50),
+        p99_ms=_percentile(timer.samples, 99),
+        peak_mib=peak_mib,
+    )
+
+
+def run_all(names: list[str], config: ServerConfig, *, memory: bool = True) -> list[Result]:
+    if "export_parquet" in names and not _has_pyarrow():
+        print("skipping export_parquet: pyarrow is not installed", file=sys.stderr)
+        names = [n for n in names if n != "export_parquet"]
+    return [run_scenario(name, config, memory=memory) for name in names]
+
+
+def format_table(results: list[Result]) -> str:
+    header = f"{'scenario':<24}{'reqs':>7}{'items':>9}{'sec':>8}{'req/s':>10}{'items/s':>12}" \
+             f"{'p50 ms':>9}{'p99 ms':>9}{'peak MiB':>10}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        peak = f"{r.peak_mib:>10.1f}" if r.peak_mib is not None else f"{'-':>10}"
+        lines.append(
+            f"{r.scenario:<24}{r.requests:>7}{r.items:>9}{r.seconds:>8.2f}{r.requests_per_sec:>10.1f}"
+            f"{r.items_per_sec:>12.0f}{r.p50_ms:>9.2f}{r.p99_ms:>9.2f}{peak}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable); default: all")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency added to every response")
+    parser.add_argument("--rate-limit", type=int, default=1_000_000, help="RateLimit-Limit served per 60s window")
+    parser.add_argument("--quick", action="store_true", help="3 pages of 50 items, for smoke runs")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--json", type=Path, help="also write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    config = ServerConfig(pages=args.pages, page_size=args.page_size, latency=args.latency_ms / 1000,
+                          rate_limit=args.rate_limit)
+    if args.quick:
+        config = replace(config, pages=3, page_size=50)
+
+    results = run_all(args.scenario or list(SCENARIOS), config, memory=not args.no_memory)
+    print(format_table(results))
+    if args.json:
+        payload = {"config": asdict(config), "results": [asdict(r) for r in results]}
+        args.json.write_text(json.dumps(payload, indent=2))
+    return 0
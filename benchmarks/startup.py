@@ -0,0 +1,88 @@
+"""Cold-start cost of the SDK: import time and client construction, each in a fresh interpreter.
+
+    python -m benchmarks.startup                      # median of 10 runs per stage
+    python -m benchmarks.startup --runs 3 --max-import-ms 50 --max-construct-ms 1000 --max-first-resource-ms 1200
+
+Every run starts a new Python process, so nothing is cached in sys.modules; stages are
+cumulative (construct includes the import, first_resource includes construction). Besides the
+time, the number of hotmart modules loaded — and how many of them are resources — shows whether
+something became eager again. `--max-<stage>-ms` exits with status 1 when the median of that
+stage exceeds the budget.
+
+Custo de inicialização do SDK: tempo de import e de construção do cliente, em processos novos.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+_CONSTRUCT = "client = hotmart.Hotmart(client_id='bench', client_secret='bench', basic='Basic x')"
+
+STAGES: dict[str, str] = {
+    "import": "import hotmart",
+    "construct": f"import hotmart\n{_CONSTRUCT}",
+    "first_resource": f"import hotmart\n{_CONSTRUCT}\nclient.sales",
+}
+
+_CHILD = """\
+import sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+names = [name for name in sys.modules if name == "hotmart" or name.startswith("hotmart.")]
+print(elapsed, len(names), sum(1 for name in names if name.startswith("hotmart.resources")))
+"""
+
+
+@dataclass
+class StartupResult:
+    stage: str
+    median_ms: float
+    min_ms: float
+    modules: int
+    resources: int
+
+
+def measure(stage: str, runs: int) -> StartupResult:
+    samples: list[float] = []
+    modules = resources = 0
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _CHILD.format(body=STAGES[stage])],
+                             check=True, capture_output=True, text=True).stdout.split()
+        samples.append(float(out[0]) * 1000)
+        modules, resources = int(out[1]), int(out[2])
+    return StartupResult(stage, statistics.median(samples), min(samples), modules, resources)
+
+
+def format_table(results: list[StartupResult]) -> str:
+    header = f"{'stage':<16}{'median ms':>11}{'min ms':>9}{'modules':>9}{'resources':>11}"
+    lines = [header, "-" * len(header)]
+    lines += [f"{r.stage:<16}{r.median_ms:>11.1f}{r.min_ms:>9.1f}{r.modules:>9}{r.resources:>11}" for r in results]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per stage")
+    for stage in STAGES:
+        parser.add_argument(f"--max-{stage.replace('_', '-')}-ms", type=float, dest=f"max_{stage}_ms",
+                            help=f"fail when the median {stage} time exceeds this")
+    args = parser.parse_args(argv)
+
+    results = [measure(stage, args.runs) for stage in STAGES]
+    print(format_table(results))
+    status = 0
+    for result in results:
+        budget = getattr(args, f"max_{result.stage}_ms")
+        if budget is not None and result.median_ms > budget:
+            print(f"{result.stage} took {result.median_ms:.1f} ms, over the {budget:g} ms budget", file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,62 +1,139 @@
-from ._client import Hotmart
-from ._exceptions import (
-    APIStatusError,
-    AuthenticationError,
-    BadRequestError,
-    HotmartError,
-    InternalServerError,
-    NotFoundError,
-    RateLimitError,
-)
-from .models import (
-    CommissionSource,
-    CouponItem,
-    EventItem,
-    ModuleItem,
-    NegotiationResponse,
-    OfferItem,
-    PageInfo,
-    PageItem,
-    PaginatedResponse,
-    PaymentType,
-    PlanItem,
-    Price,
-    ProductFormat,
-    ProductItem,
-    ProductStatus,
-    PurchaseStatus,
-    SaleCommissionsItem,
-    SaleHistoryItem,
-    SaleParticipantsItem,
-    SalePriceDetailsItem,
-    SaleSummaryItem,
-    StudentItem,
-    StudentProgress,
-    SubscriptionBulkResponse,
-    SubscriptionItem,
-    SubscriptionPurchase,
-    SubscriptionResult,
-    SubscriptionStatus,
-    SubscriptionSummaryItem,
-    TicketItem,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._cache import (
+        DEFAULT_CACHE_TTLS,
+        CacheBackend,
+        CachedResponse,
+        FileCacheBackend,
+        MemoryCacheBackend,
+        ResponseCache,
+    )
+    from ._circuit_breaker import CircuitBreaker, CircuitState
+    from ._client import AsyncHotmart, Hotmart
+    from ._exceptions import (
+        APIStatusError,
+        AuthenticationError,
+        BadRequestError,
+        CircuitOpenError,
+        HotmartError,
+        InternalServerError,
+        NotFoundError,
+        RateLimitError,
+    )
+    from ._instrumentation import Hooks, MetricsCollector, OpenTelemetryHooks, RequestInfo
+    from ._pagination import AsyncAutoPager, AutoPager, PaginationCursor
+    from ._rate_limit import (
+        FileRateLimitBackend,
+        MemoryRateLimitBackend,
+        PacingRateLimiter,
+        Priority,
+        RateLimitBackend,
+        RateLimitBucket,
+        RateLimitPolicy,
+        RateLimitTracker,
+    )
+    from ._retry import RetryBudget
+    from ._sqlite_sync import SQLiteSync, SyncResult
+    from ._token_store import CachedToken, FileTokenStore, TokenStore
+    from .models import (
+        CommissionSource,
+        CouponItem,
+        EventItem,
+        ModuleItem,
+        NegotiationResponse,
+        OfferItem,
+        PageInfo,
+        PageItem,
+        PaginatedResponse,
+        PaymentType,
+        PlanItem,
+        Price,
+        ProductFormat,
+        ProductItem,
+        ProductStatus,
+        PurchaseStatus,
+        SaleCommissionsItem,
+        SaleHistoryItem,
+        SaleParticipantsItem,
+        SalePriceDetailsItem,
+        SaleSummaryItem,
+        StudentItem,
+        StudentProgress,
+        SubscriptionBulkResponse,
+        SubscriptionBulkResult,
+        SubscriptionItem,
+        SubscriptionPurchase,
+        SubscriptionResult,
+        SubscriptionStatus,
+        SubscriptionSummaryItem,
+        TicketItem,
+    )
+    from .resources.coupons import CouponOutcome
 
 __version__ = "1.0.0"
 
 __all__ = [
-    "Hotmart",
+    "Hotmart", "AsyncHotmart",
+    "SQLiteSync", "SyncResult",
+    "PaginationCursor", "AutoPager", "AsyncAutoPager",
+    "TokenStore", "FileTokenStore", "CachedToken",
+    "RateLimitPolicy", "PacingRateLimiter", "RateLimitTracker", "Priority",
+    "RateLimitBackend", "RateLimitBucket", "MemoryRateLimitBackend", "FileRateLimitBackend",
+    "Hooks", "RequestInfo", "MetricsCollector", "OpenTelemetryHooks",
+    "CircuitBreaker", "CircuitState", "RetryBudget",
+    "ResponseCache", "DEFAULT_CACHE_TTLS", "CacheBackend", "CachedResponse", "MemoryCacheBackend", "FileCacheBackend",
     "PaginatedResponse", "Price", "PageInfo",
     "PurchaseStatus", "SubscriptionStatus", "PaymentType",
     "CommissionSource", "ProductStatus", "ProductFormat",
     "SaleHistoryItem", "SaleSummaryItem", "SaleParticipantsItem",
     "SaleCommissionsItem", "SalePriceDetailsItem",
     "SubscriptionItem", "SubscriptionSummaryItem", "SubscriptionPurchase",
-    "SubscriptionBulkResponse", "SubscriptionResult",
+    "SubscriptionBulkResponse", "SubscriptionBulkResult", "SubscriptionResult",
     "ProductItem", "OfferItem", "PlanItem",
-    "CouponItem",
+    "CouponItem", "CouponOutcome",
     "ModuleItem", "PageItem", "StudentItem", "StudentProgress",
     "EventItem", "TicketItem",
     "NegotiationResponse",
     "HotmartError", "AuthenticationError", "BadRequestError", "NotFoundError",
-    "RateLimitError", "InternalServerError", "APIStatusError",
+    "RateLimitError", "InternalServerError", "APIStatusError", "CircuitOpenError",
 ]
+
+# Everything is imported on first access, so `import hotmart` stays cheap: the HTTP stack,
+# the resources and the pydantic models are only loaded once something needs them.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "._cache": (
+        "DEFAULT_CACHE_TTLS", "CacheBackend", "CachedResponse", "FileCacheBackend", "MemoryCacheBackend",
+        "ResponseCache",
+    ),
+    "._circuit_breaker": ("CircuitBreaker", "CircuitState"),
+    "._client": ("AsyncHotmart", "Hotmart"),
+    "._exceptions": (
+        "APIStatusError", "AuthenticationError", "BadRequestError", "CircuitOpenError", "HotmartError",
+        "InternalServerError", "NotFoundError", "RateLimitError",
+    ),
+    "._instrumentation": ("Hooks", "MetricsCollector", "OpenTelemetryHooks", "RequestInfo"),
+    "._pagination": ("AsyncAutoPager", "AutoPager", "PaginationCursor"),
+    "._rate_limit": (
+        "FileRateLimitBackend", "MemoryRateLimitBackend", "PacingRateLimiter", "Priority", "RateLimitBackend",
+        "RateLimitBucket", "RateLimitPolicy", "RateLimitTracker",
+    ),
+    "._retry": ("RetryBudget",),
+    "._sqlite_sync": ("SQLiteSync", "SyncResult"),
+    "._token_store": ("CachedToken", "FileTokenStore", "TokenStore"),
+    ".models": (
+        "CommissionSource", "CouponItem", "EventItem", "ModuleItem", "NegotiationResponse", "OfferItem", "PageInfo",
+        "PageItem", "PaginatedResponse", "PaymentType", "PlanItem", "Price", "ProductFormat", "ProductItem",
+        "ProductStatus", "PurchaseStatus", "SaleCommissionsItem", "SaleHistoryItem", "SaleParticipantsItem",
+        "SalePriceDetailsItem", "SaleSummaryItem", "StudentItem", "StudentProgress", "SubscriptionBulkResponse",
+        "SubscriptionBulkResult", "SubscriptionItem", "SubscriptionPurchase", "SubscriptionResult",
+        "SubscriptionStatus", "SubscriptionSummaryItem", "TicketItem",
+    ),
+    ".resources.coupons": ("CouponOutcome",),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,51 +1,307 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 import threading
 import time
+import weakref
+from collections.abc import AsyncIterator
+from typing import Any
 
 import httpx
 
 from ._config import AUTH_URL, ClientConfig
+from ._instrumentation import hook_dispatcher
+from ._token_store import CachedToken, TokenStore, token_key
 
 _REFRESH_BUFFER = 300  # refresh 5 min before expiry
+_BACKGROUND_LEAD = 900  # background refresher renews 15 min before expiry, well ahead of the inline buffer
+_BACKGROUND_RETRY = 30.0  # wait between failed background attempts
 
+_log = logging.getLogger("hotmart")
 
-class TokenManager:
+# One asyncio.Lock per event loop and credential pair, taken before the store lock.
+_loop_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _renew_at(expires_at: float) -> float:
+    # Short-lived tokens (sandbox, tests) are renewed halfway through their lifetime instead.
+    return expires_at - min(_BACKGROUND_LEAD, max(expires_at - time.time(), 0.0) / 2)
+
+
+class _BaseTokenManager:
     def __init__(self, config: ClientConfig) -> None:
         self._config = config
         self._token: str | None = None
         self._expires_at: float = 0.0
+        self._renew_at: float = 0.0
+        self._store_key = token_key(config.client_id, config.client_secret)
+        self._hooks = hook_dispatcher(config.hooks)
+
+    def _is_valid(self) -> bool:
+        return self._token is not None and time.time() < self._expires_at - _REFRESH_BUFFER
+
+    def _set_token(self, token: str, expires_at: float) -> None:
+        self._token, self._expires_at, self._renew_at = token, expires_at, _renew_at(expires_at)
+
+    def _adopt_shared(self, *, newer: bool = False) -> bool:
+        # Take over a token another process already fetched into the shared store. The
+        # background refresher only takes it if it expires later than the one it holds.
+        cached = self._config.token_store.get(self._store_key)  # type: ignore[union-attr]
+        if cached is None or time.time() >= cached.expires_at - _REFRESH_BUFFER:
+            return False
+        if newer and cached.expires_at <= self._expires_at:
+            return False
+        self._set_token(cached.access_token, cached.expires_at)
+        return True
+
+    def _needs_background_renewal(self) -> bool:
+        return time.time() >= self._renew_at
+
+    def _publish(self) -> None:
+        self._config.token_store.set(  # type: ignore[union-attr]
+            self._store_key, CachedToken(access_token=self._token, expires_at=self._expires_at)  # type: ignore[arg-type]
+        )
+
+    def _forget(self, token: str | None) -> None:
+        # Only drop the shared entry if it still holds the token we were told is bad; another
+        # process may already have replaced it with a fresh one.
+        store = self._config.token_store
+        if store is None or token is None:
+            return
+        with store.lock(self._store_key):
+            cached = store.get(self._store_key)
+            if cached is not None and cached.access_token == token:
+                store.delete(self._store_key)
+
+    def _auth_request_kwargs(self) -> dict[str, Any]:
+        return {
+            "headers": {"Authorization": self._config.basic},
+            "params": {
+                "grant_type": "client_credentials",
+                "client_id": self._config.client_id,
+                "client_secret": self._config.client_secret,
+            },
+        }
+
+    def _store(self, response: httpx.Response) -> str:
+        response.raise_for_status()
+        data = response.json()
+        self._set_token(data["access_token"], time.time() + data["expires_in"])
+        return self._token  # type: ignore[return-value]
+
+
+class TokenManager(_BaseTokenManager):
+    def __init__(self, config: ClientConfig, http: httpx.Client | None = None) -> None:
+        super().__init__(config)
+        self._http = http  # the client's pooled connection, reused for the auth call
         self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: threading.Thread | None = None
+        self._refresher_lock = threading.Lock()
 
     def get_token(self) -> str:
+        if self._config.background_refresh and self._refresher is None:
+            self._start_refresher()
         if self._is_valid():
             return self._token  # type: ignore[return-value]
 
         with self._lock:
             if self._is_valid():
                 return self._token  # type: ignore[return-value]
-            return self._refresh()
+            store = self._config.token_store
+            if store is None:
+                return self._refresh()
+            if self._adopt_shared():
+                return self._token  # type: ignore[return-value]
+            with store.lock(self._store_key):
+                if self._adopt_shared():
+                    return self._token  # type: ignore[return-value]
+                token = self._refresh()
+                self._publish()
+                return token
 
     def invalidate(self) -> None:
         with self._lock:
-            self._token = None
-            self._expires_at = 0.0
+            token, self._token = self._token, None
+            self._expires_at = self._renew_at = 0.0
+            self._forget(token)
 
-    def _is_valid(self) -> bool:
-        return self._token is not None and time.time() < self._expires_at - _REFRESH_BUFFER
+    def close(self) -> None:
+        """Stop the background refresher, if running."""
+        self._stop.set()
 
     def _refresh(self) -> str:
-        response = httpx.post(
-            AUTH_URL,
-            headers={"Authorization": self._config.basic},
-            params={
-                "grant_type": "client_credentials",
-                "client_id": self._config.client_id,
-                "client_secret": self._config.client_secret,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        self._token = data["access_token"]
-        self._expires_at = time.time() + data["expires_in"]
-        return self._token  # type: ignore[return-value]
+        if self._hooks is None:
+            return self._fetch()
+        start = time.perf_counter()
+        try:
+            token = self._fetch()
+        except BaseException as exc:
+            self._hooks.emit("on_token_refresh", duration=time.perf_counter() - start, error=exc)
+            raise
+        self._hooks.emit("on_token_refresh", duration=time.perf_counter() - start, error=None)
+        return token
+
+    def _fetch(self) -> str:
+        if self._http is None:
+            return self._store(httpx.post(AUTH_URL, **self._auth_request_kwargs()))
+        return self._store(self._http.post(AUTH_URL, **self._auth_request_kwargs()))
+
+    def _start_refresher(self) -> None:
+        with self._refresher_lock:
+            if self._refresher is not None or self._stop.is_set():
+                return
+            self._refresher = threading.Thread(target=self._run_refresher, daemon=True, name="hotmart-token-refresh")
+            self._refresher.start()
+
+    def _run_refresher(self) -> None:
+        # Renews the token ahead of expiry so request threads keep hitting the lock-free fast
+        # path. If renewal keeps failing, the inline refresh in get_token takes over once the
+        # token enters _REFRESH_BUFFER.
+        while not self._stop.is_set():
+            delay = self._renew_at - time.time()
+            if delay > 0:
+                self._stop.wait(delay)
+                continue
+            try:
+                self._renew()
+            except Exception as exc:
+                _log.warning("background token refresh failed, retrying in %.0fs: %s", _BACKGROUND_RETRY, exc)
+                self._stop.wait(_BACKGROUND_RETRY)
+
+    def _renew(self) -> None:
+        with self._lock:
+            if not self._needs_background_renewal():
+                return
+            store = self._config.token_store
+            if store is None:
+                self._refresh()
+                return
+            with store.lock(self._store_key):
+                if not self._adopt_shared(newer=True):
+                    self._refresh()
+                    self._publish()
+
+
+class AsyncTokenManager(_BaseTokenManager):
+    """asyncio counterpart of TokenManager — refreshes without blocking the event loop.
+
+    Contraparte asyncio do TokenManager — renova o token sem bloquear o event loop.
+    """
+
+    def __init__(self, config: ClientConfig, http: httpx.AsyncClient | None = None) -> None:
+        super().__init__(config)
+        self._http = http
+        self._lock = asyncio.Lock()
+        self._refresher: asyncio.Task[None] | None = None
+
+    async def get_token(self) -> str:
+        if self._config.background_refresh and (self._refresher is None or self._refresher.done()):
+            self._refresher = asyncio.get_running_loop().create_task(self._run_refresher())
+        if self._is_valid():
+            return self._token  # type: ignore[return-value]
+
+        async with self._lock:
+            if self._is_valid():
+                return self._token  # type: ignore[return-value]
+            store = self._config.token_store
+            if store is None:
+                return await self._refresh()
+            # Store calls may block (file locks, network), so they run in worker threads.
+            if await asyncio.to_thread(self._adopt_shared):
+                return self._token  # type: ignore[return-value]
+            async with self._shared_lock(store):
+                if await asyncio.to_thread(self._adopt_shared):
+                    return self._token  # type: ignore[return-value]
+                token = await self._refresh()
+                await asyncio.to_thread(self._publish)
+                return token
+
+    async def invalidate(self) -> None:
+        async with self._lock:
+            token, self._token = self._token, None
+            self._expires_at = self._renew_at = 0.0
+            await asyncio.to_thread(self._forget, token)
+
+    async def aclose(self) -> None:
+        """Cancel the background refresher task, if running."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+
+    async def _refresh(self) -> str:
+        if self._hooks is None:
+            return await self._fetch()
+        start = time.perf_counter()
+        try:
+            token = await self._fetch()
+        except BaseException as exc:
+            self._hooks.emit("on_token_refresh", duration=time.perf_counter() - start, error=exc)
+            raise
+        self._hooks.emit("on_token_refresh", duration=time.perf_counter() - start, error=None)
+        return token
+
+    async def _fetch(self) -> str:
+        if self._http is None:
+            async with httpx.AsyncClient() as http:
+                return self._store(await http.post(AUTH_URL, **self._auth_request_kwargs()))
+        return self._store(await self._http.post(AUTH_URL, **self._auth_request_kwargs()))
+
+    async def _run_refresher(self) -> None:
+        while True:
+            delay = self._renew_at - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self._renew()
+            except Exception as exc:
+                _log.warning("background token refresh failed, retrying in %.0fs: %s", _BACKGROUND_RETRY, exc)
+                await asyncio.sleep(_BACKGROUND_RETRY)
+
+    async def _renew(self) -> None:
+        async with self._lock:
+            if not self._needs_background_renewal():
+                return
+            store = self._config.token_store
+            if store is None:
+                await self._refresh()
+                return
+            async with self._shared_lock(store):
+                if not await asyncio.to_thread(self._adopt_shared, newer=True):
+                    await self._refresh()
+                    await asyncio.to_thread(self._publish)
+
+    @contextlib.asynccontextmanager
+    async def _shared_lock(self, store: TokenStore) -> AsyncIterator[None]:
+        """Hold `store.lock()` without parking more than one worker thread per event loop.
+
+        Managers on the same loop queue on an asyncio.Lock first; otherwise every one of them
+        would block an executor thread on the store lock and starve the holder's own calls.
+        If the caller is cancelled while the lock is being taken, it is released once acquired.
+
+        Serializa no event loop antes de bloquear uma thread no lock do store.
+        """
+        loop = asyncio.get_running_loop()
+        async with _loop_locks.setdefault(loop, {}).setdefault(self._store_key, asyncio.Lock()):
+            shared_lock = store.lock(self._store_key)
+            entering = asyncio.ensure_future(asyncio.to_thread(shared_lock.__enter__))
+            try:
+                await asyncio.shield(entering)
+            except BaseException:
+                def release(future: asyncio.Future[Any]) -> None:
+                    if not future.cancelled() and future.exception() is None:
+                        loop.run_in_executor(None, shared_lock.__exit__, None, None, None)
+
+                entering.add_done_callback(release)
+                raise
+            try:
+                yield
+            finally:
+                await asyncio.to_thread(shared_lock.__exit__, None, None, None)
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import dataclasses
 import time
 import uuid
-from typing import Any, TypeVar
+from collections.abc import Callable
+from typing import Any, Self, TypeVar
+from urllib.parse import urlencode
 
 import httpx
 
-from ._auth import TokenManager
+from ._auth import AsyncTokenManager, TokenManager
+from ._cache import CachedResponse, ResponseCache
+from ._circuit_breaker import CircuitBreaker, CircuitState, is_failure
+from ._coalesce import AsyncSingleFlight, SingleFlight
 from ._config import BASE_URLS, ClientConfig
 from ._exceptions import make_status_error
+from ._instrumentation import RequestInfo, _HookDispatcher, _RequestHooks, hook_dispatcher
 from ._logging import HotmartLogger
-from ._rate_limit import RateLimitTracker
-from ._retry import get_retry_delay, is_retryable
+from ._parsing import ResponseMode, load_json, parse, parse_json
+from ._rate_limit import PacingRateLimiter, Priority, rate_limit_namespace
+from ._retry import RetryBudget, get_retry_delay, is_retryable
+from ._token_store import token_key
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 def _build_params(local_vars: dict[str, Any]) -> dict[str, Any]:
@@ -28,23 +40,213 @@ def _build_params(local_vars: dict[str, Any]) -> dict[str, Any]:
     return params
 
 
-class BaseSyncClient:
+def _emit_response(trace: _RequestHooks, response: httpx.Response, duration: float) -> None:
+    trace.emit("on_response", status_code=response.status_code, duration=duration,
+               bytes_sent=len(response.request.content), bytes_received=len(response.content))
+
+
+def _flight_key(
+    path: str, api_domain: str, params: dict[str, Any] | None, cast_to: type[Any] | None, mode: str
+) -> tuple[Any, ...]:
+    query = urlencode(sorted(params.items()), doseq=True) if params else ""
+    return api_domain, path, query, cast_to, mode
+
+
+def _default_rate_limiter(config: ClientConfig) -> PacingRateLimiter:
+    # Clients sharing a client_id share buckets when a shared backend is configured.
+    return PacingRateLimiter(backend=config.rate_limit_backend, namespace=rate_limit_namespace(config.client_id))
+
+
+class _BaseClient:
+    """Transport-agnostic pieces shared by the sync and async clients.
+
+    Partes independentes de transporte compartilhadas pelos clientes sync e async.
+    """
+
+    _config: ClientConfig
+    _logger: HotmartLogger
+    _hooks: _HookDispatcher | None
+    _retry_budget: RetryBudget
+    _resources: tuple[str, ...] = ()
+
+    def with_options(
+        self,
+        *,
+        response_mode: ResponseMode | None = None,
+        max_retries: int | None = None,
+        priority: Priority | None = None,
+    ) -> Self:
+        """Return a copy of this client with some options overridden.
+
+        The copy shares the HTTP connection pool, token cache and rate-limit state with the
+        original, so it is cheap to create per call:
+
+            client.with_options(response_mode="raw").sales.history_autopaginate()
+
+        Retorna uma cópia do cliente com algumas opções sobrescritas, compartilhando conexões,
+        token e estado de rate limit com o original.
+        """
+        overrides: dict[str, Any] = {"response_mode": response_mode, "max_retries": max_retries, "priority": priority}
+        client = copy.copy(self)
+        client._config = dataclasses.replace(
+            self._config, **{k: v for k, v in overrides.items() if v is not None}
+        )
+        client._reset_resources()
+        return client
+
+    def _reset_resources(self) -> None:
+        """Drop resources built for the client this one was copied from; they are created again,
+        bound to this client, on first access. Hotmart / AsyncHotmart list theirs in `_resources`.
+        """
+        for name in self._resources:
+            self.__dict__.pop(name, None)
+
+    def _base_url(self, api_domain: str) -> str:
+        env = "sandbox" if self._config.sandbox else "prod"
+        return BASE_URLS[env][api_domain]
+
+    def _parse(self, cast_to: type[T], data: Any) -> T:
+        return parse(cast_to, data, self._config.response_mode)
+
+    def _process_response(self, response: httpx.Response, cast_to: type[T] | None) -> T | None:
+        if not response.is_success:
+            raise make_status_error(response)
+        return self._decode(response.content, cast_to)
+
+    def _decode(self, content: bytes, cast_to: type[T] | None) -> T | None:
+        if cast_to is None:
+            if not content or content == b"{}":
+                return None
+            return (self._config.json_decoder or load_json)(content)  # type: ignore[no-any-return]
+
+        if not content or content == b"{}":
+            # Hotmart bug: some endpoints (e.g. /coupon/product/{id}) return HTTP 200
+            # with empty body instead of {"items": []}. Fall back to empty model.
+            # Bug Hotmart: alguns endpoints retornam HTTP 200 com body vazio em vez de {"items": []}.
+            return self._parse(cast_to, {})
+
+        return parse_json(cast_to, content, self._config.response_mode, self._config.json_decoder)
+
+    def _may_retry(self, request_id: str, trace: _RequestHooks | None) -> bool:
+        if self._retry_budget.try_spend():
+            return True
+        self._logger.retry_budget_exhausted(request_id=request_id)
+        if trace is not None:
+            trace.emit("on_retry_budget_exhausted")
+        return False
+
+    def _record_outcome(self, breaker: CircuitBreaker, api_domain: str, *, failure: bool) -> None:
+        self._circuit_changed(api_domain, breaker.record(api_domain, failure=failure))
+
+    def _circuit_changed(self, api_domain: str, state: CircuitState | None) -> None:
+        if state is None:
+            return
+        self._logger.circuit_state(api_domain=api_domain, state=state)
+        if self._hooks is not None:
+            self._hooks.emit("on_circuit_state", api_domain=api_domain, state=state)
+
+    def _cache_lookup(self, cache: ResponseCache, key: str, trace: _RequestHooks | None) -> CachedResponse | None:
+        cached = cache.get(key)
+        if trace is not None:
+            trace.emit("on_cache", hit=cached is not None and cached.is_fresh())
+        return cached
+
+    def _fresh_hit(self, cache: ResponseCache, key: str, cached: CachedResponse, cast_to: type[T] | None) -> T | None:
+        """A fresh entry: the result parsed from it when reuse_models kept one, else its body parsed again."""
+        memo = cache.recall(key, cast_to, self._config.response_mode, cached.headers)
+        if memo is not None:
+            return memo[0]  # type: ignore[no-any-return]
+        return self._decode(cached.content, cast_to)
+
+    def _cache_response(
+        self,
+        cache: ResponseCache,
+        key: str,
+        path: str,
+        ttl: float,
+        response: httpx.Response,
+        cast_to: type[T] | None,
+        trace: _RequestHooks | None,
+    ) -> T | None:
+        entry = cache.set(key, path, response.content, ttl, response.headers)
+        start = time.perf_counter()
+        if trace is None:
+            result = self._process_response(response, cast_to)
+        else:
+            result = self._process_traced(response, cast_to, trace)
+        cache.remember(key, cast_to, self._config.response_mode, entry.headers, result, time.perf_counter() - start)
+        return result
+
+    def _not_modified(
+        self,
+        cache: ResponseCache,
+        key: str,
+        cached: CachedResponse,
+        ttl: float,
+        response: httpx.Response,
+        cast_to: type[T] | None,
+        trace: _RequestHooks | None,
+    ) -> T | None:
+        """A 304 to a revalidation: renew the entry and reuse its body, or its parsed result."""
+        entry = cache.renew(key, cached, ttl, response.headers)
+        mode = self._config.response_mode
+        memo = cache.recall(key, cast_to, mode, cached.headers)
+        if memo is not None:
+            result, saved = memo
+            cache.remember(key, cast_to, mode, entry.headers, result, saved)
+        else:
+            result, saved = self._decode(cached.content, cast_to), 0.0
+        if trace is not None:
+            trace.emit("on_not_modified", bytes_saved=len(cached.content), validation_saved=saved)
+        return result  # type: ignore[no-any-return]
+
+    def _process_traced(self, response: httpx.Response, cast_to: type[T] | None, trace: _RequestHooks) -> T | None:
+        start = time.perf_counter()
+        result = self._process_response(response, cast_to)
+        trace.emit("on_validation", model=cast_to.__name__ if cast_to is not None else "json",
+                   mode=self._config.response_mode, duration=time.perf_counter() - start)
+        return result
+
+
+class BaseSyncClient(_BaseClient):
     def __init__(self, config: ClientConfig) -> None:
         self._config = config
-        self._token_manager = TokenManager(config)
-        self._rate_limiter = RateLimitTracker()
+        self._http, self._owns_http = self._build_http(config)
+        self._token_manager = TokenManager(config, self._http)
+        self._rate_limiter = config.rate_limiter or _default_rate_limiter(config)
         self._logger = HotmartLogger(config.log_level)
-        self._http = httpx.Client(timeout=config.timeout, verify=True)
+        self._hooks = hook_dispatcher(config.hooks)
+        self._retry_budget = config.retry_budget or RetryBudget()
+        self._cache_namespace = token_key(config.client_id, config.client_secret)
+        self._inflight = SingleFlight() if config.coalesce_requests else None
+
+    @staticmethod
+    def _build_http(config: ClientConfig) -> tuple[httpx.Client, bool]:
+        if config.http_client is not None:
+            if not isinstance(config.http_client, httpx.Client):
+                raise TypeError("http_client must be an httpx.Client for the sync client")
+            return config.http_client, False
+        if config.transport is not None and not isinstance(config.transport, httpx.BaseTransport):
+            raise TypeError("transport must be an httpx.BaseTransport for the sync client")
+        http = httpx.Client(
+            timeout=config.timeout,
+            verify=True,
+            limits=config.limits(),
+            http2=config.http2,
+            transport=config.transport,
+        )
+        return http, True
 
     def __enter__(self) -> BaseSyncClient:
         return self
 
     def __exit__(self, *_: Any) -> None:
-        self._http.close()
+        self.close()
 
-    def _base_url(self, api_domain: str) -> str:
-        env = "sandbox" if self._config.sandbox else "prod"
-        return BASE_URLS[env][api_domain]
+    def close(self) -> None:
+        self._token_manager.close()
+        if self._owns_http:
+            self._http.close()
 
     def _request(
         self,
@@ -56,43 +258,100 @@ class BaseSyncClient:
         json: dict[str, Any] | None = None,
         cast_to: type[T] | None = None,
     ) -> T | None:
-        url = f"{self._base_url(api_domain)}{path}"
         request_id = str(uuid.uuid4())
+        if self._hooks is None:
+            return self._dispatch(method, path, api_domain, params, json, cast_to, request_id, None)
+
+        trace = self._hooks.bind(RequestInfo(request_id, method, path, api_domain))
+        trace.emit("on_request")
+        start = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            return self._dispatch(method, path, api_domain, params, json, cast_to, request_id, trace)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            trace.emit("on_request_end", duration=time.perf_counter() - start, error=error)
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        api_domain: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        cast_to: type[T] | None,
+        request_id: str,
+        trace: _RequestHooks | None,
+    ) -> T | None:
+        if self._inflight is None or method != "GET":
+            return self._send(method, path, api_domain, params, json, cast_to, request_id, trace)
+        # Identical GETs already in flight share that call and its parsed result.
+        return self._inflight.do(
+            _flight_key(path, api_domain, params, cast_to, self._config.response_mode),
+            lambda: self._send(method, path, api_domain, params, json, cast_to, request_id, trace),
+            None if trace is None else lambda: trace.emit("on_coalesced"),
+        )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        api_domain: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        cast_to: type[T] | None,
+        request_id: str,
+        trace: _RequestHooks | None,
+    ) -> T | None:
+        url = f"{self._base_url(api_domain)}{path}"
 
-        self._rate_limiter.wait_if_needed()
+        cache = self._config.response_cache
+        ttl = cache.ttl_for(method, path) if cache is not None else None
+        cache_key = ""
+        cached: CachedResponse | None = None
+        if cache is not None and ttl is not None:
+            cache_key = cache.key(self._cache_namespace, url, params)
+            cached = self._cache_lookup(cache, cache_key, trace)
+            if cached is not None and cached.is_fresh():
+                return self._fresh_hit(cache, cache_key, cached, cast_to)
+
+        delay = self._rate_limiter.reserve(api_domain, self._config.priority)
+        if delay > 0:
+            if trace is not None:
+                trace.emit("on_rate_limit_wait", priority=self._config.priority, delay=delay)
+            time.sleep(delay)
         token = self._token_manager.get_token()
         headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        if cached is not None:
+            headers.update(ResponseCache.conditional_headers(cached))
 
         self._logger.request(method=method, url=url, request_id=request_id, params=params)
 
-        response = self._execute_with_retry(method, url, headers, params, json, request_id)
+        response = self._execute_with_retry(method, url, headers, params, json, request_id, trace, api_domain)
 
         if response.status_code == 401:
+            # The resend is a retry like any other: it spends the retry budget and goes through
+            # the circuit breaker, so a storm of 401s cannot double the load unchecked.
             self._token_manager.invalidate()
-            token = self._token_manager.get_token()
-            headers["Authorization"] = f"Bearer {token}"
-            response = self._http.request(method, url, headers=headers, params=params, json=json)
-            if not response.is_success:
-                raise make_status_error(response)
-
-        self._rate_limiter.update(response.headers)
-
-        if not response.is_success:
-            raise make_status_error(response)
-
-        if cast_to is None:
-            content = response.content
-            if not content or content == b"{}":
-                return None
-            return response.json()  # type: ignore[return-value]
-
-        if not response.content or response.content == b"{}":
-            # Hotmart bug: some endpoints (e.g. /coupon/product/{id}) return HTTP 200
-            # with empty body instead of {"items": []}. Fall back to empty model.
-            # Bug Hotmart: alguns endpoints retornam HTTP 200 com body vazio em vez de {"items": []}.
-            return cast_to.model_validate({})  # type: ignore[union-attr]
-
-        return cast_to.model_validate(response.json())  # type: ignore[union-attr]
+            if self._may_retry(request_id, trace):
+                token = self._token_manager.get_token()
+                headers["Authorization"] = f"Bearer {token}"
+                response = self._execute_with_retry(
+                    method, url, headers, params, json, request_id, trace, api_domain
+                )
+
+        self._rate_limiter.update(response.headers, api_domain)
+        if cache is not None and ttl is not None:
+            if cached is not None and response.status_code == 304:
+                return self._not_modified(cache, cache_key, cached, ttl, response, cast_to, trace)
+            if response.is_success:
+                return self._cache_response(cache, cache_key, path, ttl, response, cast_to, trace)
+
+        if trace is None:
+            return self._process_response(response, cast_to)
+        return self._process_traced(response, cast_to, trace)
 
     def _execute_with_retry(
         self,
@@ -102,32 +361,52 @@ class BaseSyncClient:
         params: dict[str, Any] | None,
         json: dict[str, Any] | None,
         request_id: str,
+        trace: _RequestHooks | None = None,
+        api_domain: str = "payments",
     ) -> httpx.Response:
         response: httpx.Response | None = None
+        breaker = self._config.circuit_breaker
+        self._retry_budget.deposit()
 
         for attempt in range(self._config.max_retries + 1):
+            if breaker is not None:
+                self._circuit_changed(api_domain, breaker.before_call(api_domain))
             start = time.monotonic()
             try:
                 response = self._http.request(method, url, headers=headers, params=params, json=json)
             except httpx.TransportError:
-                if attempt >= self._config.max_retries:
+                if breaker is not None:
+                    self._record_outcome(breaker, api_domain, failure=True)
+                if attempt >= self._config.max_retries or not self._may_retry(request_id, trace):
                     raise
                 delay = get_retry_delay(attempt)
                 self._logger.retry(attempt=attempt + 1, max_retries=self._config.max_retries,
                                    delay=delay, status_code=0, request_id=request_id)
+                if trace is not None:
+                    trace.emit("on_retry", attempt=attempt + 1, delay=delay, status_code=0)
                 time.sleep(delay)
                 continue
 
-            duration_ms = (time.monotonic() - start) * 1000
+            duration = time.monotonic() - start
             self._logger.response(request_id=request_id, status_code=response.status_code,
-                                  duration_ms=duration_ms)
-
-            if not is_retryable(response.status_code) or attempt >= self._config.max_retries:
+                                  duration_ms=duration * 1000)
+            if trace is not None:
+                _emit_response(trace, response, duration)
+            if breaker is not None:
+                self._record_outcome(breaker, api_domain, failure=is_failure(response.status_code))
+
+            if (
+                not is_retryable(response.status_code)
+                or attempt >= self._config.max_retries
+                or not self._may_retry(request_id, trace)
+            ):
                 return response
 
             delay = get_retry_delay(attempt, response)
             self._logger.retry(attempt=attempt + 1, max_retries=self._config.max_retries,
                                delay=delay, status_code=response.status_code, request_id=request_id)
+            if trace is not None:
+                trace.emit("on_retry", attempt=attempt + 1, delay=delay, status_code=response.status_code)
             time.sleep(delay)
 
         return response  # type: ignore[return-value]
@@ -151,3 +430,248 @@ class BaseSyncClient:
     def _delete(self, path: str, *, api_domain: str = "payments",
                 cast_to: type[T] | None = None) -> T | None:
         return self._request("DELETE", path, api_domain=api_domain, cast_to=cast_to)
+
+
+class BaseAsyncClient(_BaseClient):
+    """asyncio client built on httpx.AsyncClient — same request pipeline as BaseSyncClient.
+
+    Cliente asyncio baseado em httpx.AsyncClient — mesmo pipeline de requisição do BaseSyncClient.
+    """
+
+    def __init__(self, config: ClientConfig) -> None:
+        self._config = config
+        self._http, self._owns_http = self._build_http(config)
+        self._token_manager = AsyncTokenManager(config, self._http)
+        self._rate_limiter = config.rate_limiter or _default_rate_limiter(config)
+        self._logger = HotmartLogger(config.log_level)
+        self._hooks = hook_dispatcher(config.hooks)
+        self._retry_budget = config.retry_budget or RetryBudget()
+        self._cache_namespace = token_key(config.client_id, config.client_secret)
+        self._inflight = AsyncSingleFlight() if config.coalesce_requests else None
+
+    @staticmethod
+    def _build_http(config: ClientConfig) -> tuple[httpx.AsyncClient, bool]:
+        if config.http_client is not None:
+            if not isinstance(config.http_client, httpx.AsyncClient):
+                raise TypeError("http_client must be an httpx.AsyncClient for the async client")
+            return config.http_client, False
+        if config.transport is not None and not isinstance(config.transport, httpx.AsyncBaseTransport):
+            raise TypeError("transport must be an httpx.AsyncBaseTransport for the async client")
+        http = httpx.AsyncClient(
+            timeout=config.timeout,
+            verify=True,
+            limits=config.limits(),
+            http2=config.http2,
+            transport=config.transport,
+        )
+        return http, True
+
+    async def __aenter__(self) -> BaseAsyncClient:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._token_manager.aclose()
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        api_domain: str = "payments",
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        cast_to: type[T] | None = None,
+    ) -> T | None:
+        request_id = str(uuid.uuid4())
+        if self._hooks is None:
+            return await self._dispatch(method, path, api_domain, params, json, cast_to, request_id, None)
+
+        trace = self._hooks.bind(RequestInfo(request_id, method, path, api_domain))
+        trace.emit("on_request")
+        start = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            return await self._dispatch(method, path, api_domain, params, json, cast_to, request_id, trace)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            trace.emit("on_request_end", duration=time.perf_counter() - start, error=error)
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        api_domain: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        cast_to: type[T] | None,
+        request_id: str,
+        trace: _RequestHooks | None,
+    ) -> T | None:
+        if self._inflight is None or method != "GET":
+            return await self._send(method, path, api_domain, params, json, cast_to, request_id, trace)
+        # Identical GETs already in flight share that call and its parsed result.
+        return await self._inflight.do(
+            _flight_key(path, api_domain, params, cast_to, self._config.response_mode),
+            lambda: self._send(method, path, api_domain, params, json, cast_to, request_id, trace),
+            None if trace is None else lambda: trace.emit("on_coalesced"),
+        )
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        api_domain: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        cast_to: type[T] | None,
+        request_id: str,
+        trace: _RequestHooks | None,
+    ) -> T | None:
+        url = f"{self._base_url(api_domain)}{path}"
+
+        cache = self._config.response_cache
+        ttl = cache.ttl_for(method, path) if cache is not None else None
+        cache_key = ""
+        cached: CachedResponse | None = None
+        if cache is not None and ttl is not None:
+            cache_key = cache.key(self._cache_namespace, url, params)
+            cached = await self._off_loop(cache.blocking, self._cache_lookup, cache, cache_key, trace)
+            if cached is not None and cached.is_fresh():
+                return self._fresh_hit(cache, cache_key, cached, cast_to)
+
+        limiter = self._rate_limiter
+        limiter_blocks = isinstance(limiter, PacingRateLimiter) and limiter.blocking
+        delay = await self._off_loop(limiter_blocks, limiter.reserve, api_domain, self._config.priority)
+        if delay > 0:
+            if trace is not None:
+                trace.emit("on_rate_limit_wait", priority=self._config.priority, delay=delay)
+            await asyncio.sleep(delay)
+        token = await self._token_manager.get_token()
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        if cached is not None:
+            headers.update(ResponseCache.conditional_headers(cached))
+
+        self._logger.request(method=method, url=url, request_id=request_id, params=params)
+
+        response = await self._execute_with_retry(method, url, headers, params, json, request_id, trace, api_domain)
+
+        if response.status_code == 401:
+            # The resend is a retry like any other: it spends the retry budget and goes through
+            # the circuit breaker, so a storm of 401s cannot double the load unchecked.
+            await self._token_manager.invalidate()
+            if self._may_retry(request_id, trace):
+                token = await self._token_manager.get_token()
+                headers["Authorization"] = f"Bearer {token}"
+                response = await self._execute_with_retry(
+                    method, url, headers, params, json, request_id, trace, api_domain
+                )
+
+        await self._off_loop(limiter_blocks, limiter.update, response.headers, api_domain)
+        if cache is not None and ttl is not None:
+            if cached is not None and response.status_code == 304:
+                return await self._off_loop(
+                    cache.blocking, self._not_modified, cache, cache_key, cached, ttl, response, cast_to, trace
+                )
+            if response.is_success:
+                return await self._off_loop(
+                    cache.blocking, self._cache_response, cache, cache_key, path, ttl, response, cast_to, trace
+                )
+
+        if trace is None:
+            return self._process_response(response, cast_to)
+        return self._process_traced(response, cast_to, trace)
+
+    @staticmethod
+    async def _off_loop(blocking: bool, fn: Callable[..., R], *args: Any) -> R:
+        """Call a rate-limit or cache method, in a worker thread when its backend does blocking I/O.
+
+        Chama o método em uma thread quando o backend faz I/O bloqueante, sem travar o event loop.
+        """
+        if blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def _execute_with_retry(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        request_id: str,
+        trace: _RequestHooks | None = None,
+        api_domain: str = "payments",
+    ) -> httpx.Response:
+        response: httpx.Response | None = None
+        breaker = self._config.circuit_breaker
+        self._retry_budget.deposit()
+
+        for attempt in range(self._config.max_retries + 1):
+            if breaker is not None:
+                self._circuit_changed(api_domain, breaker.before_call(api_domain))
+            start = time.monotonic()
+            try:
+                response = await self._http.request(method, url, headers=headers, params=params, json=json)
+            except httpx.TransportError:
+                if breaker is not None:
+                    self._record_outcome(breaker, api_domain, failure=True)
+                if attempt >= self._config.max_retries or not self._may_retry(request_id, trace):
+                    raise
+                delay = get_retry_delay(attempt)
+                self._logger.retry(attempt=attempt + 1, max_retries=self._config.max_retries,
+                                   delay=delay, status_code=0, request_id=request_id)
+                if trace is not None:
+                    trace.emit("on_retry", attempt=attempt + 1, delay=delay, status_code=0)
+                await asyncio.sleep(delay)
+                continue
+
+            duration = time.monotonic() - start
+            self._logger.response(request_id=request_id, status_code=response.status_code,
+                                  duration_ms=duration * 1000)
+            if trace is not None:
+                _emit_response(trace, response, duration)
+            if breaker is not None:
+                self._record_outcome(breaker, api_domain, failure=is_failure(response.status_code))
+
+            if (
+                not is_retryable(response.status_code)
+                or attempt >= self._config.max_retries
+                or not self._may_retry(request_id, trace)
+            ):
+                return response
+
+            delay = get_retry_delay(attempt, response)
+            self._logger.retry(attempt=attempt + 1, max_retries=self._config.max_retries,
+                               delay=delay, status_code=response.status_code, request_id=request_id)
+            if trace is not None:
+                trace.emit("on_retry", attempt=attempt + 1, delay=delay, status_code=response.status_code)
+            await asyncio.sleep(delay)
+
+        return response  # type: ignore[return-value]
+
+    async def _get(self, path: str, *, api_domain: str = "payments",
+                   params: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._request("GET", path, api_domain=api_domain, params=params, cast_to=cast_to)
+
+    async def _post(self, path: str, *, api_domain: str = "payments",
+                    json: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._request("POST", path, api_domain=api_domain, json=json, cast_to=cast_to)
+
+    async def _put(self, path: str, *, api_domain: str = "payments",
+                   json: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._request("PUT", path, api_domain=api_domain, json=json, cast_to=cast_to)
+
+    async def _patch(self, path: str, *, api_domain: str = "payments",
+                     json: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._request("PATCH", path, api_domain=api_domain, json=json, cast_to=cast_to)
+
+    async def _delete(self, path: str, *, api_domain: str = "payments",
+                      cast_to: type[T] | None = None) -> T | None:
+        return await self._request("DELETE", path, api_domain=api_domain, cast_to=cast_to)
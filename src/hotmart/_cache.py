@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol, runtime_checkable
+from urllib.parse import urlencode
+
+from ._file_lock import default_directory, private_directory
+
+# Catalog endpoints whose data rarely changes. Patterns are matched against the endpoint path
+# with fnmatch, so "*" stands for an id segment.
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    "/products": 300.0,
+    "/products/*/offers": 300.0,
+    "/products/*/plans": 300.0,
+    "/modules": 300.0,
+    "/pages": 300.0,
+}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    path: str
+    content: bytes
+    expires_at: float  # unix timestamp (seconds)
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Storage for cached response bodies.
+
+    Armazenamento dos corpos de resposta em cache.
+    """
+
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def set(self, key: str, entry: CachedResponse) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def keys(self) -> list[str]: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU bounded to `max_entries` (the default)."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._entries)
+
+
+class FileCacheBackend:
+    """On-disk LRU shared by every process on the host, bounded to about `max_entries` files.
+
+    One file per entry: a JSON header line followed by the raw body. Files are replaced
+    atomically and touched on every hit; the least recently used ones are evicted first.
+    The directory is only swept every `max_entries // 10` writes, so a miss does not pay
+    for listing it, and the bound may be overshot by that many files in between.
+
+    Cache em disco compartilhado entre processos do host, com descarte LRU.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None, max_entries: int = 10_000) -> None:
+        if directory is None:
+            self._directory = default_directory("cache")
+        else:
+            self._directory = private_directory(os.fspath(directory))
+        self.max_entries = max_entries
+        self._sweep_every = max(1, max_entries // 10)
+        self._writes = self._sweep_every - 1  # the first write sweeps what earlier runs left behind
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, hashlib.sha256(key.encode()).hexdigest()[:40] + ".cache")
+
+    def _read(self, path: str) -> tuple[str, CachedResponse] | None:
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+            entry = CachedResponse(path=meta["path"], content=content, expires_at=float(meta["expires_at"]),
+                                   headers=meta.get("headers", {}))
+            return meta["key"], entry
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def get(self, key: str) -> CachedResponse | None:
+        path = self._path(key)
+        found = self._read(path)
+        if found is None or found[0] != key:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return found[1]
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        meta = {"key": key, "path": entry.path, "expires_at": entry.expires_at, "headers": entry.headers}
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode() + b"\n")
+                f.write(entry.content)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+        self._writes += 1  # racy across threads, which only shifts when the next sweep happens
+        if self._writes >= self._sweep_every:
+            self._writes = 0
+            self._evict()
+
+    def _files(self) -> list[os.DirEntry[str]]:
+        with os.scandir(self._directory) as it:
+            return [e for e in it if e.name.endswith(".cache")]
+
+    def _evict(self) -> None:
+        files = self._files()
+        if len(files) <= self.max_entries:
+            return
+        aged: list[tuple[float, str]] = []
+        for entry in files:
+            with contextlib.suppress(OSError):  # deleted by another process meanwhile
+                aged.append((entry.stat().st_mtime, entry.path))
+        aged.sort()
+        for _, path in aged[: len(aged) - self.max_entries]:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+
+    def delete(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path(key))
+
+    def clear(self) -> None:
+        for entry in self._files():
+            with contextlib.suppress(OSError):
+                os.unlink(entry.path)
+
+    def keys(self) -> list[str]:
+        return [found[0] for e in self._files() if (found := self._read(e.path)) is not None]
+
+
+_VALIDATORS = ("ETag", "Last-Modified")
+
+
+def _validators(headers: Mapping[str, str]) -> dict[str, str]:
+    return {name: headers[name] for name in _VALIDATORS if headers.get(name)}
+
+
+class ResponseCache:
+    """Opt-in cache for GET responses of read-mostly endpoints.
+
+    Only endpoints matching a pattern in `ttls` are cached, each for its own TTL in seconds;
+    the defaults cover the product catalog (`products.list`, `offers`, `plans`) and the club
+    `modules` and `pages` for five minutes. Entries are keyed on the credentials, URL and query
+    parameters, and hold the raw body, so hits skip the network, the rate limiter and the token
+    manager and are parsed according to the calling client's response_mode.
+
+    Once an entry expires, it is revalidated instead of refetched when the API sent an `ETag`
+    or `Last-Modified` validator: the request carries `If-None-Match` / `If-Modified-Since`,
+    and a 304 answer renews the entry without downloading the body again. A TTL of 0
+    revalidates on every call, which suits polling. Without validators the request is simply
+    repeated. With `reuse_models=True` a 304 also skips parsing: it returns the very object
+    parsed from the original response, so callers must treat results as read-only.
+
+        cache = ResponseCache(ttls={**DEFAULT_CACHE_TTLS, "/products": 60, "/subscriptions": 0})
+        client = Hotmart(..., response_cache=cache)
+        cache.invalidate("/products/*")      # or cache.invalidate() to drop everything
+
+    Cache opcional para respostas GET de endpoints pouco mutáveis, com TTL por endpoint e
+    revalidação condicional por ETag/Last-Modified.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        ttls: Mapping[str, float] = DEFAULT_CACHE_TTLS,
+        revalidate: bool = True,
+        reuse_models: bool = False,
+        max_models: int = 256,
+    ) -> None:
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = dict(ttls)
+        self.revalidate = revalidate
+        self.reuse_models = reuse_models
+        self.max_models = max_models
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+        self.validation_saved = 0.0  # seconds of parsing skipped thanks to reuse_models
+        self._lock = threading.Lock()
+        # Parsed results of responses that carried validators, reused when a revalidation
+        # returns 304: (key, model, response_mode) -> (validators, result, parse seconds).
+        self._models: OrderedDict[tuple[str, Any, str], tuple[dict[str, str], Any, float]] = OrderedDict()
+
+    @property
+    def blocking(self) -> bool:
+        """Whether the backend does I/O (disk, network), so async clients access it in a thread."""
+        return not isinstance(self.backend, MemoryCacheBackend)
+
+    def ttl_for(self, method: str, path: str) -> float | None:
+        """Seconds to keep responses of this endpoint, or None when it is not cached."""
+        if method != "GET":
+            return None
+        ttl = self.ttls.get(path)
+        if ttl is None:
+            ttl = next((t for pattern, t in self.ttls.items() if fnmatch.fnmatchcase(path, pattern)), None)
+        return ttl
+
+    @staticmethod
+    def key(namespace: str, url: str, params: dict[str, Any] | None) -> str:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return f"{namespace} {url}?{query}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """The entry for `key`: fresh, or stale but revalidatable. Counts a hit or a miss."""
+        entry = self.backend.get(key)
+        hit = entry is not None and entry.is_fresh()
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None or hit or (self.revalidate and entry.headers):
+            return entry
+        return None
+
+    def set(
+        self, key: str, path: str, content: bytes, ttl: float, headers: Mapping[str, str] | None = None
+    ) -> CachedResponse:
+        entry = CachedResponse(path=path, content=content, expires_at=time.time() + ttl,
+                               headers=_validators(headers) if headers is not None else {})
+        if ttl > 0 or (self.revalidate and entry.headers):
+            self.backend.set(key, entry)
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: CachedResponse) -> dict[str, str]:
+        headers = {}
+        if "ETag" in entry.headers:
+            headers["If-None-Match"] = entry.headers["ETag"]
+        if "Last-Modified" in entry.headers:
+            headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+        return headers
+
+    def renew(self, key: str, entry: CachedResponse, ttl: float, headers: Mapping[str, str]) -> CachedResponse:
+        """Record a 304 for `entry`: extend its lifetime and take any updated validators."""
+        renewed = CachedResponse(path=entry.path, content=entry.content, expires_at=time.time() + ttl,
+                                 headers={**entry.headers, **_validators(headers)})
+        self.backend.set(key, renewed)
+        with self._lock:
+            self.not_modified += 1
+            self.bytes_saved += len(entry.content)
+        return renewed
+
+    def remember(
+        self, key: str, model: Any, mode: str, validators: dict[str, str], result: Any, seconds: float
+    ) -> None:
+        """Keep the result parsed from a response with validators, for reuse after a 304."""
+        if not validators or not self.revalidate or not self.reuse_models:
+            return
+        with self._lock:
+            self._models[(key, model, mode)] = (validators, result, seconds)
+            self._models.move_to_end((key, model, mode))
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+
+    def recall(self, key: str, model: Any, mode: str, validators: dict[str, str]) -> tuple[Any, float] | None:
+        """The result parsed for these validators, with the seconds its parse took."""
+        with self._lock:
+            found = self._models.get((key, model, mode))
+            if found is None or found[0] != validators:
+                return None
+            self._models.move_to_end((key, model, mode))
+            self.validation_saved += found[2]
+            return found[1], found[2]
+
+    def invalidate(self, pattern: str | None = None) -> int:
+        """Drop every entry, or those whose endpoint path matches the fnmatch `pattern`.
+
+        Returns how many entries were removed when a pattern is given.
+        """
+        if pattern is None:
+            self.backend.clear()
+            with self._lock:
+                self._models.clear()
+            return 0
+        removed = 0
+        for key in list(self.backend.keys()):
+            entry = self.backend.get(key)
+            if entry is not None and fnmatch.fnmatchcase(entry.path, pattern):
+                self.backend.delete(key)
+                removed += 1
+        with self._lock:
+            for memo_key in [k for k in self._models if self.backend.get(k[0]) is None]:
+                del self._models[memo_key]
+        return removed
+
+    @property
+    def hit_rate(self) -> float:
+        with self._lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
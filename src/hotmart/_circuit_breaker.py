@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from ._exceptions import CircuitOpenError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+def is_failure(status_code: int) -> bool:
+    """5xx answers count against the circuit; 4xx and 429 mean the API is up and responding."""
+    return status_code >= 500
+
+
+@dataclass
+class _Circuit:
+    outcomes: deque[bool]  # True = failure, most recent last
+    state: CircuitState = "closed"
+    opened_at: float = 0.0
+    probes: int = 0
+    probe_started: float = 0.0
+    failures: int = 0  # failures currently in `outcomes`
+
+
+class CircuitBreaker:
+    """Fails fast while an API domain (payments, club, products) is unhealthy.
+
+    Every HTTP attempt is recorded per domain; transport errors and 5xx responses are failures.
+    Once at least `minimum_calls` of the last `window_size` attempts were made and the failure
+    rate reaches `failure_threshold`, the circuit opens: requests to that domain raise
+    CircuitOpenError immediately — retries included — instead of pinning the caller in
+    backoff. After `recovery_timeout` seconds it half-opens and lets `half_open_max_calls`
+    probe requests through; a successful probe closes it, a failed one opens it again.
+
+    One breaker may be shared by several clients, so they all stop calling a degraded domain.
+
+    Disjuntor por domínio da API: falha rápido com CircuitOpenError enquanto o domínio está
+    instável e testa a recuperação depois de `recovery_timeout` segundos.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        if not 0 < minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.window_size = window_size
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, api_domain: str) -> _Circuit:
+        circuit = self._circuits.get(api_domain)
+        if circuit is None:
+            circuit = self._circuits[api_domain] = _Circuit(outcomes=deque(maxlen=self.window_size))
+        return circuit
+
+    def state(self, api_domain: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(api_domain)
+            return "closed" if circuit is None else circuit.state
+
+    def before_call(self, api_domain: str) -> CircuitState | None:
+        """Admit an attempt or raise CircuitOpenError. Returns the new state if it changed."""
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(api_domain)
+            transition: CircuitState | None = None
+            if circuit.state == "open":
+                wait = circuit.opened_at + self.recovery_timeout - now
+                if wait > 0:
+                    raise CircuitOpenError(api_domain, retry_after=wait)
+                circuit.state, circuit.probes = "half_open", 0
+                transition = "half_open"
+            if circuit.state == "half_open":
+                # A probe that never reported back (cancelled, unexpected error) frees its slot
+                # after recovery_timeout, so the circuit cannot stay half-open forever.
+                if circuit.probes >= self.half_open_max_calls and now - circuit.probe_started < self.recovery_timeout:
+                    raise CircuitOpenError(api_domain, retry_after=self.recovery_timeout)
+                if circuit.probes >= self.half_open_max_calls:
+                    circuit.probes = 0
+                circuit.probes += 1
+                circuit.probe_started = now
+            return transition
+
+    def record(self, api_domain: str, *, failure: bool) -> CircuitState | None:
+        """Record an attempt's outcome. Returns the new state if it changed."""
+        with self._lock:
+            circuit = self._circuit(api_domain)
+            if circuit.state == "half_open":
+                circuit.probes = max(circuit.probes - 1, 0)
+                if failure:
+                    return self._open(circuit)
+                circuit.state = "closed"
+                circuit.outcomes.clear()
+                circuit.failures = 0
+                return "closed"
+            if circuit.state == "open":
+                return None  # a straggler that started before the circuit opened
+            if len(circuit.outcomes) == circuit.outcomes.maxlen and circuit.outcomes[0]:
+                circuit.failures -= 1
+            circuit.outcomes.append(failure)
+            circuit.failures += failure
+            calls = len(circuit.outcomes)
+            if calls >= self.minimum_calls and circuit.failures / calls >= self.failure_threshold:
+                return self._open(circuit)
+            return None
+
+    def _open(self, circuit: _Circuit) -> CircuitState:
+        circuit.state, circuit.opened_at, circuit.probes = "open", time.monotonic(), 0
+        circuit.outcomes.clear()
+        circuit.failures = 0
+        return "open"
+
+    def reset(self, api_domain: str | None = None) -> None:
+        """Close one domain's circuit, or all of them, forgetting past outcomes."""
+        with self._lock:
+            if api_domain is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(api_domain, None)
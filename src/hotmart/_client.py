@@ -1,16 +1,34 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-from ._base_client import BaseSyncClient
+import httpx
+
+from ._base_client import BaseAsyncClient, BaseSyncClient
+from ._cache import ResponseCache
+from ._circuit_breaker import CircuitBreaker
 from ._config import ClientConfig
-from .resources.club import Club
-from .resources.coupons import Coupons
-from .resources.events import Events
-from .resources.negotiation import Negotiation
-from .resources.products import Products
-from .resources.sales import Sales
-from .resources.subscriptions import Subscriptions
+from ._instrumentation import Hooks
+from ._parsing import JSONDecoder, ResponseMode
+from ._rate_limit import Priority, RateLimitBackend, RateLimitPolicy
+from ._retry import RetryBudget
+from ._token_store import TokenStore
+
+if TYPE_CHECKING:
+    from .resources.club import AsyncClub, Club
+    from .resources.coupons import AsyncCoupons, Coupons
+    from .resources.events import AsyncEvents, Events
+    from .resources.negotiation import AsyncNegotiation, Negotiation
+    from .resources.products import AsyncProducts, Products
+    from .resources.sales import AsyncSales, Sales
+    from .resources.subscriptions import AsyncSubscriptions, Subscriptions
+
+# Resources are built on first access (and their modules imported then), so constructing a
+# client that only calls one endpoint does not load the models of all the others.
+_RESOURCES = ("sales", "subscriptions", "products", "coupons", "club", "events", "negotiation")
 
 
 class Hotmart(BaseSyncClient):
@@ -22,13 +40,121 @@ class Hotmart(BaseSyncClient):
         sales = client.sales.history(buyer_name="Paula")
     """
 
-    sales: Sales
-    subscriptions: Subscriptions
-    products: Products
-    coupons: Coupons
-    club: Club
-    events: Events
-    negotiation: Negotiation
+    _resources = _RESOURCES
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        client_secret: str,
+        basic: str,
+        sandbox: bool = False,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        log_level: int = logging.WARNING,
+        response_mode: ResponseMode = "validate",
+        json_decoder: JSONDecoder | None = None,
+        token_store: TokenStore | None = None,
+        background_refresh: bool = False,
+        rate_limiter: RateLimitPolicy | None = None,
+        rate_limit_backend: RateLimitBackend | None = None,
+        priority: Priority = "interactive",
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        http_client: httpx.Client | None = None,
+        hooks: Sequence[Hooks] = (),
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+    ) -> None:
+        config = ClientConfig(
+            client_id=client_id,
+            client_secret=client_secret,
+            basic=basic,
+            sandbox=sandbox,
+            max_retries=max_retries,
+            timeout=timeout,
+            log_level=log_level,
+            response_mode=response_mode,
+            json_decoder=json_decoder,
+            token_store=token_store,
+            background_refresh=background_refresh,
+            rate_limiter=rate_limiter,
+            rate_limit_backend=rate_limit_backend,
+            priority=priority,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            transport=transport,
+            http_client=http_client,
+            hooks=hooks,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+        )
+        super().__init__(config)
+
+    @cached_property
+    def sales(self) -> Sales:
+        from .resources.sales import Sales
+
+        return Sales(self)
+
+    @cached_property
+    def subscriptions(self) -> Subscriptions:
+        from .resources.subscriptions import Subscriptions
+
+        return Subscriptions(self)
+
+    @cached_property
+    def products(self) -> Products:
+        from .resources.products import Products
+
+        return Products(self)
+
+    @cached_property
+    def coupons(self) -> Coupons:
+        from .resources.coupons import Coupons
+
+        return Coupons(self)
+
+    @cached_property
+    def club(self) -> Club:
+        from .resources.club import Club
+
+        return Club(self)
+
+    @cached_property
+    def events(self) -> Events:
+        from .resources.events import Events
+
+        return Events(self)
+
+    @cached_property
+    def negotiation(self) -> Negotiation:
+        from .resources.negotiation import Negotiation
+
+        return Negotiation(self)
+
+
+class AsyncHotmart(BaseAsyncClient):
+    """
+    asyncio client for the Hotmart API — same resources as Hotmart, awaitable methods.
+
+    Usage:
+        async with AsyncHotmart(client_id="...", client_secret="...", basic="Basic ...") as client:
+            page = await client.sales.history(buyer_name="Paula")
+            async for sale in client.sales.history_autopaginate():
+                ...
+    """
+
+    _resources = _RESOURCES
 
     def __init__(
         self,
@@ -40,6 +166,24 @@ class Hotmart(BaseSyncClient):
         max_retries: int = 3,
         timeout: float = 30.0,
         log_level: int = logging.WARNING,
+        response_mode: ResponseMode = "validate",
+        json_decoder: JSONDecoder | None = None,
+        token_store: TokenStore | None = None,
+        background_refresh: bool = False,
+        rate_limiter: RateLimitPolicy | None = None,
+        rate_limit_backend: RateLimitBackend | None = None,
+        priority: Priority = "interactive",
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        hooks: Sequence[Hooks] = (),
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
     ) -> None:
         config = ClientConfig(
             client_id=client_id,
@@ -49,12 +193,65 @@ class Hotmart(BaseSyncClient):
             max_retries=max_retries,
             timeout=timeout,
             log_level=log_level,
+            response_mode=response_mode,
+            json_decoder=json_decoder,
+            token_store=token_store,
+            background_refresh=background_refresh,
+            rate_limiter=rate_limiter,
+            rate_limit_backend=rate_limit_backend,
+            priority=priority,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            transport=transport,
+            http_client=http_client,
+            hooks=hooks,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
         )
         super().__init__(config)
-        self.sales = Sales(self)
-        self.subscriptions = Subscriptions(self)
-        self.products = Products(self)
-        self.coupons = Coupons(self)
-        self.club = Club(self)
-        self.events = Events(self)
-        self.negotiation = Negotiation(self)
+
+    @cached_property
+    def sales(self) -> AsyncSales:
+        from .resources.sales import AsyncSales
+
+        return AsyncSales(self)
+
+    @cached_property
+    def subscriptions(self) -> AsyncSubscriptions:
+        from .resources.subscriptions import AsyncSubscriptions
+
+        return AsyncSubscriptions(self)
+
+    @cached_property
+    def products(self) -> AsyncProducts:
+        from .resources.products import AsyncProducts
+
+        return AsyncProducts(self)
+
+    @cached_property
+    def coupons(self) -> AsyncCoupons:
+        from .resources.coupons import AsyncCoupons
+
+        return AsyncCoupons(self)
+
+    @cached_property
+    def club(self) -> AsyncClub:
+        from .resources.club import AsyncClub
+
+        return AsyncClub(self)
+
+    @cached_property
+    def events(self) -> AsyncEvents:
+        from .resources.events import AsyncEvents
+
+        return AsyncEvents(self)
+
+    @cached_property
+    def negotiation(self) -> AsyncNegotiation:
+        from .resources.negotiation import AsyncNegotiation
+
+        return AsyncNegotiation(self)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class _SourceError:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def merge_iterators(
+    sources: Sequence[Callable[[], Iterator[T]]], *, max_buffer: int = 1000
+) -> Iterator[tuple[int, T]]:
+    """Drain every source in its own thread and yield (source_index, item) as items arrive.
+
+    The buffer between workers and the consumer is bounded by max_buffer, so memory stays flat
+    no matter how fast the sources produce. Closing the iterator early stops all workers after
+    their current item; the first worker exception is re-raised in the consumer.
+
+    Consome cada fonte em sua própria thread e produz (índice_da_fonte, item) conforme chegam.
+    """
+    buffer: queue.Queue[tuple[int, Any]] = queue.Queue(maxsize=max_buffer)
+    stop = threading.Event()
+
+    def put(entry: tuple[int, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker(index: int, source: Callable[[], Iterator[T]]) -> None:
+        try:
+            for item in source():
+                if not put((index, item)):
+                    return
+        except Exception as exc:  # forwarded to the consumer thread
+            put((index, _SourceError(exc)))
+            return
+        put((index, _DONE))
+
+    threads = [
+        threading.Thread(target=worker, args=(i, source), daemon=True, name=f"hotmart-merge-{i}")
+        for i, source in enumerate(sources)
+    ]
+    for thread in threads:
+        thread.start()
+
+    pending = len(threads)
+    try:
+        while pending:
+            index, entry = buffer.get()
+            if entry is _DONE:
+                pending -= 1
+            elif isinstance(entry, _SourceError):
+                raise entry.exc
+            else:
+                yield index, entry
+    finally:
+        stop.set()
+
+
+async def amerge_iterators(
+    sources: Sequence[Callable[[], AsyncIterator[T]]], *, max_buffer: int = 1000
+) -> AsyncIterator[tuple[int, T]]:
+    """asyncio counterpart of merge_iterators — one task per source instead of one thread.
+
+    Contraparte asyncio de merge_iterators — uma task por fonte em vez de uma thread.
+    """
+    buffer: asyncio.Queue[tuple[int, Any]] = asyncio.Queue(maxsize=max_buffer)
+
+    async def worker(index: int, source: Callable[[], AsyncIterator[T]]) -> None:
+        try:
+            async for item in source():
+                await buffer.put((index, item))
+        except Exception as exc:
+            await buffer.put((index, _SourceError(exc)))
+            return
+        await buffer.put((index, _DONE))
+
+    tasks = [asyncio.create_task(worker(i, source)) for i, source in enumerate(sources)]
+    pending = len(tasks)
+    try:
+        while pending:
+            index, entry = await buffer.get()
+            if entry is _DONE:
+                pending -= 1
+            elif isinstance(entry, _SourceError):
+                raise entry.exc
+            else:
+                yield index, entry
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def map_unordered(
+    fn: Callable[[A], T], args: Iterable[A], *, concurrency: int
+) -> Iterator[tuple[A, T | Exception]]:
+    """Call `fn` on every arg with up to `concurrency` threads, yielding (arg, result) as calls finish.
+
+    A call that raises yields its exception in place of the result, so one failure does not
+    abort the others. Args are pulled lazily, at most `concurrency` at a time; closing the
+    iterator early cancels the calls that have not started.
+
+    Executa `fn` para cada argumento em até `concurrency` threads e produz (argumento, resultado)
+    conforme as chamadas terminam; exceções são devolvidas no lugar do resultado.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    pending: dict[Future[T], A] = {}
+    source = iter(args)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="hotmart-map") as pool:
+        try:
+            while True:
+                for arg in source:
+                    pending[pool.submit(fn, arg)] = arg
+                    if len(pending) >= concurrency:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    arg = pending.pop(future)
+                    exc = future.exception()
+                    yield arg, exc if isinstance(exc, Exception) else future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def amap_unordered(
+    fn: Callable[[A], Awaitable[T]], args: Iterable[A], *, concurrency: int
+) -> AsyncIterator[tuple[A, T | Exception]]:
+    """asyncio counterpart of map_unordered — one task per in-flight call instead of a thread.
+
+    Contraparte asyncio de map_unordered — uma task por chamada em andamento.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    pending: dict[asyncio.Future[T], A] = {}
+    source = iter(args)
+    try:
+        while True:
+            for arg in source:
+                pending[asyncio.ensure_future(fn(arg))] = arg
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                arg = pending.pop(task)
+                exc = task.exception()
+                if exc is not None and not isinstance(exc, Exception):
+                    raise exc
+                yield arg, exc if exc is not None else task.result()
+    finally:
+        for task in pending:
+            task.cancel()
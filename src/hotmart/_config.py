@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import httpx
+
+from ._cache import ResponseCache
+from ._circuit_breaker import CircuitBreaker
+from ._instrumentation import Hooks
+from ._parsing import RESPONSE_MODES, JSONDecoder, ResponseMode
+from ._rate_limit import PRIORITIES, Priority, RateLimitBackend, RateLimitPolicy
+from ._retry import RetryBudget
+from ._token_store import TokenStore
+
 AUTH_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
 
 BASE_URLS: dict[str, dict[str, str]] = {
@@ -28,3 +39,36 @@ class ClientConfig:
     max_retries: int = 3
     timeout: float = 30.0
     log_level: int = logging.WARNING
+    response_mode: ResponseMode = "validate"
+    json_decoder: JSONDecoder | None = None
+    token_store: TokenStore | None = None
+    background_refresh: bool = False
+    rate_limiter: RateLimitPolicy | None = None
+    rate_limit_backend: RateLimitBackend | None = None
+    priority: Priority = "interactive"
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None
+    # A caller-owned client shared by several Hotmart instances; pool settings above are then
+    # ignored and the client is never closed by the SDK.
+    http_client: httpx.Client | httpx.AsyncClient | None = None
+    hooks: Sequence[Hooks] = ()
+    circuit_breaker: CircuitBreaker | None = None
+    retry_budget: RetryBudget | None = None  # None: a default RetryBudget per client
+    response_cache: ResponseCache | None = None
+    coalesce_requests: bool = False
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def __post_init__(self) -> None:
+        if self.response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {sorted(RESPONSE_MODES)}, got {self.response_mode!r}")
+        if self.priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {sorted(PRIORITIES)}, got {self.priority!r}")
@@ -29,6 +29,15 @@ class InternalServerError(HotmartError):
     pass
 
 
+class CircuitOpenError(HotmartError):
+    """Raised without calling the API while the circuit breaker for `api_domain` is open."""
+
+    def __init__(self, api_domain: str, retry_after: float = 0.0) -> None:
+        super().__init__(f"circuit open for the {api_domain} API; retry in {retry_after:.0f}s")
+        self.api_domain = api_domain
+        self.retry_after = retry_after
+
+
 class APIStatusError(HotmartError):
     def __init__(self, message: str, *, status_code: int, body: str) -> None:
         super().__init__(message)
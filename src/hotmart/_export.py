@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import types
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+ExportFormat = Literal["parquet", "csv", "ndjson"]
+
+_ColumnKind = Literal["int", "float", "bool", "str", "json"]
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def _non_null_args(annotation: Any) -> tuple[Any, ...]:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return tuple(arg for arg in get_args(annotation) if arg is not type(None))
+    return (annotation,)
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    for arg in _non_null_args(annotation):
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+    return None
+
+
+def _kind(annotation: Any) -> _ColumnKind:
+    args = _non_null_args(annotation)
+    if any(get_origin(arg) is list or _nested_model(arg) for arg in args):
+        return "json"
+    if args == (bool,):
+        return "bool"
+    if args == (int,):
+        return "int"
+    if set(args) <= {int, float}:
+        return "float"
+    return "str"
+
+
+def model_columns(model: type[BaseModel], prefix: tuple[str, ...] = ()) -> list[tuple[tuple[str, ...], _ColumnKind]]:
+    """Flatten a model's declared field tree into (path, kind) columns.
+
+    Nested models become dotted columns (`purchase.price.value`); lists and free-form objects
+    are kept as a single JSON-encoded column. Extra fields the API returns but the model does
+    not declare are not exported, which keeps the schema stable across batches.
+
+    Achata a árvore de campos declarados do modelo em colunas (caminho, tipo).
+    """
+    columns: list[tuple[tuple[str, ...], _ColumnKind]] = []
+    for name, field in model.model_fields.items():
+        path = (*prefix, name)
+        nested = _nested_model(field.annotation)
+        if nested is not None and nested.model_fields and get_origin(field.annotation) is not list:
+            columns.extend(model_columns(nested, path))
+        else:
+            columns.append((path, _kind(field.annotation)))
+    return columns
+
+
+def _lookup(item: Any, path: tuple[str, ...]) -> Any:
+    value = item
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+_BOOL_STRINGS = {"true": True, "false": False, "1": True, "0": False}
+
+
+def _coerce(value: Any, kind: _ColumnKind, *, strict: bool = True) -> Any:
+    """Convert a decoded value to its column's type without losing information.
+
+    Raw-mode items are not validated, so a value may arrive as a string or with a fractional
+    part. Only lossless conversions are made — "12" and 12.0 become 12, "false" becomes False —
+    anything else raises ValueError instead of writing a wrong value, or with strict=False (CSV,
+    whose columns are untyped) is written unchanged as text.
+
+    Converte o valor para o tipo da coluna apenas quando não há perda; caso contrário, ValueError.
+    """
+    if value is None:
+        return None
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False, default=str)
+    if kind == "str":
+        return str(value)
+    if kind == "bool":
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, int) and value in (0, 1):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in _BOOL_STRINGS:
+            return _BOOL_STRINGS[value.strip().lower()]
+    elif not isinstance(value, bool):
+        number = _number(value)
+        if kind == "float" and number is not None:
+            return float(number)
+        if kind == "int" and (isinstance(number, int) or (number is not None and number.is_integer())):
+            return int(number)
+    if not strict:
+        return str(value)
+    raise ValueError(f"cannot export {value!r} as {kind} without losing data")
+
+
+def _number(value: Any) -> int | float | None:
+    if isinstance(value, int | float):
+        return value
+    if isinstance(value, str):
+        for convert in (int, float):
+            try:
+                return convert(value)
+            except ValueError:
+                pass
+    return None
+
+
+class Exporter:
+    """Stream decoded API items (dicts) to a file, one bounded batch at a time.
+
+    Used by the `export_*` resource methods. Items are buffered up to `batch_size`, flattened
+    and written (one Parquet row group / a block of CSV or NDJSON lines per batch), so memory
+    is bounded by a single batch regardless of the total number of rows.
+
+    Grava itens da API (dicts) em arquivo, um lote limitado por vez.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        model: type[BaseModel],
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if format not in ("parquet", "csv", "ndjson"):
+            raise ValueError(f"format must be 'parquet', 'csv' or 'ndjson', got {format!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._format = format
+        self._batch_size = batch_size
+        self._columns = model_columns(model)
+        self._names = [".".join(path) for path, _ in self._columns]
+        self._batch: list[dict[str, Any]] = []
+        self.rows_written = 0
+        self._parquet: Any = None
+        self._file: Any = None
+
+        if format == "parquet":
+            pa, pq = _import_pyarrow()
+            self._schema = pa.schema([(name, _ARROW_TYPES[kind](pa)) for name, (_, kind) in
+                                      zip(self._names, self._columns, strict=True)])
+            self._pa = pa
+            self._parquet = pq.ParquetWriter(os.fspath(path), self._schema)
+            return
+
+        self._file = open(path, "w", newline="" if format == "csv" else None, encoding="utf-8")  # noqa: SIM115
+        if format == "csv":
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(self._names)
+
+    def __enter__(self) -> Exporter:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def add(self, item: dict[str, Any]) -> None:
+        self._batch.append(item)
+        if len(self._batch) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        if self._format == "ndjson":
+            self._file.writelines(json.dumps(item, ensure_ascii=False, default=str) + "\n" for item in batch)
+        elif self._format == "csv":
+            self._csv.writerows(
+                [_coerce(_lookup(item, path), kind, strict=False) for path, kind in self._columns] for item in batch
+            )
+        else:
+            data = {
+                name: [_coerce(_lookup(item, path), kind) for item in batch]
+                for name, (path, kind) in zip(self._names, self._columns, strict=True)
+            }
+            self._parquet.write_table(self._pa.Table.from_pydict(data, schema=self._schema))
+        self.rows_written += len(batch)
+
+    def close(self) -> int:
+        self.flush()
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return self.rows_written
+
+
+_ARROW_TYPES: dict[_ColumnKind, Any] = {
+    "int": lambda pa: pa.int64(),
+    "float": lambda pa: pa.float64(),
+    "bool": lambda pa: pa.bool_(),
+    "str": lambda pa: pa.string(),
+    "json": lambda pa: pa.string(),
+}
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            'Parquet export requires pyarrow: pip install "hotmart-python[parquet]"'
+        ) from exc
+    return pa, pq
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from typing import IO
+
+
+def private_directory(path: str) -> str:
+    """Create `path` with 0700 permissions if needed, and refuse it unless the current user owns it.
+
+    Token, rate-limit and cache files must not live where another local user can pre-create the
+    directory or swap it for a symlink and read or plant them.
+
+    Cria o diretório com permissão 0700 e recusa diretórios que não pertencem ao usuário atual.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode) or (hasattr(os, "getuid") and info.st_uid != os.getuid()):
+        raise PermissionError(f"{path} is not a directory owned by the current user")
+    return path
+
+
+def default_directory(*parts: str) -> str:
+    """Per-user state directory: $XDG_CACHE_HOME (~/.cache) or %LOCALAPPDATA%, plus hotmart-python."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = private_directory(os.path.join(base, "hotmart-python"))
+    for part in parts:
+        path = private_directory(os.path.join(path, part))
+    return path
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def lock_file(f: IO[bytes] | IO[str]) -> None:
+        """Block until an exclusive lock on `f` is held (cross-process)."""
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:  # LK_LOCK gives up after ~10s; keep waiting like flock does
+                continue
+
+    def unlock_file(f: IO[bytes] | IO[str]) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def lock_file(f: IO[bytes] | IO[str]) -> None:
+        """Block until an exclusive lock on `f` is held (cross-process)."""
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def unlock_file(f: IO[bytes] | IO[str]) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+_log = logging.getLogger("hotmart")
+
+# Seconds. Covers fast cached pages up to slow exports and long rate-limit sleeps.
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(r"[^/]*\d[^/]*")
+
+
+@dataclass(frozen=True)
+class RequestInfo:
+    """Identifies one logical API call in every request-scoped hook, across retries.
+
+    `path` is the endpoint path relative to the API domain, with ids filled in
+    (e.g. "/subscriptions/ABC123/cancel").
+
+    Identifica uma chamada lógica à API em todos os hooks, inclusive entre retentativas.
+    """
+
+    request_id: str
+    method: str
+    path: str
+    api_domain: str
+
+
+class Hooks:
+    """Base class for instrumentation callbacks; override only the events you need.
+
+    Pass instances with `Hotmart(..., hooks=[...])`. Callbacks run inline on the request path
+    (in the event loop for AsyncHotmart), so keep them cheap; exceptions they raise are logged
+    and swallowed. When no hooks are registered the client skips all of this bookkeeping.
+
+    Durations are in seconds. Event order for one call: on_request, on_cache (cached endpoints
+    only; a hit goes straight to on_request_end), on_rate_limit_wait (only if the client waits),
+    on_response for every HTTP attempt, on_retry between attempts, on_validation once the body
+    is parsed — or on_not_modified when a cached entry was revalidated with a 304 — and
+    on_request_end last, also when it fails. A GET that joins an identical one
+    already in flight (`coalesce_requests=True`) only gets on_request, on_coalesced and
+    on_request_end.
+
+    Classe base para callbacks de instrumentação; sobrescreva apenas os eventos necessários.
+    """
+
+    def on_request(self, request: RequestInfo) -> None: ...
+
+    def on_cache(self, request: RequestInfo, *, hit: bool) -> None: ...
+
+    def on_coalesced(self, request: RequestInfo) -> None: ...
+
+    def on_rate_limit_wait(self, request: RequestInfo, *, priority: str, delay: float) -> None: ...
+
+    def on_response(
+        self, request: RequestInfo, *, status_code: int, duration: float, bytes_sent: int, bytes_received: int
+    ) -> None: ...
+
+    def on_retry(self, request: RequestInfo, *, attempt: int, delay: float, status_code: int) -> None: ...
+
+    def on_retry_budget_exhausted(self, request: RequestInfo) -> None: ...
+
+    def on_validation(self, request: RequestInfo, *, model: str, mode: str, duration: float) -> None: ...
+
+    def on_not_modified(self, request: RequestInfo, *, bytes_saved: int, validation_saved: float) -> None: ...
+
+    def on_request_end(self, request: RequestInfo, *, duration: float, error: BaseException | None) -> None: ...
+
+    def on_token_refresh(self, *, duration: float, error: BaseException | None) -> None: ...
+
+    def on_circuit_state(self, *, api_domain: str, state: str) -> None: ...
+
+
+class _HookDispatcher:
+    # Fans every event out to the registered hooks, isolating the client from hook failures.
+
+    def __init__(self, hooks: Sequence[Hooks]) -> None:
+        self._hooks = tuple(hooks)
+
+    def emit(self, event: str, *args: Any, **kwargs: Any) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, event)(*args, **kwargs)
+            except Exception:
+                _log.exception("instrumentation hook %r failed in %s", hook, event)
+
+    def bind(self, request: RequestInfo) -> _RequestHooks:
+        return _RequestHooks(self, request)
+
+
+class _RequestHooks:
+    # The dispatcher bound to one API call, threaded through the request pipeline.
+
+    __slots__ = ("dispatcher", "request")
+
+    def __init__(self, dispatcher: _HookDispatcher, request: RequestInfo) -> None:
+        self.dispatcher = dispatcher
+        self.request = request
+
+    def emit(self, event: str, **kwargs: Any) -> None:
+        self.dispatcher.emit(event, self.request, **kwargs)
+
+
+def hook_dispatcher(hooks: Sequence[Hooks]) -> _HookDispatcher | None:
+    """None when nothing is registered, so call sites can skip instrumentation with one check."""
+    return _HookDispatcher(hooks) if hooks else None
+
+
+def route(path: str) -> str:
+    """Collapse path segments holding ids into "{id}" to keep metric label cardinality bounded.
+
+    Agrupa segmentos de caminho com ids em "{id}" para limitar a cardinalidade dos rótulos.
+    """
+    return _ID_SEGMENT.sub("{id}", path)
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)  # non-cumulative; the +Inf bucket is `count`
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self.bounds, value)
+        if i < len(self.counts):
+            self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, n in zip(self.bounds, self.counts, strict=True):
+            cumulative += n
+            buckets[bound] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+Labels = tuple[tuple[str, str], ...]
+
+_METRICS: dict[str, tuple[str, str]] = {
+    "hotmart_requests_total": ("counter", "HTTP responses received, per attempt."),
+    "hotmart_request_duration_seconds": ("histogram", "HTTP round-trip time per attempt."),
+    "hotmart_request_bytes_total": ("counter", "Request body bytes sent."),
+    "hotmart_response_bytes_total": ("counter", "Response body bytes received."),
+    "hotmart_retries_total": ("counter", "Retries scheduled after a retryable status or transport error."),
+    "hotmart_retry_budget_exhausted_total": ("counter", "Retries skipped because the retry budget was empty."),
+    "hotmart_cache_requests_total": ("counter", "Response cache lookups, by result."),
+    "hotmart_not_modified_total": ("counter", "Cached responses revalidated with a 304 Not Modified."),
+    "hotmart_bytes_saved_total": ("counter", "Response body bytes not downloaded thanks to 304 revalidation."),
+    "hotmart_validation_saved_seconds_total": ("counter", "Parsing time skipped by reusing models after a 304."),
+    "hotmart_coalesced_requests_total": ("counter", "GETs that joined an identical request already in flight."),
+    "hotmart_request_errors_total": ("counter", "API calls that raised, by exception type."),
+    "hotmart_rate_limit_wait_seconds": ("histogram", "Time spent waiting for the rate limiter."),
+    "hotmart_validation_duration_seconds": ("histogram", "Time spent decoding and parsing response bodies."),
+    "hotmart_token_refresh_duration_seconds": ("histogram", "Time spent fetching OAuth tokens."),
+    "hotmart_token_refresh_errors_total": ("counter", "Failed OAuth token requests."),
+    "hotmart_circuit_state": ("gauge", "Circuit breaker state per API domain: 0 closed, 1 half-open, 2 open."),
+    "hotmart_circuit_transitions_total": ("counter", "Circuit breaker state changes."),
+}
+
+_CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+class MetricsCollector(Hooks):
+    """In-memory metrics with per-endpoint latency histograms, exportable as Prometheus text.
+
+        metrics = MetricsCollector()
+        client = Hotmart(..., hooks=[metrics])
+        ...
+        print(metrics.to_prometheus())
+
+    Endpoints are labelled by `route(path)` (ids collapsed to "{id}"); pass `route=` to group
+    them differently. Thread-safe, so one collector can be shared by several clients.
+
+    Métricas em memória com histogramas de latência por endpoint, exportáveis no formato Prometheus.
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        route: Callable[[str], str] = route,
+    ) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._route = route
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[Labels, float]] = {}  # gauges too: they are simply set, not added to
+        self._histograms: dict[str, dict[Labels, _Histogram]] = {}
+
+    def _endpoint(self, request: RequestInfo) -> Labels:
+        return (("method", request.method), ("path", self._route(request.path)))
+
+    def _inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + value
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = _Histogram(self._buckets)
+        histogram.observe(value)
+
+    def on_coalesced(self, request: RequestInfo) -> None:
+        with self._lock:
+            self._inc("hotmart_coalesced_requests_total", self._endpoint(request))
+
+    def on_cache(self, request: RequestInfo, *, hit: bool) -> None:
+        with self._lock:
+            self._inc("hotmart_cache_requests_total", (*self._endpoint(request), ("result", "hit" if hit else "miss")))
+
+    def on_not_modified(self, request: RequestInfo, *, bytes_saved: int, validation_saved: float) -> None:
+        endpoint = self._endpoint(request)
+        with self._lock:
+            self._inc("hotmart_not_modified_total", endpoint)
+            self._inc("hotmart_bytes_saved_total", endpoint, bytes_saved)
+            self._inc("hotmart_validation_saved_seconds_total", endpoint, validation_saved)
+
+    def on_rate_limit_wait(self, request: RequestInfo, *, priority: str, delay: float) -> None:
+        with self._lock:
+            self._observe("hotmart_rate_limit_wait_seconds",
+                          (("api_domain", request.api_domain), ("priority", priority)), delay)
+
+    def on_response(
+        self, request: RequestInfo, *, status_code: int, duration: float, bytes_sent: int, bytes_received: int
+    ) -> None:
+        endpoint = self._endpoint(request)
+        with self._lock:
+            self._inc("hotmart_requests_total", (*endpoint, ("status", str(status_code))))
+            self._observe("hotmart_request_duration_seconds", endpoint, duration)
+            self._inc("hotmart_request_bytes_total", endpoint, bytes_sent)
+            self._inc("hotmart_response_bytes_total", endpoint, bytes_received)
+
+    def on_retry(self, request: RequestInfo, *, attempt: int, delay: float, status_code: int) -> None:
+        with self._lock:
+            self._inc("hotmart_retries_total", self._endpoint(request))
+
+    def on_retry_budget_exhausted(self, request: RequestInfo) -> None:
+        with self._lock:
+            self._inc("hotmart_retry_budget_exhausted_total", self._endpoint(request))
+
+    def on_validation(self, request: RequestInfo, *, model: str, mode: str, duration: float) -> None:
+        with self._lock:
+            self._observe("hotmart_validation_duration_seconds", (*self._endpoint(request), ("mode", mode)), duration)
+
+    def on_request_end(self, request: RequestInfo, *, duration: float, error: BaseException | None) -> None:
+        if error is None:
+            return
+        with self._lock:
+            self._inc("hotmart_request_errors_total", (*self._endpoint(request), ("error", type(error).__name__)))
+
+    def on_token_refresh(self, *, duration: float, error: BaseException | None) -> None:
+        with self._lock:
+            self._observe("hotmart_token_refresh_duration_seconds", (), duration)
+            if error is not None:
+                self._inc("hotmart_token_refresh_errors_total", ())
+
+    def on_circuit_state(self, *, api_domain: str, state: str) -> None:
+        labels = (("api_domain", api_domain),)
+        with self._lock:
+            self._counters.setdefault("hotmart_circuit_state", {})[labels] = _CIRCUIT_STATES[state]
+            self._inc("hotmart_circuit_transitions_total", (*labels, ("state", state)))
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Current values as plain data: metric name -> [{"labels": {...}, "value" | "count"/"sum"/"buckets"}].
+
+        Valores atuais como dados simples, por nome de métrica.
+        """
+        with self._lock:
+            result: dict[str, list[dict[str, Any]]] = {}
+            for name, counters in self._counters.items():
+                result[name] = [{"labels": dict(labels), "value": value} for labels, value in counters.items()]
+            for name, histograms in self._histograms.items():
+                result[name] = [{"labels": dict(labels), **h.snapshot()} for labels, h in histograms.items()]
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format (version 0.0.4).
+
+        Renderiza as séries no formato de exposição de texto do Prometheus.
+        """
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        for name, (kind, help_text) in _METRICS.items():
+            series = snapshot.get(name)
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for entry in sorted(series, key=lambda e: sorted(e["labels"].items())):
+                labels = entry["labels"]
+                if kind != "histogram":
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(entry['value'])}")
+                    continue
+                for bound, count in entry["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': repr(bound)})} {count}")
+                lines.append(f"{name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {entry['count']}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(entry['sum'])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {entry['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class OpenTelemetryHooks(Hooks):
+    """Emits one CLIENT span per API call (covering rate-limit waits and retries) and one span
+    per token refresh, through the OpenTelemetry API. Requires `hotmart-python[otel]`.
+
+    Individual HTTP attempts, retries, waits and validation are recorded as span events.
+
+    Emite um span CLIENT por chamada à API e um por refresh de token via OpenTelemetry.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        self._trace = _import_opentelemetry()
+        self._tracer = tracer if tracer is not None else self._trace.get_tracer("hotmart")
+        self._spans: dict[str, Any] = {}
+
+    def on_request(self, request: RequestInfo) -> None:
+        self._spans[request.request_id] = self._tracer.start_span(
+            f"{request.method} {route(request.path)}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": request.method,
+                "url.path": request.path,
+                "hotmart.api_domain": request.api_domain,
+                "hotmart.request_id": request.request_id,
+            },
+        )
+
+    def _event(self, request: RequestInfo, name: str, attributes: dict[str, Any]) -> Any:
+        span = self._spans.get(request.request_id)
+        if span is not None:
+            span.add_event(name, attributes)
+        return span
+
+    def on_cache(self, request: RequestInfo, *, hit: bool) -> None:
+        self._event(request, "cache", {"hotmart.cache_hit": hit})
+
+    def on_not_modified(self, request: RequestInfo, *, bytes_saved: int, validation_saved: float) -> None:
+        self._event(request, "not_modified", {"hotmart.bytes_saved": bytes_saved,
+                                              "hotmart.validation_saved_s": validation_saved})
+
+    def on_rate_limit_wait(self, request: RequestInfo, *, priority: str, delay: float) -> None:
+        self._event(request, "rate_limit_wait", {"hotmart.priority": priority, "hotmart.delay_s": delay})
+
+    def on_response(
+        self, request: RequestInfo, *, status_code: int, duration: float, bytes_sent: int, bytes_received: int
+    ) -> None:
+        span = self._event(request, "response", {
+            "http.response.status_code": status_code,
+            "hotmart.duration_s": duration,
+            "http.response.body.size": bytes_received,
+        })
+        if span is not None:
+            span.set_attribute("http.response.status_code", status_code)  # the last attempt wins
+
+    def on_retry(self, request: RequestInfo, *, attempt: int, delay: float, status_code: int) -> None:
+        self._event(request, "retry", {"hotmart.attempt": attempt, "hotmart.delay_s": delay,
+                                       "http.response.status_code": status_code})
+
+    def on_retry_budget_exhausted(self, request: RequestInfo) -> None:
+        self._event(request, "retry_budget_exhausted", {})
+
+    def on_validation(self, request: RequestInfo, *, model: str, mode: str, duration: float) -> None:
+        self._event(request, "validation", {"hotmart.model": model, "hotmart.response_mode": mode,
+                                            "hotmart.duration_s": duration})
+
+    def on_request_end(self, request: RequestInfo, *, duration: float, error: BaseException | None) -> None:
+        span = self._spans.pop(request.request_id, None)
+        if span is None:
+            return
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, type(error).__name__))
+        span.end()
+
+    def on_token_refresh(self, *, duration: float, error: BaseException | None) -> None:
+        end = time.time_ns()
+        span = self._tracer.start_span("hotmart token refresh", kind=self._trace.SpanKind.CLIENT,
+                                       start_time=end - int(duration * 1e9))
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, type(error).__name__))
+        span.end(end_time=end)
+
+
+def _import_opentelemetry() -> Any:
+    try:
+        from opentelemetry import trace
+    except ImportError as exc:
+        raise ImportError(
+            'OpenTelemetryHooks requires opentelemetry-api: pip install "hotmart-python[otel]"'
+        ) from exc
+    return trace
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Sequence[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Module `__getattr__` and `__dir__` (PEP 562) that import each export on first access.
+
+    `exports` maps a submodule, relative to `package`, to the names it provides. A resolved
+    name is stored on the package, so later lookups are plain attribute reads.
+
+    `__getattr__` e `__dir__` de módulo que importam cada export apenas no primeiro acesso.
+    """
+    locations = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = locations.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *locations})
+
+    return __getattr__, __dir__
@@ -38,11 +38,17 @@ class HotmartLogger:
             request_id, attempt, max_retries, delay, status_code,
         )
 
+    def retry_budget_exhausted(self, *, request_id: str) -> None:
+        self._log.warning("[%s] retry budget exhausted, not retrying", request_id)
+
     def auth_refresh(self, *, cached: bool) -> None:
         self._log.debug("auth: %s", "from cache" if cached else "refreshed")
 
     def rate_limit(self, *, remaining: int, reset_at: float) -> None:
         self._log.warning("rate limit: remaining=%d reset_in=%.0fs", remaining, reset_at)
 
+    def circuit_state(self, *, api_domain: str, state: str) -> None:
+        self._log.warning("circuit breaker: %s api is now %s", api_domain, state)
+
     def error(self, *, status_code: int, error_type: str, request_id: str, message: str) -> None:
         self._log.error("[%s] %s (%s): %s", request_id, error_type, status_code, message)
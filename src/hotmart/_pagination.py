@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Generator, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any, Generic, TypeVar
+
+from ._concurrency import amerge_iterators, merge_iterators
+from .models.pagination import PaginatedResponse
+
+T = TypeVar("T")
+
+
+def _page_items(page: PaginatedResponse[T]) -> list[T]:
+    if isinstance(page, dict):  # response_mode="raw"
+        return page.get("items") or []
+    return page.items
+
+
+def _next_page_token(page: PaginatedResponse[Any]) -> str | None:
+    if isinstance(page, dict):  # response_mode="raw"
+        return (page.get("page_info") or {}).get("next_page_token")
+    if not page.page_info:
+        return None
+    return page.page_info.next_page_token
+
+
+def _method_name(fetch: Callable[..., Any]) -> str:
+    # "AsyncSales.history" and "Sales.history" share cursors.
+    return fetch.__qualname__.removeprefix("Async")
+
+
+@dataclass(frozen=True)
+class PaginationCursor:
+    """Serializable position inside an autopagination run.
+
+    `page_token` is the token that fetched the page being consumed (None for the first page)
+    and `offset` is how many items of that page were already yielded. Save it after processing
+    each item (or batch) and pass it back as `resume_from=` to continue exactly where you left
+    off — the page is fetched again and the first `offset` items are skipped.
+
+    Posição serializável dentro de uma autopaginação, para retomar com `resume_from=`.
+    """
+
+    method: str
+    args: tuple[Any, ...] = ()
+    filters: dict[str, Any] = field(default_factory=dict)
+    page_token: str | None = None
+    offset: int = 0
+    exhausted: bool = False
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> PaginationCursor:
+        raw = json.loads(data)
+        return cls(**{**raw, "args": tuple(raw.get("args", ()))})
+
+
+class _BasePager:
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        prefetch: int,
+        resume_from: PaginationCursor | None,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        method = _method_name(fetch)
+        if resume_from is not None:
+            if resume_from.method != method:
+                raise ValueError(f"cursor belongs to {resume_from.method}, not {method}")
+            if (args or kwargs) and (tuple(args) != tuple(resume_from.args) or kwargs != resume_from.filters):
+                raise ValueError("filters passed together with resume_from do not match the cursor")
+            args, kwargs = tuple(resume_from.args), dict(resume_from.filters)
+        self._fetch = fetch
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+        self._prefetch = prefetch
+        self._page_token = resume_from.page_token if resume_from else None
+        self._offset = resume_from.offset if resume_from else 0
+        self._exhausted = resume_from.exhausted if resume_from else False
+
+    @property
+    def cursor(self) -> PaginationCursor:
+        """Current position — serialize with `.to_json()` and resume with `resume_from=`."""
+        return PaginationCursor(
+            method=self._method,
+            args=self._args,
+            filters=self._kwargs,
+            page_token=self._page_token,
+            offset=self._offset,
+            exhausted=self._exhausted,
+        )
+
+
+class AutoPager(_BasePager, Generic[T]):
+    """Iterator returned by every `*_autopaginate` method.
+
+    Yields items across all pages and exposes `.cursor` for resuming interrupted runs.
+
+    Iterador retornado pelos métodos `*_autopaginate`; expõe `.cursor` para retomada.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., PaginatedResponse[T]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        prefetch: int = 0,
+        resume_from: PaginationCursor | None = None,
+    ) -> None:
+        super().__init__(fetch, args, kwargs, prefetch=prefetch, resume_from=resume_from)
+        self._iterator = self._iterate()
+
+    def __iter__(self) -> AutoPager[T]:
+        return self
+
+    def __next__(self) -> T:
+        return next(self._iterator)
+
+    def close(self) -> None:
+        self._iterator.close()
+
+    def _iter_pages(self, page_token: str | None) -> Iterator[tuple[str | None, PaginatedResponse[T]]]:
+        while True:
+            page = self._fetch(*self._args, page_token=page_token, **self._kwargs)
+            yield page_token, page
+            page_token = _next_page_token(page)
+            if not page_token:
+                break
+
+    def _iterate(self) -> Generator[T, None, None]:
+        if self._exhausted:
+            return
+        pages = self._iter_pages(self._page_token)
+        if self._prefetch:
+            start = pages
+            pages = (entry for _, entry in merge_iterators([lambda: start], max_buffer=self._prefetch))
+        skip = self._offset
+        for page_token, page in pages:
+            self._page_token = page_token
+            self._offset = skip
+            for item in _page_items(page)[skip:]:
+                self._offset += 1
+                yield item
+            skip = 0
+        self._exhausted = True
+
+
+class AsyncAutoPager(_BasePager, Generic[T]):
+    """Async iterator returned by every `*_autopaginate` method of the async resources.
+
+    Iterador async retornado pelos métodos `*_autopaginate` das resources async.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Awaitable[PaginatedResponse[T]]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        prefetch: int = 0,
+        resume_from: PaginationCursor | None = None,
+    ) -> None:
+        super().__init__(fetch, args, kwargs, prefetch=prefetch, resume_from=resume_from)
+        self._iterator = self._iterate()
+
+    def __aiter__(self) -> AsyncAutoPager[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._iterator.__anext__()
+
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
+    async def _iter_pages(self, page_token: str | None) -> AsyncIterator[tuple[str | None, PaginatedResponse[T]]]:
+        while True:
+            page = await self._fetch(*self._args, page_token=page_token, **self._kwargs)
+            yield page_token, page
+            page_token = _next_page_token(page)
+            if not page_token:
+                break
+
+    async def _iterate(self) -> AsyncGenerator[T, None]:
+        if self._exhausted:
+            return
+        skip = self._offset
+        async for page_token, page in self._pages():
+            self._page_token = page_token
+            self._offset = skip
+            for item in _page_items(page)[skip:]:
+                self._offset += 1
+                yield item
+            skip = 0
+        self._exhausted = True
+
+    async def _pages(self) -> AsyncIterator[tuple[str | None, PaginatedResponse[T]]]:
+        if not self._prefetch:
+            async for entry in self._iter_pages(self._page_token):
+                yield entry
+            return
+        merged = amerge_iterators([lambda: self._iter_pages(self._page_token)], max_buffer=self._prefetch)
+        async for _, entry in merged:
+            yield entry
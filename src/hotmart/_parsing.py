@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import types
+from collections.abc import Callable
+from typing import Any, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional: pip install "hotmart-python[fast]"
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+JSONDecoder = Callable[[bytes], Any]
+
+ResponseMode = Literal["validate", "construct", "raw"]
+"""How response bodies are turned into return values.
+
+- "validate" (default): full pydantic validation (`model_validate_json` straight on the bytes).
+- "construct": trusted mode — models are built recursively with `model_construct`, skipping
+  validation and type coercion. Attribute access works as usual, values are kept as decoded.
+- "raw": no model construction at all — plain dicts/lists straight from the JSON decoder.
+
+Como os corpos de resposta são convertidos: validação completa, construção sem validação ou dicts.
+"""
+
+RESPONSE_MODES: frozenset[str] = frozenset({"validate", "construct", "raw"})
+
+
+def load_json(content: bytes) -> Any:
+    """Decode a response body with orjson when installed, falling back to the stdlib.
+
+    Decodifica o corpo da resposta com orjson quando instalado, senão com a stdlib.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def parse_json(cast_to: type[T], content: bytes, mode: ResponseMode, decoder: JSONDecoder | None = None) -> T:
+    """Parse a raw response body into `cast_to` according to `mode`.
+
+    In "validate" mode without a custom decoder the bytes go straight to pydantic's
+    `model_validate_json`, so decoding and validation happen in a single pass in Rust and no
+    intermediate dict tree is allocated.
+
+    Converte o corpo bruto da resposta em `cast_to` conforme `mode`.
+    """
+    if mode == "validate" and decoder is None:
+        return cast_to.model_validate_json(content)  # type: ignore[attr-defined,no-any-return]
+    return parse(cast_to, (decoder or load_json)(content), mode)
+
+
+def parse(cast_to: type[T], data: Any, mode: ResponseMode) -> T:
+    if mode == "raw":
+        return data  # type: ignore[no-any-return]
+    if mode == "construct":
+        return construct(cast_to, data)
+    return cast_to.model_validate(data)  # type: ignore[attr-defined,no-any-return]
+
+
+def construct(cast_to: type[T], data: Any) -> T:
+    """Build `cast_to` from decoded JSON without validation, recursing into nested models.
+
+    Constrói `cast_to` a partir do JSON decodificado sem validação, recursivamente.
+    """
+    if not isinstance(data, dict):
+        return data  # type: ignore[no-any-return]
+    fields = cast_to.model_fields  # type: ignore[attr-defined]
+    values: dict[str, Any] = {}
+    for key, value in data.items():
+        field = fields.get(key)
+        values[key] = value if field is None else _construct_value(field.annotation, value)
+    return cast_to.model_construct(**values)  # type: ignore[attr-defined,no-any-return]
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        for arg in get_args(annotation):
+            if _accepts(arg, value):
+                return _construct_value(arg, value)
+        return value
+    if origin is list:
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_type, item) for item in value] if isinstance(value, list) else value
+    if isinstance(value, dict) and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return construct(annotation, value)
+    return value
+
+
+def _accepts(annotation: Any, value: Any) -> bool:
+    if isinstance(value, dict):
+        return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+    if isinstance(value, list):
+        return get_origin(annotation) is list
+    return False
@@ -1,18 +1,61 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import os
 import threading
 import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from dataclasses import asdict, dataclass
+from typing import Literal, Protocol, runtime_checkable
 
 import httpx
 
+from ._file_lock import default_directory, lock_file, private_directory, unlock_file
+
+DEFAULT_LIMIT = 500  # Hotmart: 500 calls per minute
+DEFAULT_WINDOW = 60.0
+
+Priority = Literal["interactive", "batch"]
+"""Request lane. "batch" traffic backs off first when the rate budget runs low.
+
+Faixa da requisição; tráfego "batch" recua primeiro quando o orçamento de rate limit acaba.
+"""
+
+PRIORITIES: frozenset[str] = frozenset({"interactive", "batch"})
+
+
+
+@runtime_checkable
+class RateLimitPolicy(Protocol):
+    """Decides when each request may be sent, from the RateLimit-* headers of past responses.
+
+    `reserve` is called right before a request and returns how many seconds the caller must
+    wait; the client does the sleeping (time.sleep or asyncio.sleep), so one policy object
+    serves both the sync and the async client. Implementations must be thread-safe.
+
+    Decide quando cada requisição pode ser enviada a partir dos headers RateLimit-*.
+    """
+
+    def reserve(self, api_domain: str, priority: Priority = "interactive") -> float: ...
+
+    def update(self, headers: httpx.Headers, api_domain: str = "payments") -> None: ...
+
 
 class RateLimitTracker:
+    """Stop-at-zero policy: send at full speed until RateLimit-Remaining hits 0, then wait for reset.
+
+    Política "para no zero": envia em velocidade máxima até RateLimit-Remaining chegar a 0.
+    """
+
     def __init__(self) -> None:
         self._remaining: int = 500
         self._reset_at: float = 0.0
         self._lock = threading.Lock()
 
-    def update(self, headers: httpx.Headers) -> None:
+    def update(self, headers: httpx.Headers, api_domain: str = "payments") -> None:
         remaining = headers.get("RateLimit-Remaining")
         reset = headers.get("RateLimit-Reset")
 
@@ -22,11 +65,202 @@ class RateLimitTracker:
             if reset is not None:
                 self._reset_at = time.time() + float(reset)
 
+    def reserve(self, api_domain: str = "payments", priority: Priority = "interactive") -> float:
+        return self._sleep_time()
+
     def wait_if_needed(self) -> None:
+        sleep_for = self._sleep_time()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+
+    def _sleep_time(self) -> float:
+        # Each caller reserves one slot up front so concurrent requests (sharded or parallel
+        # pagination) cannot all slip past the last remaining call before a response updates
+        # the counter. Cada chamada reserva um slot antes de disparar a requisição.
         with self._lock:
             if self._remaining > 0:
-                return
-            sleep_for = max(0.0, self._reset_at - time.time())
+                self._remaining -= 1
+                return 0.0
+            return max(0.0, self._reset_at - time.time())
 
-        if sleep_for > 0:
-            time.sleep(sleep_for)
+
+@dataclass
+class RateLimitBucket:
+    """Pacing state of one (client_id, API domain) pair, as stored by a RateLimitBackend."""
+
+    remaining: int | None = None  # None until a response carried RateLimit-Remaining
+    limit: int = DEFAULT_LIMIT
+    reset_at: float = 0.0
+    next_at: float = 0.0  # theoretical time of the next evenly spaced slot, shared by both lanes
+    batch_next_at: float = 0.0  # earliest batch slot once the batch share of a window is spent
+
+
+@runtime_checkable
+class RateLimitBackend(Protocol):
+    """Where PacingRateLimiter keeps its buckets.
+
+    `bucket(key)` yields the bucket for `key` with exclusive access; changes made inside the
+    `with` block must be persisted when it exits. Back it with shared storage (a file, Redis,
+    ...) to make every process using the same credentials draw from one budget.
+
+    Onde o PacingRateLimiter guarda seus buckets; `bucket(key)` dá acesso exclusivo ao estado.
+    """
+
+    def bucket(self, key: str) -> AbstractContextManager[RateLimitBucket]: ...
+
+
+class MemoryRateLimitBackend:
+    """Per-process buckets (the default)."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, RateLimitBucket] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def bucket(self, key: str) -> Iterator[RateLimitBucket]:
+        with self._lock:
+            yield self._buckets.setdefault(key, RateLimitBucket())
+
+
+class FileRateLimitBackend:
+    """Buckets shared by every process on the host: one JSON file per key, guarded by a file lock.
+
+    Each reservation is a locked read-modify-write of a tiny file, so processes see each other's
+    reservations immediately and their combined traffic stays within one budget.
+
+    Buckets compartilhados entre processos do host: um arquivo JSON por chave, com lock de arquivo.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        if directory is None:
+            self._directory = default_directory()
+        else:
+            self._directory = private_directory(os.fspath(directory))
+
+    @contextlib.contextmanager
+    def bucket(self, key: str) -> Iterator[RateLimitBucket]:
+        with open(os.path.join(self._directory, f"{key}.json"), "a+", encoding="utf-8") as f:
+            lock_file(f)
+            try:
+                f.seek(0)
+                try:
+                    bucket = RateLimitBucket(**json.loads(f.read()))
+                except (ValueError, TypeError):  # new or corrupt file
+                    bucket = RateLimitBucket()
+                yield bucket
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(asdict(bucket)))
+                f.flush()
+            finally:
+                unlock_file(f)
+
+
+def rate_limit_namespace(client_id: str) -> str:
+    """Bucket key prefix shared by every client using `client_id`."""
+    return hashlib.sha256(client_id.encode()).hexdigest()[:16]
+
+
+class PacingRateLimiter:
+    """Token-bucket policy that spreads the remaining budget evenly until the window resets.
+
+    After each response the bucket knows how many calls are left (RateLimit-Remaining, minus
+    `headroom` kept free for in-flight requests and other clients) and when the window resets
+    (RateLimit-Reset); requests are then spaced `time_left / budget` apart instead of bursting
+    to zero and idling until reset. Up to `burst` requests may go back to back. Each API domain
+    (payments, club, products) gets its own bucket. Until the first RateLimit headers arrive,
+    requests are not delayed.
+
+    Both lanes take slots from one schedule, so together they never send faster than the even
+    pace. "batch" requests only spend the budget above `interactive_reserve` and are spaced over
+    that smaller budget, leaving the remaining slots to "interactive" requests; when it runs
+    low they wait for the reset while interactive requests keep going.
+
+    Buckets live in `backend` under `namespace`; with a shared backend such as
+    FileRateLimitBackend, every limiter using the same namespace draws from one budget.
+
+    Política token-bucket que distribui o orçamento restante uniformemente até o reset da janela,
+    com um bucket por domínio da API e folga (`headroom`) configurável.
+    """
+
+    def __init__(
+        self,
+        *,
+        headroom: int = 5,
+        burst: int = 1,
+        interactive_reserve: int = 50,
+        window: float = DEFAULT_WINDOW,
+        backend: RateLimitBackend | None = None,
+        namespace: str = "default",
+    ) -> None:
+        if headroom < 0:
+            raise ValueError("headroom must be >= 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        if interactive_reserve < 0:
+            raise ValueError("interactive_reserve must be >= 0")
+        self._headroom = headroom
+        self._burst = burst
+        self._interactive_reserve = interactive_reserve
+        self._window = window
+        self._backend = backend or MemoryRateLimitBackend()
+        self._namespace = namespace
+
+    @property
+    def blocking(self) -> bool:
+        """Whether reserve/update do I/O (file locks, network), so async clients run them in a thread."""
+        return not isinstance(self._backend, MemoryRateLimitBackend)
+
+    def reserve(self, api_domain: str = "payments", priority: Priority = "interactive") -> float:
+        with self._backend.bucket(f"{self._namespace}.{api_domain}") as bucket:
+            return self._reserve(bucket, time.time(), priority)
+
+    def update(self, headers: httpx.Headers, api_domain: str = "payments") -> None:
+        remaining = headers.get("RateLimit-Remaining")
+        reset = headers.get("RateLimit-Reset")
+        limit = headers.get("RateLimit-Limit")
+        with self._backend.bucket(f"{self._namespace}.{api_domain}") as bucket:
+            now = time.time()
+            reset_at = now + float(reset) if reset is not None else bucket.reset_at
+            if limit is not None:
+                bucket.limit = int(limit)
+            if remaining is not None:
+                value = int(remaining)
+                if bucket.remaining is not None and abs(reset_at - bucket.reset_at) < 1.5:
+                    # Same window: responses may arrive out of order and other processes may
+                    # already have reserved more, so never raise the count within a window.
+                    value = min(value, bucket.remaining)
+                bucket.remaining = value
+                bucket.limit = max(bucket.limit, value)
+            bucket.reset_at = reset_at
+
+    def _reserve(self, bucket: RateLimitBucket, now: float, priority: Priority) -> float:
+        if bucket.remaining is None:
+            return 0.0
+        if now >= bucket.reset_at:
+            # The window rolled over and no response has told us about the new one yet.
+            bucket.remaining = bucket.limit
+            bucket.reset_at = now + self._window
+        # Both lanes share one schedule, so their combined rate stays at the even pace. Batch
+        # calls leave `interactive_reserve` calls untouched and are spaced over the budget above
+        # it, which leaves the slots in between to interactive calls; they also run dry first.
+        batch = priority == "batch"
+        reserve = self._headroom + (self._interactive_reserve if batch else 0)
+        start = max(now, bucket.next_at, bucket.batch_next_at if batch else 0.0)
+        budget = bucket.remaining - reserve
+        if start >= bucket.reset_at or budget <= 0:
+            # Nothing left for this lane in the current window: wait for the reset, then pace
+            # over the next one. A starved batch lane queues on its own, so interactive calls
+            # that still have budget do not wait behind it.
+            send_at = max(start, bucket.reset_at)
+            next_at = send_at + self._window / max(bucket.limit - reserve, 1)
+            if batch:
+                bucket.batch_next_at = next_at
+            else:
+                bucket.next_at = next_at
+            return send_at - now
+        interval = (bucket.reset_at - start) / budget
+        send_at = max(now, start - (self._burst - 1) * interval)
+        bucket.next_at = max(bucket.next_at, send_at) + interval
+        bucket.remaining -= 1
+        return send_at - now
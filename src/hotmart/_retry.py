@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import email.utils
 import random
+import threading
+import time
 
 import httpx
 
@@ -13,11 +16,81 @@ def is_retryable(status_code: int) -> bool:
     return status_code in RETRYABLE_STATUS_CODES
 
 
+def _retry_after(response: httpx.Response) -> float | None:
+    # Retry-After is either delta-seconds or an HTTP-date (RFC 9110 §10.2.3).
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
 def get_retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
-    if response is not None and response.status_code == 429:
-        reset = response.headers.get("RateLimit-Reset")
-        if reset:
-            return min(float(reset), _MAX_DELAY)
+    if response is not None:
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, _MAX_DELAY)
+        if response.status_code == 429:
+            reset = response.headers.get("RateLimit-Reset")
+            if reset:
+                return min(float(reset), _MAX_DELAY)
 
     jitter = random.uniform(0.0, 0.5)
-    return min(_BASE_DELAY * (2 ** attempt) + jitter, _MAX_DELAY)
+    return min(_BASE_DELAY * 2.0**attempt + jitter, _MAX_DELAY)
+
+
+class RetryBudget:
+    """Client-wide cap on retries, so an outage does not multiply load by `max_retries + 1`.
+
+    Token bucket shared by every thread and task using the client: each request deposits
+    `ratio` tokens and each retry spends one, so retries stay below roughly `ratio` of recent
+    traffic. `min_per_second` tokens trickle in regardless, so a quiet client can still retry
+    the odd failure; the bucket holds at most `max_tokens`. When it is empty, the failed
+    response is returned (or the transport error raised) without retrying.
+
+    Orçamento de retentativas compartilhado pelo cliente: retentativas ficam limitadas a cerca
+    de `ratio` das requisições recentes.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 10.0) -> None:
+        if ratio < 0 or min_per_second < 0 or max_tokens < 1:
+            raise ValueError("ratio and min_per_second must be >= 0 and max_tokens >= 1")
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, amount: float) -> None:
+        now = time.monotonic()
+        amount += (now - self._updated) * self.min_per_second
+        self._tokens = min(self._tokens + amount, self.max_tokens)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a new (first-attempt) request."""
+        with self._lock:
+            self._refill(self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False when it is exhausted."""
+        with self._lock:
+            self._refill(0.0)
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(0.0)
+            return self._tokens
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import inspect
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from ._base_client import BaseSyncClient
+from .models._enums import PurchaseStatus
+from .resources.sales import Sales
+from .resources.subscriptions import Subscriptions
+
+DEFAULT_OVERLAP_MS = 3 * 24 * 60 * 60 * 1000  # re-read the last 3 days for late status changes
+# Without a start date the API only returns the last 30 days; 2011-01-01 predates every Hotmart sale.
+DEFAULT_INITIAL_START_DATE = 1293840000000
+# Sales endpoints only return APPROVED/COMPLETE unless transaction_status is sent, and it takes a
+# single value, so refunds, chargebacks and cancellations need one pass per status.
+_ALL_PURCHASE_STATUSES = tuple(status.value for status in PurchaseStatus)
+_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class _ResourceSpec:
+    table: str
+    key: tuple[str, ...]
+    fetch: Callable[[BaseSyncClient], Callable[..., Iterator[Any]]]
+    windows: tuple[tuple[str, str], ...]
+    filters: frozenset[str]
+    statuses: tuple[str | None, ...] = (None,)
+
+
+def _filters(method: Callable[..., Any]) -> frozenset[str]:
+    # The query filters a listing accepts, i.e. its keyword arguments minus paging.
+    return frozenset(inspect.signature(method).parameters) - {"self", "kwargs", "max_results", "page_token"}
+
+
+_RESOURCES: dict[str, _ResourceSpec] = {
+    "sales": _ResourceSpec(
+        table="sales",
+        key=("purchase", "transaction"),
+        fetch=lambda client: Sales(client).history_autopaginate,
+        windows=(("start_date", "end_date"),),
+        filters=_filters(Sales.history),
+        statuses=_ALL_PURCHASE_STATUSES,
+    ),
+    "commissions": _ResourceSpec(
+        table="commissions",
+        key=("transaction",),
+        fetch=lambda client: Sales(client).commissions_autopaginate,
+        windows=(("start_date", "end_date"),),
+        filters=_filters(Sales.commissions),
+        statuses=_ALL_PURCHASE_STATUSES,
+    ),
+    "participants": _ResourceSpec(
+        table="participants",
+        key=("transaction",),
+        fetch=lambda client: Sales(client).participants_autopaginate,
+        windows=(("start_date", "end_date"),),
+        filters=_filters(Sales.participants),
+        statuses=_ALL_PURCHASE_STATUSES,
+    ),
+    # New subscribers come in through accession_date; cancellations of old subscriptions only
+    # show up through cancelation_date, so both windows are pulled on every run.
+    "subscriptions": _ResourceSpec(
+        table="subscriptions",
+        key=("subscriber_code",),
+        fetch=lambda client: Subscriptions(client).list_autopaginate,
+        windows=(("accession_date", "end_accession_date"), ("cancelation_date", "end_cancelation_date")),
+        filters=_filters(Subscriptions.list),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    resource: str
+    rows: int
+    start_date: int
+    end_date: int
+
+
+def _key(item: dict[str, Any], path: tuple[str, ...]) -> str | None:
+    value: Any = item
+    for part in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return None if value is None else str(value)
+
+
+class SQLiteSync:
+    """Incrementally mirror sales, commissions, participants and subscriptions into SQLite.
+
+    Each resource gets its own table (`key TEXT PRIMARY KEY, data TEXT, synced_at INTEGER`),
+    upserted on transaction / subscriber_code, with the full API item stored as JSON — query it
+    with SQLite's `json_extract`. A high-water mark per resource records how far the last
+    successful run got; the next run only fetches `[high_water_mark - overlap_ms, now]`, so late
+    status changes inside the overlap are picked up without re-downloading everything. The first
+    run starts at `initial_start_date` (2011-01-01 by default, i.e. the whole history).
+
+    Sales, commissions and participants are pulled once per purchase status, because the API
+    only returns APPROVED/COMPLETE sales otherwise; pass `transaction_status=` to sync a single one.
+
+    Pages are fetched with response_mode="raw", so no pydantic models are built, and with
+    priority="batch", so interactive calls on the same credentials go first.
+
+    Espelha incrementalmente vendas, comissões, participantes e assinaturas em SQLite, com
+    checkpoint por recurso e janela de sobreposição para mudanças tardias de status.
+
+    Usage:
+        with SQLiteSync(client, "hotmart.db") as store:
+            store.sync_all()
+    """
+
+    def __init__(
+        self,
+        client: BaseSyncClient,
+        path: str | os.PathLike[str],
+        *,
+        overlap_ms: int = DEFAULT_OVERLAP_MS,
+        initial_start_date: int = DEFAULT_INITIAL_START_DATE,
+    ) -> None:
+        if overlap_ms < 0:
+            raise ValueError("overlap_ms must be >= 0")
+        self._client = client.with_options(response_mode="raw", priority="batch")
+        self._overlap_ms = overlap_ms
+        self._initial_start_date = initial_start_date
+        self._db = sqlite3.connect(os.fspath(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints "
+            "(resource TEXT PRIMARY KEY, high_water_mark INTEGER NOT NULL, updated_at INTEGER NOT NULL)"
+        )
+        for spec in _RESOURCES.values():
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {spec.table} "
+                "(key TEXT PRIMARY KEY, data TEXT NOT NULL, synced_at INTEGER NOT NULL)"
+            )
+        self._db.commit()
+
+    def __enter__(self) -> SQLiteSync:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def checkpoint(self, resource: str) -> int | None:
+        """Return the high-water mark (ms) of the last successful sync of `resource`."""
+        self._spec(resource)
+        row = self._db.execute("SELECT high_water_mark FROM checkpoints WHERE resource = ?", (resource,)).fetchone()
+        return None if row is None else int(row[0])
+
+    def reset(self, resource: str) -> None:
+        """Forget the checkpoint of `resource`, so the next sync starts from scratch."""
+        self._spec(resource)
+        self._db.execute("DELETE FROM checkpoints WHERE resource = ?", (resource,))
+        self._db.commit()
+
+    def sync(self, resource: str, **filters: Any) -> SyncResult:
+        """Fetch everything changed since the last checkpoint of `resource` and upsert it.
+
+        The checkpoint only advances after every page was stored, so a crashed run is simply
+        repeated — upserts make that idempotent.
+
+        Busca tudo desde o último checkpoint de `resource` e faz upsert no banco.
+        """
+        spec = self._spec(resource)
+        end_date = int(time.time() * 1000)
+        checkpoint = self.checkpoint(resource)
+        start_date = self._initial_start_date if checkpoint is None else max(0, checkpoint - self._overlap_ms)
+
+        fetch = spec.fetch(self._client)
+        statuses = (filters.pop("transaction_status"),) if "transaction_status" in filters else spec.statuses
+        rows = 0
+        for start_param, end_param in spec.windows:
+            for status in statuses:
+                window: dict[str, Any] = {start_param: start_date, end_param: end_date}
+                if status is not None:
+                    window["transaction_status"] = status
+                rows += self._store(spec, fetch(**window, **filters))
+
+        self._db.execute(
+            "INSERT INTO checkpoints (resource, high_water_mark, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(resource) DO UPDATE SET high_water_mark = excluded.high_water_mark, "
+            "updated_at = excluded.updated_at",
+            (resource, end_date, int(time.time() * 1000)),
+        )
+        self._db.commit()
+        return SyncResult(resource=resource, rows=rows, start_date=start_date, end_date=end_date)
+
+    def sync_sales(self, **filters: Any) -> SyncResult:
+        return self.sync("sales", **filters)
+
+    def sync_commissions(self, **filters: Any) -> SyncResult:
+        return self.sync("commissions", **filters)
+
+    def sync_participants(self, **filters: Any) -> SyncResult:
+        return self.sync("participants", **filters)
+
+    def sync_subscriptions(self, **filters: Any) -> SyncResult:
+        return self.sync("subscriptions", **filters)
+
+    def sync_all(self, **filters: Any) -> dict[str, SyncResult]:
+        """Sync every resource, passing each one only the `filters` its endpoint accepts.
+
+        Sincroniza todos os recursos, repassando a cada um só os filtros que ele aceita.
+        """
+        unknown = set(filters).difference(*(spec.filters for spec in _RESOURCES.values()))
+        if unknown:
+            raise ValueError(f"no resource accepts the filters {sorted(unknown)}")
+        return {
+            resource: self.sync(resource, **{name: value for name, value in filters.items() if name in spec.filters})
+            for resource, spec in _RESOURCES.items()
+        }
+
+    def _spec(self, resource: str) -> _ResourceSpec:
+        try:
+            return _RESOURCES[resource]
+        except KeyError:
+            raise ValueError(f"unknown resource {resource!r}, expected one of {sorted(_RESOURCES)}") from None
+
+    def _store(self, spec: _ResourceSpec, items: Iterator[dict[str, Any]]) -> int:
+        sql = (
+            f"INSERT INTO {spec.table} (key, data, synced_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET data = excluded.data, synced_at = excluded.synced_at"
+        )
+        now = int(time.time() * 1000)
+        stored = 0
+        batch: list[tuple[str, str, int]] = []
+        for item in items:
+            key = _key(item, spec.key)
+            if key is None:
+                continue
+            batch.append((key, json.dumps(item, ensure_ascii=False), now))
+            if len(batch) >= _BATCH_SIZE:
+                self._db.executemany(sql, batch)
+                self._db.commit()
+                stored += len(batch)
+                batch.clear()
+        if batch:
+            self._db.executemany(sql, batch)
+            self._db.commit()
+            stored += len(batch)
+        return stored
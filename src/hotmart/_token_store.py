@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+from ._file_lock import default_directory, lock_file, private_directory, unlock_file
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    access_token: str
+    expires_at: float  # unix timestamp (seconds), comparable across processes
+
+
+@runtime_checkable
+class TokenStore(Protocol):
+    """Storage shared by every process that uses the same credentials.
+
+    `lock(key)` must be exclusive across processes: the token managers hold it while asking
+    Hotmart for a new token, so only one process refreshes and the others read its result.
+    Implement these four methods to back the cache with Redis, memcached, a database, ...
+
+    Armazenamento de token compartilhado entre processos; `lock(key)` deve ser exclusivo.
+    """
+
+    def get(self, key: str) -> CachedToken | None: ...
+
+    def set(self, key: str, token: CachedToken) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def lock(self, key: str) -> AbstractContextManager[Any]: ...
+
+
+def token_key(client_id: str, client_secret: str) -> str:
+    """Store key for a credential pair — the secret is hashed, never written anywhere."""
+    return hashlib.sha256(f"{client_id}:{client_secret}".encode()).hexdigest()[:32]
+
+
+class FileTokenStore:
+    """TokenStore backed by one JSON file per credential pair, guarded by an OS file lock.
+
+    Works for every process of the same user on the host (gunicorn workers, cron jobs, ...). Files are
+    created with 0600 permissions and replaced atomically, so readers never see partial writes.
+
+    Armazena o token em arquivo JSON por credencial, protegido por lock de arquivo do SO.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        if directory is None:
+            self._directory = default_directory()
+        else:
+            self._directory = private_directory(os.fspath(directory))
+        self._thread_lock = threading.Lock()  # flock does not exclude threads sharing a process
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self._directory, f"{key}{suffix}")
+
+    def get(self, key: str) -> CachedToken | None:
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                data = json.load(f)
+            return CachedToken(access_token=data["access_token"], expires_at=float(data["expires_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, token: CachedToken) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=f".{key}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"access_token": token.access_token, "expires_at": token.expires_at}, f)
+            os.replace(tmp, self._path(key, ".json"))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def delete(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path(key, ".json"))
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._thread_lock, open(self._path(key, ".lock"), "a+b") as f:
+            os.chmod(f.name, 0o600)
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
+
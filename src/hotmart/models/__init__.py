@@ -1,32 +1,40 @@
-from ._common import PageInfo, Price
-from ._enums import (
-    CommissionSource,
-    PaymentType,
-    ProductFormat,
-    ProductStatus,
-    PurchaseStatus,
-    SubscriptionStatus,
-)
-from .club import ModuleItem, PageItem, StudentItem, StudentProgress
-from .coupons import CouponItem
-from .events import EventItem, TicketItem
-from .negotiation import NegotiationResponse
-from .pagination import PaginatedResponse
-from .products import OfferItem, PlanItem, ProductItem
-from .sales import (
-    SaleCommissionsItem,
-    SaleHistoryItem,
-    SaleParticipantsItem,
-    SalePriceDetailsItem,
-    SaleSummaryItem,
-)
-from .subscriptions import (
-    SubscriptionBulkResponse,
-    SubscriptionItem,
-    SubscriptionPurchase,
-    SubscriptionResult,
-    SubscriptionSummaryItem,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._common import PageInfo, Price
+    from ._enums import (
+        CommissionSource,
+        PaymentType,
+        ProductFormat,
+        ProductStatus,
+        PurchaseStatus,
+        SubscriptionStatus,
+    )
+    from .club import ModuleItem, PageItem, StudentItem, StudentProgress
+    from .coupons import CouponItem
+    from .events import EventItem, TicketItem
+    from .negotiation import NegotiationResponse
+    from .pagination import PaginatedResponse
+    from .products import OfferItem, PlanItem, ProductItem
+    from .sales import (
+        SaleCommissionsItem,
+        SaleHistoryItem,
+        SaleParticipantsItem,
+        SalePriceDetailsItem,
+        SaleSummaryItem,
+    )
+    from .subscriptions import (
+        SubscriptionBulkResponse,
+        SubscriptionBulkResult,
+        SubscriptionItem,
+        SubscriptionPurchase,
+        SubscriptionResult,
+        SubscriptionSummaryItem,
+    )
 
 __all__ = [
     "PaginatedResponse", "Price", "PageInfo",
@@ -35,10 +43,34 @@ __all__ = [
     "SaleHistoryItem", "SaleSummaryItem", "SaleParticipantsItem",
     "SaleCommissionsItem", "SalePriceDetailsItem",
     "SubscriptionItem", "SubscriptionSummaryItem", "SubscriptionPurchase",
-    "SubscriptionBulkResponse", "SubscriptionResult",
+    "SubscriptionBulkResponse", "SubscriptionBulkResult", "SubscriptionResult",
     "ProductItem", "OfferItem", "PlanItem",
     "CouponItem",
     "ModuleItem", "PageItem", "StudentItem", "StudentProgress",
     "EventItem", "TicketItem",
     "NegotiationResponse",
 ]
+
+# Imported on first access: building every model (and its pydantic schema) up front would
+# slow down `import hotmart` for code that only touches a few of them.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "._common": ("PageInfo", "Price"),
+    "._enums": (
+        "CommissionSource", "PaymentType", "ProductFormat", "ProductStatus", "PurchaseStatus", "SubscriptionStatus",
+    ),
+    ".club": ("ModuleItem", "PageItem", "StudentItem", "StudentProgress"),
+    ".coupons": ("CouponItem",),
+    ".events": ("EventItem", "TicketItem"),
+    ".negotiation": ("NegotiationResponse",),
+    ".pagination": ("PaginatedResponse",),
+    ".products": ("OfferItem", "PlanItem", "ProductItem"),
+    ".sales": (
+        "SaleCommissionsItem", "SaleHistoryItem", "SaleParticipantsItem", "SalePriceDetailsItem", "SaleSummaryItem",
+    ),
+    ".subscriptions": (
+        "SubscriptionBulkResponse", "SubscriptionBulkResult", "SubscriptionItem", "SubscriptionPurchase",
+        "SubscriptionResult", "SubscriptionSummaryItem",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
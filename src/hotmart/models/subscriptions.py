@@ -102,3 +102,24 @@ class SubscriptionResult(_Base):
 class SubscriptionBulkResponse(_Base):
     success_subscriptions: list[SubscriptionResult] = []
     fail_subscriptions: list[SubscriptionResult] = []
+
+
+class SubscriptionBulkResult(SubscriptionBulkResponse):
+    """Merged outcome of `cancel_bulk` / `reactivate_bulk` across every chunk.
+
+    `fail_subscriptions` also lists codes whose whole chunk raised (with the exception as
+    `error`) or that the API left out of its answer ("unreported by API"), and `errors` maps
+    every failed code to its error message.
+
+    Resultado agregado de `cancel_bulk` / `reactivate_bulk` em todos os lotes.
+    """
+
+    errors: dict[str, str] = {}
+
+    @property
+    def succeeded(self) -> list[str]:
+        return [s.subscriber_code for s in self.success_subscriptions if s.subscriber_code]
+
+    @property
+    def failed(self) -> list[str]:
+        return list(self.errors)
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any, Self, TypeVar
 
-from .._base_client import BaseSyncClient
+from pydantic import BaseModel
+
+from .._base_client import BaseAsyncClient, BaseSyncClient
+from .._export import Exporter, ExportFormat
+from .._pagination import AsyncAutoPager, AutoPager, PaginationCursor
+from ..models.pagination import PaginatedResponse
 
 T = TypeVar("T")
 
@@ -11,6 +18,51 @@ class APIResource:
     def __init__(self, client: BaseSyncClient) -> None:
         self._client = client
 
+    def _autopaginate(
+        self,
+        fetch: Callable[..., PaginatedResponse[T]],
+        *args: Any,
+        prefetch: int = 0,
+        resume_from: PaginationCursor | None = None,
+        **kwargs: Any,
+    ) -> AutoPager[T]:
+        """Iterate every item of every page returned by `fetch`, following next_page_token.
+
+        With prefetch=N a background thread keeps fetching (and validating) up to N pages ahead
+        of the consumer, so network latency overlaps with the caller's processing. The buffer is
+        bounded, so memory stays flat regardless of the total number of pages. The returned
+        AutoPager exposes `.cursor`; pass it back as `resume_from=` to continue a crashed run.
+
+        Produz todos os itens de todas as páginas. Com prefetch=N, até N páginas são buscadas em
+        segundo plano; `.cursor` + `resume_from=` permitem retomar execuções interrompidas.
+        """
+        return AutoPager(fetch, args, kwargs, prefetch=prefetch, resume_from=resume_from)
+
+    def _parse_list(self, cast_to: type[T], data: list[Any]) -> list[T]:
+        return [self._client._parse(cast_to, item) for item in data]
+
+    def with_options(self, **options: Any) -> Self:
+        """Same resource bound to `client.with_options(**options)`, e.g. priority="batch"."""
+        return type(self)(self._client.with_options(**options))
+
+    def _raw(self) -> Self:
+        """Same resource bound to a response_mode="raw" copy of the client."""
+        return self.with_options(response_mode="raw")
+
+    @staticmethod
+    def _export(
+        items: Iterator[Any],
+        path: str | os.PathLike[str],
+        *,
+        model: type[BaseModel],
+        format: ExportFormat,
+        batch_size: int,
+    ) -> int:
+        with Exporter(path, model=model, format=format, batch_size=batch_size) as out:
+            for item in items:
+                out.add(item)
+        return out.rows_written
+
     def _get(self, path: str, *, api_domain: str = "payments",
              params: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
         return self._client._get(path, api_domain=api_domain, params=params, cast_to=cast_to)
@@ -30,3 +82,67 @@ class APIResource:
     def _delete(self, path: str, *, api_domain: str = "payments",
                 cast_to: type[T] | None = None) -> T | None:
         return self._client._delete(path, api_domain=api_domain, cast_to=cast_to)
+
+
+class AsyncAPIResource:
+    def __init__(self, client: BaseAsyncClient) -> None:
+        self._client = client
+
+    def _autopaginate(
+        self,
+        fetch: Callable[..., Awaitable[PaginatedResponse[T]]],
+        *args: Any,
+        prefetch: int = 0,
+        resume_from: PaginationCursor | None = None,
+        **kwargs: Any,
+    ) -> AsyncAutoPager[T]:
+        """Async variant of APIResource._autopaginate — prefetching runs in a background task.
+
+        Variante async de APIResource._autopaginate — o prefetch roda em uma task em segundo plano.
+        """
+        return AsyncAutoPager(fetch, args, kwargs, prefetch=prefetch, resume_from=resume_from)
+
+    def _parse_list(self, cast_to: type[T], data: list[Any]) -> list[T]:
+        return [self._client._parse(cast_to, item) for item in data]
+
+    def with_options(self, **options: Any) -> Self:
+        """Same resource bound to `client.with_options(**options)`, e.g. priority="batch"."""
+        return type(self)(self._client.with_options(**options))
+
+    def _raw(self) -> Self:
+        """Same resource bound to a response_mode="raw" copy of the client."""
+        return self.with_options(response_mode="raw")
+
+    @staticmethod
+    async def _export(
+        items: AsyncIterator[Any],
+        path: str | os.PathLike[str],
+        *,
+        model: type[BaseModel],
+        format: ExportFormat,
+        batch_size: int,
+    ) -> int:
+        with Exporter(path, model=model, format=format, batch_size=batch_size) as out:
+            async for item in items:
+                out.add(item)
+        return out.rows_written
+
+    async def _get(self, path: str, *, api_domain: str = "payments",
+                   params: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._client._get(path, api_domain=api_domain, params=params, cast_to=cast_to)
+
+    async def _post(self, path: str, *, api_domain: str = "payments",
+                    json: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._client._post(path, api_domain=api_domain, json=json, cast_to=cast_to)
+
+    async def _put(self, path: str, *, api_domain: str = "payments",
+                   json: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._client._put(path, api_domain=api_domain, json=json, cast_to=cast_to)
+
+    async def _patch(self, path: str, *, api_domain: str = "payments",
+                     json: dict[str, Any] | None = None, cast_to: type[T] | None = None) -> T | None:
+        return await self._client._patch(path, api_domain=api_domain, json=json, cast_to=cast_to)
+
+    async def _delete(self, path: str, *, api_domain: str = "payments",
+                      cast_to: type[T] | None = None) -> T | None:
+        return await self._client._delete(path, api_domain=api_domain, cast_to=cast_to)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from ..models.club import ModuleItem, PageItem, StudentItem, StudentProgress
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
 
 
 class Club(APIResource):
@@ -20,7 +20,7 @@ class Club(APIResource):
         data = self._get("/modules", api_domain="club", params=params)
         if not data:
             return []
-        return [ModuleItem.model_validate(item) for item in data]
+        return self._parse_list(ModuleItem, data)
 
     def pages(self, subdomain: str, module_id: str, **kwargs: Any) -> list[PageItem]:
         """Return list of pages for the given module.
@@ -31,7 +31,7 @@ class Club(APIResource):
         data = self._get("/pages", api_domain="club", params=params)
         if not data:
             return []
-        return [PageItem.model_validate(item) for item in data]
+        return self._parse_list(PageItem, data)
 
     def students(self, subdomain: str, **kwargs: Any) -> list[StudentItem]:
         """Return list of students for the given subdomain.
@@ -42,7 +42,7 @@ class Club(APIResource):
         data = self._get("/students", api_domain="club", params=params)
         if not data:
             return []
-        return [StudentItem.model_validate(item) for item in data]
+        return self._parse_list(StudentItem, data)
 
     def student_progress(
         self, subdomain: str, *, student_email: str | None = None, **kwargs: Any
@@ -58,4 +58,43 @@ class Club(APIResource):
         data = self._get("/students/progress", api_domain="club", params=params)
         if not data:
             return []
-        return [StudentProgress.model_validate(item) for item in data]
+        return self._parse_list(StudentProgress, data)
+
+
+class AsyncClub(AsyncAPIResource):
+
+    async def modules(self, subdomain: str, *, is_extra: bool | None = None, **kwargs: Any) -> list[ModuleItem]:
+        params: dict[str, Any] = {"subdomain": subdomain}
+        if is_extra is not None:
+            params["is_extra"] = is_extra
+        params.update(kwargs)
+        data: list[Any] | None = await self._get("/modules", api_domain="club", params=params)
+        if not data:
+            return []
+        return self._parse_list(ModuleItem, data)
+
+    async def pages(self, subdomain: str, module_id: str, **kwargs: Any) -> list[PageItem]:
+        params: dict[str, Any] = {"subdomain": subdomain, "module_id": module_id, **kwargs}
+        data: list[Any] | None = await self._get("/pages", api_domain="club", params=params)
+        if not data:
+            return []
+        return self._parse_list(PageItem, data)
+
+    async def students(self, subdomain: str, **kwargs: Any) -> list[StudentItem]:
+        params: dict[str, Any] = {"subdomain": subdomain, **kwargs}
+        data: list[Any] | None = await self._get("/students", api_domain="club", params=params)
+        if not data:
+            return []
+        return self._parse_list(StudentItem, data)
+
+    async def student_progress(
+        self, subdomain: str, *, student_email: str | None = None, **kwargs: Any
+    ) -> list[StudentProgress]:
+        params: dict[str, Any] = {"subdomain": subdomain}
+        if student_email is not None:
+            params["student_email"] = student_email
+        params.update(kwargs)
+        data: list[Any] | None = await self._get("/students/progress", api_domain="club", params=params)
+        if not data:
+            return []
+        return self._parse_list(StudentProgress, data)
@@ -1,11 +1,78 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import Any
+import asyncio
+import csv
+import os
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Literal
 
+from .._concurrency import amap_unordered, map_unordered
+from .._pagination import AsyncAutoPager, AutoPager, PaginationCursor
 from ..models.coupons import CouponItem
 from ..models.pagination import PaginatedResponse
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
+
+CouponStatus = Literal["created", "deleted", "skipped", "failed"]
+CouponSource = Iterable[Any] | str | os.PathLike[str]
+
+
+@dataclass(frozen=True)
+class CouponOutcome:
+    """Result of one coupon in Coupons.create_many / delete_many.
+
+    "skipped" means nothing had to be done: the code already existed (create) or was already
+    gone (delete), e.g. when a partially completed run is repeated.
+
+    Resultado de um cupom em create_many / delete_many.
+    """
+
+    code: str
+    status: CouponStatus
+    coupon_id: str | None = None
+    error: Exception | None = None
+
+
+def _rows(source: CouponSource, columns: tuple[str, ...]) -> Iterator[Any]:
+    # A path is streamed as CSV with a header row; anything else is iterated as given.
+    if not isinstance(source, str | os.PathLike):
+        yield from source
+        return
+    with open(source, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            values = tuple((row[c] or "").strip() for c in columns)  # short rows fail in the worker
+            yield values if len(values) > 1 else values[0]
+
+
+def _creation(row: Any) -> tuple[str, float]:
+    # Parsed in the worker, so a malformed row becomes a "failed" outcome instead of ending the run.
+    code, discount = row
+    return str(code), float(discount)
+
+
+def _row_code(row: Any) -> str:
+    # The code to report for an input row, even one that could not be parsed.
+    if isinstance(row, tuple | list) and row:
+        return str(row[0])
+    return str(row)
+
+
+def _deletions(source: CouponSource, existing: dict[str, str | None]) -> Iterator[tuple[str, str | None]]:
+    # (code, coupon_id) per input row; a missing id means the coupon is already gone.
+    for code in _rows(source, ("code",)):
+        yield code, existing.pop(code, None)
+
+
+def _code_index(items: Iterable[Any]) -> dict[str, str | None]:
+    # Built from response_mode="raw" listings, so items are plain dicts.
+    return {item["code"]: item.get("id") for item in items if item.get("code")}
+
+
+def _outcome(code: str, result: CouponStatus | Exception, coupon_id: str | None = None) -> CouponOutcome:
+    if isinstance(result, Exception):
+        return CouponOutcome(code, "failed", coupon_id, result)
+    return CouponOutcome(code, result, coupon_id)
 
 
 class Coupons(APIResource):
@@ -29,14 +96,170 @@ class Coupons(APIResource):
         params.update(kwargs)
         return self._get(f"/coupon/product/{product_id}", params=params, cast_to=PaginatedResponse[CouponItem])  # type: ignore[return-value]
 
-    def list_autopaginate(self, product_id: str, **kwargs: Any) -> Iterator[CouponItem]:
-        page_token: str | None = None
-        while True:
-            page = self.list(product_id, page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def list_autopaginate(
+        self, product_id: str, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[CouponItem]:
+        return self._autopaginate(self.list, product_id, prefetch=prefetch, resume_from=resume_from, **kwargs)
 
     def delete(self, coupon_id: str) -> None:
         self._delete(f"/coupon/{coupon_id}")
+
+    def create_many(
+        self,
+        product_id: str,
+        coupons: CouponSource,
+        *,
+        concurrency: int = 4,
+        skip_existing: bool = True,
+    ) -> Iterator[CouponOutcome]:
+        """Create many coupons for a product, yielding one CouponOutcome per code as they finish.
+
+        `coupons` is an iterable of (code, discount) pairs or the path of a CSV file with `code`
+        and `discount` columns; either is read lazily, so campaigns of any size run with flat
+        memory. Up to `concurrency` requests are in flight, all paced by the client's rate
+        limiter, and a failed creation is reported instead of raised.
+
+        With skip_existing=True (the default) the product's coupons are listed once before the
+        first request, and codes found there — or already created by this run — are reported as
+        "skipped", so re-running an interrupted campaign only creates what is missing. A code is
+        recorded only once its creation succeeded: a later row with a failed code tries again,
+        and a row whose code is still being created waits for that request first.
+
+        Cria vários cupons em paralelo dentro do rate limit, a partir de pares (código, desconto)
+        ou de um CSV; códigos já existentes são pulados, tornando a execução idempotente.
+        """
+        existing = self._index(product_id) if skip_existing else {}
+        in_flight: dict[str, threading.Event] = {}
+        lock = threading.Lock()
+
+        def create(row: Any) -> CouponStatus:
+            code, discount = _creation(row)
+            while True:
+                with lock:
+                    if code in existing:
+                        return "skipped"
+                    pending = in_flight.get(code)
+                    if pending is None:
+                        in_flight[code] = done = threading.Event()
+                        break
+                pending.wait()
+            try:
+                self.create(product_id, code, discount)
+                existing[code] = None
+                return "created"
+            finally:
+                with lock:
+                    del in_flight[code]
+                done.set()
+
+        for row, result in map_unordered(create, _rows(coupons, ("code", "discount")), concurrency=concurrency):
+            yield _outcome(_row_code(row), result)
+
+    def delete_many(self, product_id: str, codes: CouponSource, *, concurrency: int = 4) -> Iterator[CouponOutcome]:
+        """Delete many coupons of a product by code, yielding one CouponOutcome per code.
+
+        Codes are resolved to coupon ids through one listing of the product's coupons; codes
+        that are not there are reported as "skipped", so a cleanup can safely be re-run.
+        `codes` is an iterable of codes or the path of a CSV file with a `code` column.
+
+        Remove vários cupons de um produto pelo código, em paralelo e de forma idempotente.
+        """
+        existing = self._index(product_id)
+
+        def delete(row: tuple[str, str | None]) -> CouponStatus:
+            if row[1] is None:
+                return "skipped"
+            self.delete(row[1])
+            return "deleted"
+
+        for row, result in map_unordered(delete, _deletions(codes, existing), concurrency=concurrency):
+            yield _outcome(row[0], result, row[1])
+
+    def _index(self, product_id: str) -> dict[str, str | None]:
+        """code -> coupon id for every coupon of the product."""
+        return _code_index(self._raw().list_autopaginate(product_id))
+
+
+class AsyncCoupons(AsyncAPIResource):
+
+    async def create(self, product_id: str, coupon_code: str, discount: float) -> None:
+        await self._post(f"/product/{product_id}/coupon", json={"code": coupon_code, "discount": discount})
+
+    async def list(
+        self,
+        product_id: str,
+        *,
+        code: str | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[CouponItem]:
+        params: dict[str, Any] = {}
+        if code is not None:
+            params["code"] = code
+        if page_token is not None:
+            params["page_token"] = page_token
+        params.update(kwargs)
+        return await self._get(f"/coupon/product/{product_id}", params=params, cast_to=PaginatedResponse[CouponItem])  # type: ignore[return-value]
+
+    def list_autopaginate(
+        self, product_id: str, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[CouponItem]:
+        return self._autopaginate(self.list, product_id, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def delete(self, coupon_id: str) -> None:
+        await self._delete(f"/coupon/{coupon_id}")
+
+    async def create_many(
+        self,
+        product_id: str,
+        coupons: CouponSource,
+        *,
+        concurrency: int = 4,
+        skip_existing: bool = True,
+    ) -> AsyncIterator[CouponOutcome]:
+        """Async variant of Coupons.create_many — one task per in-flight request.
+
+        Variante async de Coupons.create_many — uma task por requisição em andamento.
+        """
+        existing = await self._index(product_id) if skip_existing else {}
+        in_flight: dict[str, asyncio.Event] = {}
+
+        async def create(row: Any) -> CouponStatus:
+            code, discount = _creation(row)
+            while (pending := in_flight.get(code)) is not None:
+                await pending.wait()
+            if code in existing:
+                return "skipped"
+            in_flight[code] = done = asyncio.Event()
+            try:
+                await self.create(product_id, code, discount)
+                existing[code] = None
+                return "created"
+            finally:
+                del in_flight[code]
+                done.set()
+
+        rows = _rows(coupons, ("code", "discount"))
+        async for row, result in amap_unordered(create, rows, concurrency=concurrency):
+            yield _outcome(_row_code(row), result)
+
+    async def delete_many(
+        self, product_id: str, codes: CouponSource, *, concurrency: int = 4
+    ) -> AsyncIterator[CouponOutcome]:
+        """Async variant of Coupons.delete_many.
+
+        Variante async de Coupons.delete_many.
+        """
+        existing = await self._index(product_id)
+
+        async def delete(row: tuple[str, str | None]) -> CouponStatus:
+            if row[1] is None:
+                return "skipped"
+            await self.delete(row[1])
+            return "deleted"
+
+        async for row, result in amap_unordered(delete, _deletions(codes, existing), concurrency=concurrency):
+            yield _outcome(row[0], result, row[1])
+
+    async def _index(self, product_id: str) -> dict[str, str | None]:
+        return _code_index([item async for item in self._raw().list_autopaginate(product_id)])
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
 from typing import Any
 
 from .._base_client import _build_params
+from .._pagination import AsyncAutoPager, AutoPager, PaginationCursor
 from ..models.events import EventItem, TicketItem
 from ..models.pagination import PaginatedResponse
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
 
 
 class Events(APIResource):
@@ -27,11 +27,33 @@ class Events(APIResource):
         params = _build_params(locals())
         return self._get("/tickets", params=params, cast_to=PaginatedResponse[TicketItem])  # type: ignore[return-value]
 
-    def tickets_autopaginate(self, *, product_id: int, **kwargs: Any) -> Iterator[TicketItem]:
-        page_token: str | None = None
-        while True:
-            page = self.tickets(product_id=product_id, page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def tickets_autopaginate(
+        self, *, product_id: int, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[TicketItem]:
+        return self._autopaginate(
+            self.tickets, product_id=product_id, prefetch=prefetch, resume_from=resume_from, **kwargs
+        )
+
+
+class AsyncEvents(AsyncAPIResource):
+
+    async def get(self, event_id: str, **kwargs: Any) -> EventItem | None:
+        return await self._get(f"/events/{event_id}", cast_to=EventItem)
+
+    async def tickets(
+        self,
+        *,
+        product_id: int,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[TicketItem]:
+        params = _build_params(locals())
+        return await self._get("/tickets", params=params, cast_to=PaginatedResponse[TicketItem])  # type: ignore[return-value]
+
+    def tickets_autopaginate(
+        self, *, product_id: int, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[TicketItem]:
+        return self._autopaginate(
+            self.tickets, product_id=product_id, prefetch=prefetch, resume_from=resume_from, **kwargs
+        )
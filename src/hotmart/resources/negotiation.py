@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from ..models.negotiation import NegotiationResponse
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
 
 
 class Negotiation(APIResource):
 
     def create(self, subscriber_code: str) -> NegotiationResponse | None:
         return self._post("/negotiation", json={"subscriber_code": subscriber_code}, cast_to=NegotiationResponse)
+
+
+class AsyncNegotiation(AsyncAPIResource):
+
+    async def create(self, subscriber_code: str) -> NegotiationResponse | None:
+        return await self._post("/negotiation", json={"subscriber_code": subscriber_code}, cast_to=NegotiationResponse)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
 from typing import Any
 
 from .._base_client import _build_params
+from .._pagination import AsyncAutoPager, AutoPager, PaginationCursor
 from ..models._enums import ProductFormat, ProductStatus
 from ..models.pagination import PaginatedResponse
 from ..models.products import OfferItem, PlanItem, ProductItem
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
 
 
 class Products(APIResource):
@@ -25,14 +25,10 @@ class Products(APIResource):
         params = _build_params(locals())
         return self._get("/products", api_domain="products", params=params, cast_to=PaginatedResponse[ProductItem])  # type: ignore[return-value]
 
-    def list_autopaginate(self, **kwargs: Any) -> Iterator[ProductItem]:
-        page_token: str | None = None
-        while True:
-            page = self.list(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def list_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[ProductItem]:
+        return self._autopaginate(self.list, prefetch=prefetch, resume_from=resume_from, **kwargs)
 
     def offers(
         self,
@@ -48,14 +44,10 @@ class Products(APIResource):
             f"/products/{ucode}/offers", api_domain="products", params=params, cast_to=PaginatedResponse[OfferItem]
         )
 
-    def offers_autopaginate(self, ucode: str, **kwargs: Any) -> Iterator[OfferItem]:
-        page_token: str | None = None
-        while True:
-            page = self.offers(ucode, page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def offers_autopaginate(
+        self, ucode: str, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[OfferItem]:
+        return self._autopaginate(self.offers, ucode, prefetch=prefetch, resume_from=resume_from, **kwargs)
 
     def plans(
         self,
@@ -71,11 +63,68 @@ class Products(APIResource):
             f"/products/{ucode}/plans", api_domain="products", params=params, cast_to=PaginatedResponse[PlanItem]
         )
 
-    def plans_autopaginate(self, ucode: str, **kwargs: Any) -> Iterator[PlanItem]:
-        page_token: str | None = None
-        while True:
-            page = self.plans(ucode, page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def plans_autopaginate(
+        self, ucode: str, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[PlanItem]:
+        return self._autopaginate(self.plans, ucode, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+
+class AsyncProducts(AsyncAPIResource):
+
+    async def list(
+        self,
+        *,
+        id: int | None = None,
+        status: ProductStatus | str | None = None,
+        format: ProductFormat | str | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[ProductItem]:
+        params = _build_params(locals())
+        return await self._get(  # type: ignore[return-value]
+            "/products", api_domain="products", params=params, cast_to=PaginatedResponse[ProductItem]
+        )
+
+    def list_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[ProductItem]:
+        return self._autopaginate(self.list, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def offers(
+        self,
+        ucode: str,
+        *,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[OfferItem]:
+        params = _build_params(locals())
+        params.pop("ucode", None)
+        return await self._get(  # type: ignore[return-value]
+            f"/products/{ucode}/offers", api_domain="products", params=params, cast_to=PaginatedResponse[OfferItem]
+        )
+
+    def offers_autopaginate(
+        self, ucode: str, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[OfferItem]:
+        return self._autopaginate(self.offers, ucode, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def plans(
+        self,
+        ucode: str,
+        *,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[PlanItem]:
+        params = _build_params(locals())
+        params.pop("ucode", None)
+        return await self._get(  # type: ignore[return-value]
+            f"/products/{ucode}/plans", api_domain="products", params=params, cast_to=PaginatedResponse[PlanItem]
+        )
+
+    def plans_autopaginate(
+        self, ucode: str, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[PlanItem]:
+        return self._autopaginate(self.plans, ucode, prefetch=prefetch, resume_from=resume_from, **kwargs)
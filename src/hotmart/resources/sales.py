@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+import os
+from collections.abc import AsyncIterator, Iterable, Iterator
 from typing import Any
 
 from .._base_client import _build_params
+from .._concurrency import amerge_iterators, merge_iterators
+from .._export import DEFAULT_BATCH_SIZE, ExportFormat
+from .._pagination import AsyncAutoPager, AutoPager, PaginationCursor
 from ..models._enums import CommissionSource, PaymentType, PurchaseStatus
 from ..models.pagination import PaginatedResponse
 from ..models.sales import (
@@ -13,7 +17,60 @@ from ..models.sales import (
     SalePriceDetailsItem,
     SaleSummaryItem,
 )
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
+
+
+def _split_window(start_date: int, end_date: int, shards: int) -> list[tuple[int, int]]:
+    """Split [start_date, end_date] (ms) into up to `shards` contiguous, non-overlapping windows.
+
+    Divide [start_date, end_date] (ms) em até `shards` janelas contíguas e sem sobreposição.
+    """
+    if shards < 1:
+        raise ValueError("shards must be >= 1")
+    if end_date < start_date:
+        raise ValueError("end_date must be >= start_date")
+    span = end_date - start_date + 1
+    shards = min(shards, span)
+    bounds = [start_date + span * i // shards for i in range(shards + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(shards)]
+
+
+def _purchase_field(item: SaleHistoryItem, name: str) -> Any:
+    if isinstance(item, dict):  # response_mode="raw"
+        return (item.get("purchase") or {}).get(name)
+    return getattr(item.purchase, name, None) if item.purchase else None
+
+
+def _order_date(item: SaleHistoryItem) -> int:
+    return _purchase_field(item, "order_date") or 0
+
+
+def _transaction(item: SaleHistoryItem) -> str | None:
+    return _purchase_field(item, "transaction")  # type: ignore[no-any-return]
+
+
+_END: Any = object()
+
+
+def _with_end(items: Iterator[SaleHistoryItem]) -> Iterator[Any]:
+    yield from items
+    yield _END
+
+
+async def _awith_end(items: AsyncIterator[SaleHistoryItem]) -> AsyncIterator[Any]:
+    async for item in items:
+        yield item
+    yield _END
+
+
+def _dedupe(items: Iterable[SaleHistoryItem], seen: set[str]) -> Iterator[SaleHistoryItem]:
+    for item in items:
+        transaction = _transaction(item)
+        if transaction is not None:
+            if transaction in seen:
+                continue
+            seen.add(transaction)
+        yield item
 
 
 class Sales(APIResource):
@@ -39,14 +96,75 @@ class Sales(APIResource):
         params = _build_params(locals())
         return self._get("/sales/history", params=params, cast_to=PaginatedResponse[SaleHistoryItem])  # type: ignore[return-value]
 
-    def history_autopaginate(self, **kwargs: Any) -> Iterator[SaleHistoryItem]:
-        page_token: str | None = None
-        while True:
-            page = self.history(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def history_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SaleHistoryItem]:
+        return self._autopaginate(self.history, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    def export_history(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Stream every sale matching the filters into `path` as Parquet, CSV or NDJSON.
+
+        Pages are fetched with response_mode="raw" (no pydantic models) and flattened into the
+        columns declared by `SaleHistoryItem` (`purchase.price.value`, `buyer.email`, ...); rows
+        are written in batches of `batch_size`, so memory stays bounded by one batch. Extra
+        kwargs are forwarded to `history_autopaginate` (filters, `max_results`, `prefetch`).
+        Returns the number of rows written.
+
+        Grava em `path` todos os itens filtrados, em lotes, sem construir modelos pydantic.
+        """
+        items = self._raw().history_autopaginate(**kwargs)
+        return self._export(items, path, model=SaleHistoryItem, format=format, batch_size=batch_size)
+
+    def history_sharded(
+        self,
+        *,
+        start_date: int,
+        end_date: int,
+        shards: int = 4,
+        ordered: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[SaleHistoryItem]:
+        """Autopaginate /sales/history over `shards` date sub-windows fetched concurrently.
+
+        Each window is walked by its own thread; all requests go through the client's shared
+        rate limiter, so parallelism only spends budget that is actually available.
+        Items are deduplicated on `purchase.transaction`. With ordered=False (default) items are
+        yielded as pages arrive; with ordered=True windows are yielded oldest first and each
+        window is sorted by `purchase.order_date` — windows that finish early stay buffered until
+        every older window has been yielded.
+
+        Percorre /sales/history em `shards` subjanelas de data buscadas em paralelo, com
+        deduplicação por `purchase.transaction`. ordered=True produz itens ordenados por order_date.
+        """
+        windows = _split_window(start_date, end_date, shards)
+        seen: set[str] = set()
+
+        def shard(window: tuple[int, int]) -> Iterator[SaleHistoryItem]:
+            return self.history_autopaginate(start_date=window[0], end_date=window[1], **kwargs)
+
+        merged = merge_iterators([lambda w=w: _with_end(shard(w)) for w in windows])  # type: ignore[misc]
+        if not ordered:
+            yield from _dedupe((item for _, item in merged if item is not _END), seen)
+            return
+
+        buckets: dict[int, list[SaleHistoryItem]] = {}
+        finished: set[int] = set()
+        next_window = 0
+        for index, item in merged:
+            if item is not _END:
+                buckets.setdefault(index, []).append(item)
+                continue
+            finished.add(index)
+            while next_window in finished:
+                yield from _dedupe(sorted(buckets.pop(next_window, []), key=_order_date), seen)
+                next_window += 1
 
     def summary(
         self,
@@ -67,14 +185,10 @@ class Sales(APIResource):
         params = _build_params(locals())
         return self._get("/sales/summary", params=params, cast_to=PaginatedResponse[SaleSummaryItem])  # type: ignore[return-value]
 
-    def summary_autopaginate(self, **kwargs: Any) -> Iterator[SaleSummaryItem]:
-        page_token: str | None = None
-        while True:
-            page = self.summary(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def summary_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SaleSummaryItem]:
+        return self._autopaginate(self.summary, prefetch=prefetch, resume_from=resume_from, **kwargs)
 
     def participants(
         self,
@@ -96,14 +210,27 @@ class Sales(APIResource):
         params = _build_params(locals())
         return self._get("/sales/users", params=params, cast_to=PaginatedResponse[SaleParticipantsItem])  # type: ignore[return-value]
 
-    def participants_autopaginate(self, **kwargs: Any) -> Iterator[SaleParticipantsItem]:
-        page_token: str | None = None
-        while True:
-            page = self.participants(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def participants_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SaleParticipantsItem]:
+        return self._autopaginate(self.participants, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    def export_participants(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Stream all sale participant records matching the filters into `path` — see Sales.export_history.
+
+        Columns follow `SaleParticipantsItem`; the `users` list is written as one JSON column.
+
+        Grava em `path` todas as participantes filtradas — veja Sales.export_history.
+        """
+        items = self._raw().participants_autopaginate(**kwargs)
+        return self._export(items, path, model=SaleParticipantsItem, format=format, batch_size=batch_size)
 
     def commissions(
         self,
@@ -121,14 +248,27 @@ class Sales(APIResource):
         params = _build_params(locals())
         return self._get("/sales/commissions", params=params, cast_to=PaginatedResponse[SaleCommissionsItem])  # type: ignore[return-value]
 
-    def commissions_autopaginate(self, **kwargs: Any) -> Iterator[SaleCommissionsItem]:
-        page_token: str | None = None
-        while True:
-            page = self.commissions(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def commissions_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SaleCommissionsItem]:
+        return self._autopaginate(self.commissions, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    def export_commissions(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Stream all commission records matching the filters into `path` — see Sales.export_history.
+
+        Columns follow `SaleCommissionsItem`; the `commissions` list is written as one JSON column.
+
+        Grava em `path` todas as comissões filtradas — veja Sales.export_history.
+        """
+        items = self._raw().commissions_autopaginate(**kwargs)
+        return self._export(items, path, model=SaleCommissionsItem, format=format, batch_size=batch_size)
 
     def price_details(
         self,
@@ -146,16 +286,219 @@ class Sales(APIResource):
         params = _build_params(locals())
         return self._get("/sales/price/details", params=params, cast_to=PaginatedResponse[SalePriceDetailsItem])  # type: ignore[return-value]
 
-    def price_details_autopaginate(self, **kwargs: Any) -> Iterator[SalePriceDetailsItem]:
-        page_token: str | None = None
-        while True:
-            page = self.price_details(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def price_details_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SalePriceDetailsItem]:
+        return self._autopaginate(self.price_details, prefetch=prefetch, resume_from=resume_from, **kwargs)
 
     def refund(self, transaction_code: str) -> None:
         # NOTE: spec table lists this as POST /sales/refund but the API reference
         # confirms PUT /payments/api/v1/sales/:transaction_code/refund — API wins.
         self._put(f"/sales/{transaction_code}/refund")
+
+
+class AsyncSales(AsyncAPIResource):
+
+    async def history(
+        self,
+        *,
+        product_id: int | None = None,
+        start_date: int | None = None,
+        end_date: int | None = None,
+        sales_source: str | None = None,
+        transaction: str | None = None,
+        buyer_name: str | None = None,
+        buyer_email: str | None = None,
+        transaction_status: PurchaseStatus | str | None = None,
+        payment_type: PaymentType | str | None = None,
+        offer_code: str | None = None,
+        commission_as: CommissionSource | str | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SaleHistoryItem]:
+        params = _build_params(locals())
+        return await self._get("/sales/history", params=params, cast_to=PaginatedResponse[SaleHistoryItem])  # type: ignore[return-value]
+
+    def history_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SaleHistoryItem]:
+        return self._autopaginate(self.history, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def export_history(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Async variant of Sales.export_history.
+
+        Variante async de Sales.export_history.
+        """
+        items = self._raw().history_autopaginate(**kwargs)
+        return await self._export(items, path, model=SaleHistoryItem, format=format, batch_size=batch_size)
+
+    async def history_sharded(
+        self,
+        *,
+        start_date: int,
+        end_date: int,
+        shards: int = 4,
+        ordered: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[SaleHistoryItem]:
+        """Async variant of Sales.history_sharded — one task per date window.
+
+        Variante async de Sales.history_sharded — uma task por janela de data.
+        """
+        windows = _split_window(start_date, end_date, shards)
+        seen: set[str] = set()
+
+        def shard(window: tuple[int, int]) -> AsyncIterator[SaleHistoryItem]:
+            return self.history_autopaginate(start_date=window[0], end_date=window[1], **kwargs)
+
+        merged = amerge_iterators([lambda w=w: _awith_end(shard(w)) for w in windows])  # type: ignore[misc]
+        buckets: dict[int, list[SaleHistoryItem]] = {}
+        finished: set[int] = set()
+        next_window = 0
+        async for index, item in merged:
+            if not ordered:
+                if item is not _END:
+                    for unique in _dedupe((item,), seen):
+                        yield unique
+            elif item is not _END:
+                buckets.setdefault(index, []).append(item)
+            else:
+                finished.add(index)
+                while next_window in finished:
+                    for unique in _dedupe(sorted(buckets.pop(next_window, []), key=_order_date), seen):
+                        yield unique
+                    next_window += 1
+
+    async def summary(
+        self,
+        *,
+        product_id: int | None = None,
+        start_date: int | None = None,
+        end_date: int | None = None,
+        sales_source: str | None = None,
+        affiliate_name: str | None = None,
+        payment_type: PaymentType | str | None = None,
+        offer_code: str | None = None,
+        transaction: str | None = None,
+        transaction_status: PurchaseStatus | str | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SaleSummaryItem]:
+        params = _build_params(locals())
+        return await self._get("/sales/summary", params=params, cast_to=PaginatedResponse[SaleSummaryItem])  # type: ignore[return-value]
+
+    def summary_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SaleSummaryItem]:
+        return self._autopaginate(self.summary, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def participants(
+        self,
+        *,
+        product_id: int | None = None,
+        start_date: int | None = None,
+        end_date: int | None = None,
+        buyer_email: str | None = None,
+        buyer_name: str | None = None,
+        sales_source: str | None = None,
+        transaction: str | None = None,
+        affiliate_name: str | None = None,
+        commission_as: CommissionSource | str | None = None,
+        transaction_status: PurchaseStatus | str | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SaleParticipantsItem]:
+        params = _build_params(locals())
+        return await self._get("/sales/users", params=params, cast_to=PaginatedResponse[SaleParticipantsItem])  # type: ignore[return-value]
+
+    def participants_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SaleParticipantsItem]:
+        return self._autopaginate(self.participants, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def export_participants(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Async variant of Sales.export_participants.
+
+        Variante async de Sales.export_participants.
+        """
+        items = self._raw().participants_autopaginate(**kwargs)
+        return await self._export(items, path, model=SaleParticipantsItem, format=format, batch_size=batch_size)
+
+    async def commissions(
+        self,
+        *,
+        product_id: int | None = None,
+        start_date: int | None = None,
+        end_date: int | None = None,
+        transaction: str | None = None,
+        commission_as: CommissionSource | str | None = None,
+        transaction_status: PurchaseStatus | str | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SaleCommissionsItem]:
+        params = _build_params(locals())
+        return await self._get("/sales/commissions", params=params, cast_to=PaginatedResponse[SaleCommissionsItem])  # type: ignore[return-value]
+
+    def commissions_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SaleCommissionsItem]:
+        return self._autopaginate(self.commissions, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def export_commissions(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Async variant of Sales.export_commissions.
+
+        Variante async de Sales.export_commissions.
+        """
+        items = self._raw().commissions_autopaginate(**kwargs)
+        return await self._export(items, path, model=SaleCommissionsItem, format=format, batch_size=batch_size)
+
+    async def price_details(
+        self,
+        *,
+        product_id: int | None = None,
+        start_date: int | None = None,
+        end_date: int | None = None,
+        transaction: str | None = None,
+        transaction_status: PurchaseStatus | str | None = None,
+        payment_type: PaymentType | str | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SalePriceDetailsItem]:
+        params = _build_params(locals())
+        return await self._get("/sales/price/details", params=params, cast_to=PaginatedResponse[SalePriceDetailsItem])  # type: ignore[return-value]
+
+    def price_details_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SalePriceDetailsItem]:
+        return self._autopaginate(self.price_details, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def refund(self, transaction_code: str) -> None:
+        # NOTE: spec table lists this as POST /sales/refund but the API reference
+        # confirms PUT /payments/api/v1/sales/:transaction_code/refund — API wins.
+        await self._put(f"/sales/{transaction_code}/refund")
@@ -1,19 +1,83 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+import builtins
+import os
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from typing import Any
 
 from .._base_client import _build_params
+from .._concurrency import amap_unordered, map_unordered
+from .._export import DEFAULT_BATCH_SIZE, ExportFormat
+from .._pagination import AsyncAutoPager, AutoPager, PaginationCursor
 from ..models._enums import SubscriptionStatus
 from ..models.pagination import PaginatedResponse
 from ..models.subscriptions import (
     SubscriptionBulkResponse,
+    SubscriptionBulkResult,
     SubscriptionItem,
     SubscriptionPurchase,
     SubscriptionResult,
     SubscriptionSummaryItem,
 )
-from ._base import APIResource
+from ._base import APIResource, AsyncAPIResource
+
+# Codes sent per POST by cancel_bulk / reactivate_bulk. Hotmart does not document a maximum;
+# this keeps each request body small and a failed chunk cheap to retry.
+BULK_CHUNK_SIZE = 100
+_UNREPORTED = "unreported by API"
+
+
+def _chunks(codes: Sequence[str], size: int) -> list[list[str]]:
+    if size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    return [list(codes[i:i + size]) for i in range(0, len(codes), size)]
+
+
+class _BulkMerger:
+    # Folds per-chunk outcomes into one SubscriptionBulkResult. A code that fails in one round
+    # and succeeds in a retry round ends up only among the successes. Codes the API leaves out
+    # of its answer (even an empty 200) count as failures, so they are retried and reported.
+
+    def __init__(self, codes: Iterable[str]) -> None:
+        self.pending = list(dict.fromkeys(codes))
+        self._successes: dict[str, SubscriptionResult] = {}
+        self._failures: dict[str, SubscriptionResult] = {}
+
+    def add(self, chunk: list[str], outcome: SubscriptionBulkResponse | Exception | None) -> None:
+        if isinstance(outcome, Exception):
+            for code in chunk:
+                self._failures[code] = SubscriptionResult(subscriber_code=code,
+                                                          error=f"{type(outcome).__name__}: {outcome}")
+            return
+        if outcome is None:
+            outcome = SubscriptionBulkResponse()
+        elif isinstance(outcome, dict):  # response_mode="raw"
+            outcome = SubscriptionBulkResponse.model_validate(outcome)
+        reported: set[str] = set()
+        for item in outcome.success_subscriptions:
+            if item.subscriber_code:
+                reported.add(item.subscriber_code)
+                self._successes[item.subscriber_code] = item
+                self._failures.pop(item.subscriber_code, None)
+        for item in outcome.fail_subscriptions:
+            if item.subscriber_code:
+                reported.add(item.subscriber_code)
+                self._failures[item.subscriber_code] = item
+        for code in chunk:
+            if code not in reported:
+                self._failures[code] = SubscriptionResult(subscriber_code=code, error=_UNREPORTED)
+
+    def next_round(self) -> list[str]:
+        self.pending = [code for code in self.pending if code in self._failures]
+        return self.pending
+
+    def result(self) -> SubscriptionBulkResult:
+        failures = list(self._failures.values())
+        return SubscriptionBulkResult(
+            success_subscriptions=list(self._successes.values()),
+            fail_subscriptions=failures,
+            errors={f.subscriber_code or "": f.error or "failed" for f in failures},
+        )
 
 
 class Subscriptions(APIResource):
@@ -42,14 +106,27 @@ class Subscriptions(APIResource):
         params = _build_params(locals())
         return self._get("/subscriptions", params=params, cast_to=PaginatedResponse[SubscriptionItem])  # type: ignore[return-value]
 
-    def list_autopaginate(self, **kwargs: Any) -> Iterator[SubscriptionItem]:
-        page_token: str | None = None
-        while True:
-            page = self.list(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def list_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SubscriptionItem]:
+        return self._autopaginate(self.list, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    def export_list(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Stream all subscriptions matching the filters into `path` — see Sales.export_history.
+
+        Columns follow `SubscriptionItem` (`plan.name`, `subscriber.email`, ...).
+
+        Grava em `path` todas as assinaturas filtradas — veja Sales.export_history.
+        """
+        items = self._raw().list_autopaginate(**kwargs)
+        return self._export(items, path, model=SubscriptionItem, format=format, batch_size=batch_size)
 
     def summary(
         self,
@@ -66,33 +143,127 @@ class Subscriptions(APIResource):
         params = _build_params(locals())
         return self._get("/subscriptions/summary", params=params, cast_to=PaginatedResponse[SubscriptionSummaryItem])  # type: ignore[return-value]
 
-    def summary_autopaginate(self, **kwargs: Any) -> Iterator[SubscriptionSummaryItem]:
-        page_token: str | None = None
-        while True:
-            page = self.summary(page_token=page_token, **kwargs)
-            yield from page.items
-            if not page.page_info or not page.page_info.next_page_token:
-                break
-            page_token = page.page_info.next_page_token
+    def summary_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AutoPager[SubscriptionSummaryItem]:
+        return self._autopaginate(self.summary, prefetch=prefetch, resume_from=resume_from, **kwargs)
 
-    def purchases(self, subscriber_code: str, **kwargs: Any) -> list[SubscriptionPurchase]:
+    def purchases(self, subscriber_code: str, **kwargs: Any) -> builtins.list[SubscriptionPurchase]:
         data = self._get(f"/subscriptions/{subscriber_code}/purchases")
         if not data:
             return []
-        return [SubscriptionPurchase.model_validate(item) for item in data]
+        return self._parse_list(SubscriptionPurchase, data)
 
-    def transactions(self, subscriber_code: str, **kwargs: Any) -> list[Any]:
+    def transactions(self, subscriber_code: str, **kwargs: Any) -> builtins.list[Any]:
         data = self._get(f"/subscriptions/{subscriber_code}/transactions")
         return data if data else []
 
-    def cancel(self, subscriber_code: list[str], *, send_mail: bool = True) -> SubscriptionBulkResponse | None:
+    def purchases_many(
+        self, subscriber_codes: Iterable[str], *, concurrency: int = 4
+    ) -> Iterator[tuple[str, builtins.list[SubscriptionPurchase] | Exception]]:
+        """Fetch purchases for many subscribers with up to `concurrency` parallel requests.
+
+        Yields (subscriber_code, purchases) pairs as requests complete, in no particular order;
+        a lookup that fails yields its exception instead, so one bad code does not stop the
+        rest. Every request goes through the client's rate limiter. Codes are consumed lazily,
+        so a generator over millions of codes is fine.
+
+        Busca as compras de vários assinantes em paralelo, produzindo (código, resultado ou
+        exceção) conforme as requisições terminam.
+        """
+        return map_unordered(self.purchases, subscriber_codes, concurrency=concurrency)
+
+    def transactions_many(
+        self, subscriber_codes: Iterable[str], *, concurrency: int = 4
+    ) -> Iterator[tuple[str, builtins.list[Any] | Exception]]:
+        """Fetch transactions for many subscribers — see purchases_many.
+
+        Busca as transações de vários assinantes — veja purchases_many.
+        """
+        return map_unordered(self.transactions, subscriber_codes, concurrency=concurrency)
+
+    def change_due_day_many(
+        self, subscriber_codes: Iterable[str], due_day: int, *, concurrency: int = 4
+    ) -> Iterator[tuple[str, Exception | None]]:
+        """Change the due day of many subscriptions, yielding (subscriber_code, None or exception).
+
+        Like purchases_many the calls only run while the iterator is consumed.
+
+        Altera o dia de cobrança de várias assinaturas; as chamadas rodam conforme o iterador é consumido.
+        """
+        return map_unordered(lambda code: self.change_due_day(code, due_day), subscriber_codes,
+                             concurrency=concurrency)
+
+    def cancel(self, subscriber_code: builtins.list[str], *, send_mail: bool = True) -> SubscriptionBulkResponse | None:
         body = {"subscriber_code": subscriber_code, "send_mail": send_mail}
         return self._post("/subscriptions/cancel", json=body, cast_to=SubscriptionBulkResponse)
 
-    def reactivate(self, subscriber_code: list[str], *, charge: bool = False) -> SubscriptionBulkResponse | None:
+    def reactivate(
+        self, subscriber_code: builtins.list[str], *, charge: bool = False
+    ) -> SubscriptionBulkResponse | None:
         body = {"subscriber_code": subscriber_code, "charge": charge}
         return self._post("/subscriptions/reactivate", json=body, cast_to=SubscriptionBulkResponse)
 
+    def cancel_bulk(
+        self,
+        subscriber_codes: Iterable[str],
+        *,
+        send_mail: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        retry_failed: int = 0,
+    ) -> SubscriptionBulkResult:
+        """Cancel any number of subscriptions: chunked, sent concurrently, merged into one result.
+
+        The codes are deduplicated and split into chunks of `chunk_size`; up to `concurrency`
+        chunks are in flight at once, all paced by the client's rate limiter. A chunk that raises
+        does not stop the others — its codes are reported as failed. With retry_failed=N, codes
+        that failed are resubmitted up to N more times.
+
+        Cancela qualquer quantidade de assinaturas em lotes paralelos, com resultado agregado.
+        """
+        return self._bulk("/subscriptions/cancel", subscriber_codes, {"send_mail": send_mail},
+                          chunk_size, concurrency, retry_failed)
+
+    def reactivate_bulk(
+        self,
+        subscriber_codes: Iterable[str],
+        *,
+        charge: bool = False,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        retry_failed: int = 0,
+    ) -> SubscriptionBulkResult:
+        """Reactivate any number of subscriptions — see cancel_bulk.
+
+        Reativa qualquer quantidade de assinaturas — veja cancel_bulk.
+        """
+        return self._bulk("/subscriptions/reactivate", subscriber_codes, {"charge": charge},
+                          chunk_size, concurrency, retry_failed)
+
+    def _bulk(
+        self,
+        path: str,
+        codes: Iterable[str],
+        options: dict[str, Any],
+        chunk_size: int,
+        concurrency: int,
+        retry_failed: int,
+    ) -> SubscriptionBulkResult:
+        merger = _BulkMerger(codes)
+
+        def send(chunk: list[str]) -> SubscriptionBulkResponse | None:
+            return self._post(path, json={"subscriber_code": chunk, **options}, cast_to=SubscriptionBulkResponse)
+
+        pending = merger.pending
+        for _ in range(retry_failed + 1):
+            for chunk, outcome in map_unordered(send, _chunks(pending, chunk_size), concurrency=concurrency):
+                merger.add(chunk, outcome)
+            pending = merger.next_round()
+            if not pending:
+                break
+        return merger.result()
+
     def reactivate_single(self, subscriber_code: str, *, charge: bool = False) -> SubscriptionResult | None:
         return self._post(
             f"/subscriptions/{subscriber_code}/reactivate",
@@ -102,3 +273,187 @@ class Subscriptions(APIResource):
 
     def change_due_day(self, subscriber_code: str, due_day: int) -> None:
         self._patch(f"/subscriptions/{subscriber_code}", json={"due_day": due_day})
+
+
+class AsyncSubscriptions(AsyncAPIResource):
+
+    async def list(
+        self,
+        *,
+        product_id: int | None = None,
+        plan: list[str] | None = None,
+        plan_id: int | None = None,
+        accession_date: int | None = None,
+        end_accession_date: int | None = None,
+        status: SubscriptionStatus | str | None = None,
+        subscriber_code: str | None = None,
+        subscriber_email: str | None = None,
+        transaction: str | None = None,
+        trial: bool | None = None,
+        cancelation_date: int | None = None,
+        end_cancelation_date: int | None = None,
+        date_next_charge: int | None = None,
+        end_date_next_charge: int | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SubscriptionItem]:
+        params = _build_params(locals())
+        return await self._get("/subscriptions", params=params, cast_to=PaginatedResponse[SubscriptionItem])  # type: ignore[return-value]
+
+    def list_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SubscriptionItem]:
+        return self._autopaginate(self.list, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def export_list(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: ExportFormat = "parquet",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Async variant of Subscriptions.export_list.
+
+        Variante async de Subscriptions.export_list.
+        """
+        items = self._raw().list_autopaginate(**kwargs)
+        return await self._export(items, path, model=SubscriptionItem, format=format, batch_size=batch_size)
+
+    async def summary(
+        self,
+        *,
+        product_id: int | None = None,
+        subscriber_code: str | None = None,
+        accession_date: int | None = None,
+        end_accession_date: int | None = None,
+        date_next_charge: int | None = None,
+        max_results: int | None = None,
+        page_token: str | None = None,
+        **kwargs: Any,
+    ) -> PaginatedResponse[SubscriptionSummaryItem]:
+        params = _build_params(locals())
+        return await self._get(  # type: ignore[return-value]
+            "/subscriptions/summary", params=params, cast_to=PaginatedResponse[SubscriptionSummaryItem]
+        )
+
+    def summary_autopaginate(
+        self, *, prefetch: int = 0, resume_from: PaginationCursor | None = None, **kwargs: Any
+    ) -> AsyncAutoPager[SubscriptionSummaryItem]:
+        return self._autopaginate(self.summary, prefetch=prefetch, resume_from=resume_from, **kwargs)
+
+    async def purchases(self, subscriber_code: str, **kwargs: Any) -> builtins.list[SubscriptionPurchase]:
+        data: builtins.list[Any] | None = await self._get(f"/subscriptions/{subscriber_code}/purchases")
+        if not data:
+            return []
+        return self._parse_list(SubscriptionPurchase, data)
+
+    async def transactions(self, subscriber_code: str, **kwargs: Any) -> builtins.list[Any]:
+        data: builtins.list[Any] | None = await self._get(f"/subscriptions/{subscriber_code}/transactions")
+        return data if data else []
+
+    def purchases_many(
+        self, subscriber_codes: Iterable[str], *, concurrency: int = 4
+    ) -> AsyncIterator[tuple[str, builtins.list[SubscriptionPurchase] | Exception]]:
+        """Async variant of Subscriptions.purchases_many — one task per in-flight request.
+
+        Variante async de Subscriptions.purchases_many — uma task por requisição em andamento.
+        """
+        return amap_unordered(self.purchases, subscriber_codes, concurrency=concurrency)
+
+    def transactions_many(
+        self, subscriber_codes: Iterable[str], *, concurrency: int = 4
+    ) -> AsyncIterator[tuple[str, builtins.list[Any] | Exception]]:
+        """Async variant of Subscriptions.transactions_many.
+
+        Variante async de Subscriptions.transactions_many.
+        """
+        return amap_unordered(self.transactions, subscriber_codes, concurrency=concurrency)
+
+    def change_due_day_many(
+        self, subscriber_codes: Iterable[str], due_day: int, *, concurrency: int = 4
+    ) -> AsyncIterator[tuple[str, Exception | None]]:
+        """Async variant of Subscriptions.change_due_day_many.
+
+        Variante async de Subscriptions.change_due_day_many.
+        """
+        return amap_unordered(lambda code: self.change_due_day(code, due_day), subscriber_codes,
+                              concurrency=concurrency)
+
+    async def cancel(
+        self, subscriber_code: builtins.list[str], *, send_mail: bool = True
+    ) -> SubscriptionBulkResponse | None:
+        body = {"subscriber_code": subscriber_code, "send_mail": send_mail}
+        return await self._post("/subscriptions/cancel", json=body, cast_to=SubscriptionBulkResponse)
+
+    async def reactivate(
+        self, subscriber_code: builtins.list[str], *, charge: bool = False
+    ) -> SubscriptionBulkResponse | None:
+        body = {"subscriber_code": subscriber_code, "charge": charge}
+        return await self._post("/subscriptions/reactivate", json=body, cast_to=SubscriptionBulkResponse)
+
+    async def cancel_bulk(
+        self,
+        subscriber_codes: Iterable[str],
+        *,
+        send_mail: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        retry_failed: int = 0,
+    ) -> SubscriptionBulkResult:
+        """Async variant of Subscriptions.cancel_bulk — one task per in-flight chunk.
+
+        Variante async de Subscriptions.cancel_bulk — uma task por lote em andamento.
+        """
+        return await self._bulk("/subscriptions/cancel", subscriber_codes, {"send_mail": send_mail},
+                                chunk_size, concurrency, retry_failed)
+
+    async def reactivate_bulk(
+        self,
+        subscriber_codes: Iterable[str],
+        *,
+        charge: bool = False,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        retry_failed: int = 0,
+    ) -> SubscriptionBulkResult:
+        """Async variant of Subscriptions.reactivate_bulk.
+
+        Variante async de Subscriptions.reactivate_bulk.
+        """
+        return await self._bulk("/subscriptions/reactivate", subscriber_codes, {"charge": charge},
+                                chunk_size, concurrency, retry_failed)
+
+    async def _bulk(
+        self,
+        path: str,
+        codes: Iterable[str],
+        options: dict[str, Any],
+        chunk_size: int,
+        concurrency: int,
+        retry_failed: int,
+    ) -> SubscriptionBulkResult:
+        merger = _BulkMerger(codes)
+
+        async def send(chunk: list[str]) -> SubscriptionBulkResponse | None:
+            return await self._post(path, json={"subscriber_code": chunk, **options}, cast_to=SubscriptionBulkResponse)
+
+        pending = merger.pending
+        for _ in range(retry_failed + 1):
+            async for chunk, outcome in amap_unordered(send, _chunks(pending, chunk_size), concurrency=concurrency):
+                merger.add(chunk, outcome)
+            pending = merger.next_round()
+            if not pending:
+                break
+        return merger.result()
+
+    async def reactivate_single(self, subscriber_code: str, *, charge: bool = False) -> SubscriptionResult | None:
+        return await self._post(
+            f"/subscriptions/{subscriber_code}/reactivate",
+            json={"charge": charge},
+            cast_to=SubscriptionResult,
+        )
+
+    async def change_due_day(self, subscriber_code: str, due_day: int) -> None:
+        await self._patch(f"/subscriptions/{subscriber_code}", json={"due_day": due_day})
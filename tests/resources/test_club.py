@@ -42,3 +42,16 @@ def test_students_returns_list(club, respx_mock):
     respx_mock.get(f"{CLUB_BASE}/students").mock(return_value=httpx.Response(200, json=[{"email": "s@test.com"}]))
     result = club.students("mysubdomain")
     assert len(result) == 1
+
+
+def test_async_modules_returns_list(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.club import AsyncClub
+
+    data = [{"module_id": "m1", "name": "Module 1", "sequence": 1}]
+    respx_mock.get(f"{CLUB_BASE}/modules").mock(return_value=httpx.Response(200, json=data))
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+    result = asyncio.run(AsyncClub(BaseAsyncClient(config)).modules("mysubdomain"))
+    assert result[0].module_id == "m1"
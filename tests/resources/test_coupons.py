@@ -1,8 +1,11 @@
+import json
+
 import httpx
 import pytest
 
 from hotmart._base_client import BaseSyncClient
 from hotmart._config import ClientConfig
+from hotmart._exceptions import BadRequestError
 from hotmart.resources.coupons import Coupons
 
 TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
@@ -35,3 +38,86 @@ def test_list_returns_paginated(coupons, respx_mock):
 def test_delete_calls_delete_method(coupons, respx_mock):
     respx_mock.delete(f"{BASE}/coupon/CPN1").mock(return_value=httpx.Response(200, text="{}"))
     coupons.delete("CPN1")  # no error = success
+
+
+def test_list_autopaginate_with_prefetch(coupons, respx_mock):
+    page1 = {"items": [{"code": "A"}], "page_info": {"next_page_token": "t2"}}
+    page2 = {"items": [{"code": "B"}], "page_info": {}}
+    respx_mock.get(f"{BASE}/coupon/product/P123").mock(side_effect=[
+        httpx.Response(200, json=page1),
+        httpx.Response(200, json=page2),
+    ])
+    assert [c.code for c in coupons.list_autopaginate("P123", prefetch=1)] == ["A", "B"]
+
+
+def test_create_many_skips_existing_and_reports_failures(coupons, respx_mock):
+    existing = {"items": [{"id": "1", "code": "OLD"}], "page_info": {}}
+    respx_mock.get(f"{BASE}/coupon/product/P1").mock(return_value=httpx.Response(200, json=existing))
+
+    def reply(request):
+        code = json.loads(request.content)["code"]
+        return httpx.Response(400 if code == "BAD" else 200, json={})
+
+    route = respx_mock.post(f"{BASE}/product/P1/coupon").mock(side_effect=reply)
+    rows = iter([("OLD", 10), ("NEW1", 10), ("NEW2", "15.5"), ("NEW1", 10), ("BAD", 5)])
+    outcomes = list(coupons.create_many("P1", rows, concurrency=2))
+    assert route.call_count == 3
+    assert sorted((o.code, o.status) for o in outcomes) == [
+        ("BAD", "failed"), ("NEW1", "created"), ("NEW1", "skipped"), ("NEW2", "created"), ("OLD", "skipped"),
+    ]
+    [bad] = [o for o in outcomes if o.status == "failed"]
+    assert isinstance(bad.error, BadRequestError)
+    assert {json.loads(c.request.content)["discount"] for c in route.calls} == {10.0, 15.5, 5.0}
+
+
+def test_create_many_reports_malformed_rows_and_retries_failed_codes(coupons, respx_mock):
+    attempts = []
+
+    def reply(request):
+        attempts.append(json.loads(request.content)["code"])
+        return httpx.Response(400 if attempts.count("FLAKY") == 1 else 200, json={})
+
+    route = respx_mock.post(f"{BASE}/product/P1/coupon").mock(side_effect=reply)
+    rows = [("FLAKY", 10), ("NOPE", "ten"), ("SHORT",), ("FLAKY", 10), ("OK", 5), ("FLAKY", 10)]
+    outcomes = list(coupons.create_many("P1", rows, concurrency=1, skip_existing=False))
+    assert [(o.code, o.status) for o in outcomes] == [
+        ("FLAKY", "failed"), ("NOPE", "failed"), ("SHORT", "failed"),
+        ("FLAKY", "created"), ("OK", "created"), ("FLAKY", "skipped"),
+    ]
+    assert isinstance(outcomes[1].error, ValueError) and isinstance(outcomes[2].error, ValueError)
+    assert route.call_count == 3
+
+
+def test_create_many_and_delete_many_read_csv(coupons, respx_mock, tmp_path):
+    listing = {"items": [{"id": "9", "code": "A"}], "page_info": {}}
+    respx_mock.get(f"{BASE}/coupon/product/P1").mock(return_value=httpx.Response(200, json=listing))
+    created = respx_mock.post(f"{BASE}/product/P1/coupon").mock(return_value=httpx.Response(200, json={}))
+    deleted = respx_mock.delete(f"{BASE}/coupon/9").mock(return_value=httpx.Response(200, json={}))
+    path = tmp_path / "campaign.csv"
+    path.write_text("code,discount\nA,10\nB,20\n")
+
+    statuses = sorted((o.code, o.status) for o in coupons.create_many("P1", path))
+    assert statuses == [("A", "skipped"), ("B", "created")]
+    assert created.call_count == 1
+
+    outcomes = sorted(coupons.delete_many("P1", path), key=lambda o: o.code)
+    assert [(o.code, o.status, o.coupon_id) for o in outcomes] == [("A", "deleted", "9"), ("B", "skipped", None)]
+    assert deleted.call_count == 1
+
+
+def test_async_create_many(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.coupons import AsyncCoupons
+
+    respx_mock.get(f"{BASE}/coupon/product/P1").mock(return_value=httpx.Response(200, json={"items": []}))
+    route = respx_mock.post(f"{BASE}/product/P1/coupon").mock(return_value=httpx.Response(200, json={}))
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+
+    async def run():
+        async with BaseAsyncClient(config) as client:
+            return [o async for o in AsyncCoupons(client).create_many("P1", [("A", 1), ("B", 2)])]
+
+    assert sorted(o.status for o in asyncio.run(run())) == ["created", "created"]
+    assert route.call_count == 2
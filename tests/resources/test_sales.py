@@ -68,3 +68,154 @@ def test_history_autopaginate_follows_next_page_token(sales, respx_mock):
 def test_refund_calls_put(sales, respx_mock):
     respx_mock.put(f"{BASE}/sales/HP123/refund").mock(return_value=httpx.Response(200, text="{}"))
     sales.refund("HP123")  # no error = success
+
+
+def test_async_history_autopaginate_follows_next_page_token(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.sales import AsyncSales
+
+    page1 = {"items": [{"purchase": {"transaction": "HP1"}}], "page_info": {"next_page_token": "tok2"}}
+    page2 = {"items": [{"purchase": {"transaction": "HP2"}}], "page_info": {}}
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=[
+        httpx.Response(200, json=page1),
+        httpx.Response(200, json=page2),
+    ])
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+    sales = AsyncSales(BaseAsyncClient(config))
+
+    async def collect():
+        return [item async for item in sales.history_autopaginate()]
+
+    items = asyncio.run(collect())
+    assert [i.purchase.transaction for i in items] == ["HP1", "HP2"]
+
+
+def _sharded_responder(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params["start_date"])
+    items = [
+        {"purchase": {"transaction": f"HP{start}", "order_date": start + 5}},
+        {"purchase": {"transaction": "HP_DUP", "order_date": start}},
+    ]
+    return httpx.Response(200, json={"items": items, "page_info": {}})
+
+
+def test_split_window_covers_range_without_overlap():
+    from hotmart.resources.sales import _split_window
+
+    windows = _split_window(0, 99, 4)
+    assert windows == [(0, 24), (25, 49), (50, 74), (75, 99)]
+
+
+def test_split_window_rejects_invalid_range():
+    from hotmart.resources.sales import _split_window
+
+    with pytest.raises(ValueError):
+        _split_window(10, 0, 2)
+
+
+def test_history_sharded_queries_each_window_and_dedupes(sales, respx_mock):
+    route = respx_mock.get(f"{BASE}/sales/history").mock(side_effect=_sharded_responder)
+    items = list(sales.history_sharded(start_date=0, end_date=299, shards=3, buyer_name="Paula"))
+    assert route.call_count == 3
+    assert {r.request.url.params["buyer_name"] for r in route.calls} == {"Paula"}
+    transactions = [i.purchase.transaction for i in items]
+    assert sorted(transactions) == ["HP0", "HP100", "HP200", "HP_DUP"]
+
+
+def test_history_sharded_ordered_sorts_by_order_date(sales, respx_mock):
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=_sharded_responder)
+    items = list(sales.history_sharded(start_date=0, end_date=299, shards=3, ordered=True))
+    assert [i.purchase.transaction for i in items] == ["HP_DUP", "HP0", "HP100", "HP200"]
+
+
+def test_history_sharded_propagates_errors(sales, respx_mock):
+    from hotmart._exceptions import BadRequestError
+
+    respx_mock.get(f"{BASE}/sales/history").mock(return_value=httpx.Response(400))
+    with pytest.raises(BadRequestError):
+        list(sales.history_sharded(start_date=0, end_date=99, shards=2))
+
+
+def test_async_history_sharded_ordered(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.sales import AsyncSales
+
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=_sharded_responder)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+    sales = AsyncSales(BaseAsyncClient(config))
+
+    async def collect():
+        return [i async for i in sales.history_sharded(start_date=0, end_date=299, shards=3, ordered=True)]
+
+    items = asyncio.run(collect())
+    assert [i.purchase.transaction for i in items] == ["HP_DUP", "HP0", "HP100", "HP200"]
+
+
+def test_history_autopaginate_with_prefetch_preserves_order(sales, respx_mock):
+    pages = [
+        {"items": [{"purchase": {"transaction": f"HP{n}"}}], "page_info": {"next_page_token": f"tok{n + 1}"}}
+        for n in range(4)
+    ]
+    pages.append({"items": [{"purchase": {"transaction": "HP4"}}], "page_info": {}})
+    route = respx_mock.get(f"{BASE}/sales/history").mock(side_effect=[httpx.Response(200, json=p) for p in pages])
+    items = list(sales.history_autopaginate(prefetch=2, buyer_name="Paula"))
+    assert [i.purchase.transaction for i in items] == ["HP0", "HP1", "HP2", "HP3", "HP4"]
+    assert route.calls[1].request.url.params["page_token"] == "tok1"
+    assert route.calls[4].request.url.params["buyer_name"] == "Paula"
+
+
+def test_history_autopaginate_prefetch_rejects_negative(sales):
+    with pytest.raises(ValueError):
+        list(sales.history_autopaginate(prefetch=-1))
+
+
+def test_async_history_autopaginate_with_prefetch(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.sales import AsyncSales
+
+    page1 = {"items": [{"purchase": {"transaction": "HP1"}}], "page_info": {"next_page_token": "tok2"}}
+    page2 = {"items": [{"purchase": {"transaction": "HP2"}}], "page_info": {}}
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=[
+        httpx.Response(200, json=page1),
+        httpx.Response(200, json=page2),
+    ])
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+    sales = AsyncSales(BaseAsyncClient(config))
+
+    async def collect():
+        return [item async for item in sales.history_autopaginate(prefetch=2)]
+
+    assert [i.purchase.transaction for i in asyncio.run(collect())] == ["HP1", "HP2"]
+
+
+def test_history_autopaginate_raw_mode_yields_dicts(sales, respx_mock):
+    page1 = {"items": [{"purchase": {"transaction": "HP1"}}], "page_info": {"next_page_token": "tok2"}}
+    page2 = {"items": [{"purchase": {"transaction": "HP2"}}], "page_info": {}}
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=[
+        httpx.Response(200, json=page1),
+        httpx.Response(200, json=page2),
+    ])
+    raw_sales = Sales(sales._client.with_options(response_mode="raw"))
+    items = list(raw_sales.history_autopaginate())
+    assert items == [{"purchase": {"transaction": "HP1"}}, {"purchase": {"transaction": "HP2"}}]
+
+
+def test_export_history_streams_all_pages(sales, respx_mock, tmp_path):
+    import csv
+
+    page1 = {"items": [{"purchase": {"transaction": "HP1"}}], "page_info": {"next_page_token": "tok2"}}
+    page2 = {"items": [{"purchase": {"transaction": "HP2"}}], "page_info": {}}
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=[
+        httpx.Response(200, json=page1),
+        httpx.Response(200, json=page2),
+    ])
+    path = tmp_path / "history.csv"
+    assert sales.export_history(path, format="csv", buyer_name="Paula") == 2
+    rows = list(csv.DictReader(path.open()))
+    assert [r["purchase.transaction"] for r in rows] == ["HP1", "HP2"]
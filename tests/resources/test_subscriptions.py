@@ -1,8 +1,11 @@
+import json
+
 import httpx
 import pytest
 
 from hotmart._base_client import BaseSyncClient
 from hotmart._config import ClientConfig
+from hotmart._exceptions import NotFoundError
 from hotmart.resources.subscriptions import Subscriptions
 
 TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
@@ -53,3 +56,115 @@ def test_reactivate_single_calls_post(subs, respx_mock):
     respx_mock.post(f"{BASE}/subscriptions/ABC1/reactivate").mock(return_value=httpx.Response(200, json=resp))
     result = subs.reactivate_single("ABC1", charge=True)
     assert result.subscriber_code == "ABC1"
+
+
+def _bulk_reply(request):
+    codes = json.loads(request.content)["subscriber_code"]
+    return httpx.Response(200, json={
+        "success_subscriptions": [{"subscriber_code": c, "status": "INACTIVE"} for c in codes if not c.startswith("X")],
+        "fail_subscriptions": [{"subscriber_code": c, "error": "not found"} for c in codes if c.startswith("X")],
+    })
+
+
+def test_cancel_bulk_chunks_and_merges(subs, respx_mock):
+    route = respx_mock.post(f"{BASE}/subscriptions/cancel").mock(side_effect=_bulk_reply)
+    codes = [f"S{i}" for i in range(7)] + ["X1", "S0"]
+    result = subs.cancel_bulk(codes, chunk_size=3, concurrency=2, send_mail=False)
+    assert route.call_count == 3  # duplicates dropped: 8 codes in chunks of 3
+    bodies = [json.loads(call.request.content) for call in route.calls]
+    assert all(len(b["subscriber_code"]) <= 3 and b["send_mail"] is False for b in bodies)
+    assert sorted(result.succeeded) == sorted(f"S{i}" for i in range(7))
+    assert result.failed == ["X1"]
+    assert result.errors == {"X1": "not found"}
+
+
+def test_bulk_reports_failed_chunks_and_retries_them(subs, respx_mock):
+    replies = iter([httpx.Response(500)])
+
+    def reply(request):
+        return next(replies, None) or _bulk_reply(request)
+
+    route = respx_mock.post(f"{BASE}/subscriptions/reactivate").mock(side_effect=reply)
+    result = subs.reactivate_bulk(["A", "B", "C"], chunk_size=2, concurrency=1)
+    assert route.call_count == 2
+    assert result.succeeded == ["C"]
+    assert result.errors["A"].startswith("InternalServerError")
+    assert [f.subscriber_code for f in result.fail_subscriptions] == ["A", "B"]
+
+    replies = iter([httpx.Response(500)])
+    result = subs.reactivate_bulk(["A", "B", "X9"], chunk_size=2, concurrency=1, retry_failed=1)
+    assert sorted(result.succeeded) == ["A", "B"]
+    assert result.errors == {"X9": "not found"}
+
+
+def test_bulk_treats_unreported_codes_as_failures_and_retries_them(subs, respx_mock):
+    replies = iter([httpx.Response(200, text=""), httpx.Response(200, json={
+        "success_subscriptions": [{"subscriber_code": "A"}], "fail_subscriptions": [],
+    })])
+    route = respx_mock.post(f"{BASE}/subscriptions/cancel").mock(side_effect=lambda request: next(replies, None)
+                                                                 or _bulk_reply(request))
+    result = subs.cancel_bulk(["A", "B"], chunk_size=2)
+    assert route.call_count == 1
+    assert result.errors == {"A": "unreported by API", "B": "unreported by API"}
+
+    result = subs.cancel_bulk(["A", "B"], chunk_size=2, retry_failed=1)
+    assert route.call_count == 3
+    assert json.loads(route.calls[2].request.content)["subscriber_code"] == ["B"]
+    assert sorted(result.succeeded) == ["A", "B"]
+    assert result.failed == []
+
+
+def test_async_cancel_bulk(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.subscriptions import AsyncSubscriptions
+
+    route = respx_mock.post(f"{BASE}/subscriptions/cancel").mock(side_effect=_bulk_reply)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+
+    async def run():
+        async with BaseAsyncClient(config) as client:
+            return await AsyncSubscriptions(client).cancel_bulk([f"S{i}" for i in range(5)], chunk_size=2)
+
+    result = asyncio.run(run())
+    assert route.call_count == 3
+    assert sorted(result.succeeded) == [f"S{i}" for i in range(5)]
+    assert result.failed == []
+
+
+def test_purchases_many_streams_results_and_errors(subs, respx_mock):
+    for code in ("A", "B"):
+        respx_mock.get(f"{BASE}/subscriptions/{code}/purchases").mock(
+            return_value=httpx.Response(200, json=[{"transaction": f"HP-{code}"}]))
+    respx_mock.get(f"{BASE}/subscriptions/C/purchases").mock(return_value=httpx.Response(404, json={}))
+    results = dict(subs.purchases_many(iter(["A", "B", "C"]), concurrency=2))
+    assert results["A"][0].transaction == "HP-A"
+    assert results["B"][0].transaction == "HP-B"
+    assert isinstance(results["C"], NotFoundError)
+
+
+def test_change_due_day_many_runs_lazily(subs, respx_mock):
+    route = respx_mock.patch(url__regex=rf"{BASE}/subscriptions/\w+$").mock(return_value=httpx.Response(200))
+    results = subs.change_due_day_many(["A", "B"], 10)
+    assert route.call_count == 0
+    assert sorted(results) == [("A", None), ("B", None)]
+    assert {json.loads(call.request.content)["due_day"] for call in route.calls} == {10}
+
+
+def test_async_transactions_many(respx_mock):
+    import asyncio
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart.resources.subscriptions import AsyncSubscriptions
+
+    for code in ("A", "B", "C"):
+        respx_mock.get(f"{BASE}/subscriptions/{code}/transactions").mock(
+            return_value=httpx.Response(200, json=[{"transaction": f"HP-{code}"}]))
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+
+    async def run():
+        async with BaseAsyncClient(config) as client:
+            return [pair async for pair in AsyncSubscriptions(client).transactions_many(["A", "B", "C"])]
+
+    assert sorted(asyncio.run(run())) == [(c, [{"transaction": f"HP-{c}"}]) for c in "ABC"]
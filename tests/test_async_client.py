@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from hotmart import AsyncHotmart
+from hotmart._base_client import BaseAsyncClient
+from hotmart._config import ClientConfig
+from hotmart._exceptions import AuthenticationError, InternalServerError
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "test_token", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+@pytest.fixture
+def client():
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic dGVzdA==", max_retries=0)
+    return BaseAsyncClient(config)
+
+
+class M(BaseModel):
+    val: int
+
+
+def test_get_returns_deserialized_model(client, respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"val": 1}))
+    result = asyncio.run(client._get("/test", cast_to=M))
+    assert result.val == 1
+
+def test_get_returns_none_for_empty_response(client, respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, text="{}"))
+    assert asyncio.run(client._get("/test")) is None
+
+def test_raises_authentication_error_on_403(client, respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(403))
+    with pytest.raises(AuthenticationError):
+        asyncio.run(client._get("/test"))
+
+def test_raises_internal_server_error_on_500(client, respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(500))
+    with pytest.raises(InternalServerError):
+        asyncio.run(client._get("/test"))
+
+def test_retries_on_500_with_async_sleep(respx_mock, monkeypatch):
+    slept: list[float] = []
+    async def fake_sleep(delay: float) -> None:
+        slept.append(delay)
+    monkeypatch.setattr("asyncio.sleep", fake_sleep)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=2)
+    respx_mock.get(f"{BASE}/test").mock(side_effect=[
+        httpx.Response(500),
+        httpx.Response(200, json={"val": 7}),
+    ])
+    result = asyncio.run(BaseAsyncClient(config)._get("/test", cast_to=M))
+    assert result.val == 7
+    assert len(slept) == 1
+
+def test_401_triggers_token_refresh_and_retries(client, respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(side_effect=[
+        httpx.Response(401),
+        httpx.Response(200, json={"val": 42}),
+    ])
+    result = asyncio.run(client._get("/test", cast_to=M))
+    assert result.val == 42
+
+def test_concurrent_requests_fetch_token_once(client, respx_mock):
+    route = respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"val": 1}))
+    async def run():
+        return await asyncio.gather(*(client._get("/test", cast_to=M) for _ in range(10)))
+    results = asyncio.run(run())
+    assert len(results) == 10
+    assert route.call_count == 10
+    assert respx_mock.routes[0].call_count == 1  # token endpoint
+
+def test_async_context_manager_closes_client():
+    async def run():
+        async with AsyncHotmart(client_id="cid", client_secret="csec", basic="Basic x") as c:
+            assert not c._http.is_closed
+        return c
+    c = asyncio.run(run())
+    assert c._http.is_closed
+
+def test_async_hotmart_exposes_all_resources():
+    c = AsyncHotmart(client_id="cid", client_secret="csec", basic="Basic x")
+    for name in ("sales", "subscriptions", "products", "coupons", "club", "events", "negotiation"):
+        assert getattr(c, name)._client is c
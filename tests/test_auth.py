@@ -79,3 +79,88 @@ def test_concurrent_calls_fetch_token_once(manager, respx_mock):
         t.join()
     assert respx_mock.calls.call_count == 1
     assert all(tok == tokens[0] for tok in tokens)
+
+
+def test_async_concurrent_calls_fetch_token_once(config, respx_mock):
+    import asyncio
+
+    from hotmart._auth import AsyncTokenManager
+
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response("async_tok"))
+    manager = AsyncTokenManager(config)
+
+    async def run():
+        return await asyncio.gather(*(manager.get_token() for _ in range(10)))
+
+    tokens = asyncio.run(run())
+    assert respx_mock.calls.call_count == 1
+    assert set(tokens) == {"async_tok"}
+
+
+def _wait_for(condition, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_background_refresh_renews_before_expiry(respx_mock):
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", background_refresh=True)
+    manager = TokenManager(config)
+    route = respx_mock.post(TOKEN_URL).mock(return_value=_token_response("renewed"))
+    manager._set_token("current", time.time() + 3600)
+    manager._renew_at = time.time() - 1  # inside the background window, outside the inline buffer
+
+    assert manager.get_token() == "current"  # request path does not wait for the refresh
+    assert _wait_for(lambda: manager._token == "renewed")
+    assert route.call_count == 1
+    assert manager._renew_at > time.time()
+    manager.close()
+    manager._refresher.join(timeout=1)
+    assert not manager._refresher.is_alive()
+
+
+def test_background_refresh_retries_after_failure(respx_mock, monkeypatch, caplog):
+    monkeypatch.setattr("hotmart._auth._BACKGROUND_RETRY", 0.01)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", background_refresh=True)
+    manager = TokenManager(config)
+    respx_mock.post(TOKEN_URL).mock(side_effect=[httpx.Response(500), _token_response("renewed")])
+    manager._set_token("current", time.time() + 3600)
+    manager._renew_at = time.time() - 1
+
+    assert manager.get_token() == "current"
+    assert _wait_for(lambda: manager._token == "renewed")
+    assert "background token refresh failed" in caplog.text
+    manager.close()
+
+
+def test_background_refresh_disabled_by_default(manager, respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response())
+    manager.get_token()
+    assert manager._refresher is None
+
+
+def test_async_background_refresh(respx_mock):
+    import asyncio
+
+    from hotmart._auth import AsyncTokenManager
+
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", background_refresh=True)
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response("renewed"))
+
+    async def run():
+        manager = AsyncTokenManager(config)
+        manager._set_token("current", time.time() + 3600)
+        manager._renew_at = time.time() - 1
+        first = await manager.get_token()
+        for _ in range(300):
+            if manager._token == "renewed":
+                break
+            await asyncio.sleep(0.01)
+        renewed = manager._token
+        await manager.aclose()
+        return first, renewed, manager._refresher
+
+    assert asyncio.run(run()) == ("current", "renewed", None)
@@ -0,0 +1,32 @@
+import pytest
+
+from benchmarks._server import ServerConfig
+from benchmarks.run import SCENARIOS, format_table, run_all
+
+CONFIG = ServerConfig(pages=2, page_size=5)
+
+
+@pytest.mark.parametrize("name", sorted(n for n in SCENARIOS if n != "export_parquet"))
+def test_scenario_smoke(name):
+    [result] = run_all([name], CONFIG, memory=False)
+    assert result.items > 0
+    assert result.requests >= 2
+    assert result.peak_mib is None
+
+
+def test_memory_pass_and_table():
+    results = run_all(["history_raw"], CONFIG)
+    assert results[0].items == 10
+    assert results[0].peak_mib is not None
+    assert "history_raw" in format_table(results)
+
+
+def test_startup_benchmark():
+    from benchmarks.startup import format_table, measure
+
+    imported, constructed, first = (measure(stage, runs=1) for stage in ("import", "construct", "first_resource"))
+    assert imported.modules < 5  # `import hotmart` must stay lazy
+    assert constructed.resources == 0  # resources are built on first access
+    assert 0 < first.resources <= 3  # hotmart.resources, its base and sales only
+    assert first.modules - constructed.modules < 15
+    assert all(stage in format_table([imported, constructed, first]) for stage in ("import", "construct", "first"))
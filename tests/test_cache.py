@@ -0,0 +1,285 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from hotmart import (
+    CachedResponse,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    MetricsCollector,
+    ResponseCache,
+)
+from hotmart._base_client import BaseAsyncClient, BaseSyncClient
+from hotmart._config import ClientConfig
+from hotmart._exceptions import NotFoundError
+from hotmart.models.pagination import PaginatedResponse
+from hotmart.models.products import ProductItem
+from hotmart.resources.products import Products
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+PRODUCTS = "https://developers.hotmart.com/products/api/v1"
+PAYMENTS = "https://developers.hotmart.com/payments/api/v1"
+CLUB = "https://developers.hotmart.com/club/api/v1"
+PAGE = {"items": [{"id": 1, "name": "Course"}], "page_info": {}}
+
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+
+def _config(cache, **overrides):
+    return ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", response_cache=cache, **overrides)
+
+
+def test_catalog_lookups_are_served_from_cache(respx_mock):
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    cache = ResponseCache()
+    products = Products(BaseSyncClient(_config(cache)))
+    first = products.list(status="ACTIVE")
+    second = products.list(status="ACTIVE")
+    assert route.call_count == 1
+    assert second.items[0].name == first.items[0].name == "Course"
+    assert second is not first  # every hit is parsed again, so callers cannot mutate the cache
+    products.list(status="DRAFT")
+    assert route.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_only_configured_endpoints_are_cached(respx_mock):
+    route = respx_mock.get(f"{PAYMENTS}/sales/history").mock(return_value=httpx.Response(200, json=PAGE))
+    client = BaseSyncClient(_config(ResponseCache()))
+    client._get("/sales/history")
+    client._get("/sales/history")
+    assert route.call_count == 2
+
+
+def test_pattern_ttls_and_expiry(respx_mock, monkeypatch):
+    route = respx_mock.get(f"{PRODUCTS}/products/u1/offers").mock(return_value=httpx.Response(200, json=PAGE))
+    now = [1000.0]
+    monkeypatch.setattr("hotmart._cache.time.time", lambda: now[0])
+    client = BaseSyncClient(_config(ResponseCache(ttls={"/products/*/offers": 10})))
+    client._get("/products/u1/offers", api_domain="products")
+    now[0] += 9
+    client._get("/products/u1/offers", api_domain="products")
+    assert route.call_count == 1
+    now[0] += 2
+    client._get("/products/u1/offers", api_domain="products")
+    assert route.call_count == 2
+
+
+def test_errors_are_not_cached(respx_mock):
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(side_effect=[
+        httpx.Response(404, json={}), httpx.Response(200, json=PAGE),
+    ])
+    client = BaseSyncClient(_config(ResponseCache(), max_retries=0))
+    with pytest.raises(NotFoundError):
+        client._get("/products", api_domain="products")
+    assert client._get("/products", api_domain="products") == PAGE
+    assert route.call_count == 2
+
+
+def test_hits_follow_the_callers_response_mode(respx_mock):
+    respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    client = BaseSyncClient(_config(ResponseCache()))
+    model = client._get("/products", api_domain="products", cast_to=PaginatedResponse[ProductItem])
+    raw = client.with_options(response_mode="raw")._get(
+        "/products", api_domain="products", cast_to=PaginatedResponse[ProductItem]
+    )
+    assert model.items[0].id == 1
+    assert raw == PAGE
+
+
+def test_credentials_do_not_share_entries(respx_mock):
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    cache = ResponseCache()
+    BaseSyncClient(_config(cache))._get("/products", api_domain="products")
+    other = ClientConfig(client_id="other", client_secret="x", basic="Basic y", response_cache=cache)
+    BaseSyncClient(other)._get("/products", api_domain="products")
+    assert route.call_count == 2
+
+
+def test_invalidate(respx_mock):
+    route = respx_mock.get(url__startswith=f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    cache = ResponseCache()
+    client = BaseSyncClient(_config(cache))
+    for path in ("/products", "/products/u1/plans", "/products/u2/plans"):
+        client._get(path, api_domain="products")
+    assert cache.invalidate("/products/u1/*") == 1
+    client._get("/products/u1/plans", api_domain="products")
+    client._get("/products/u2/plans", api_domain="products")
+    assert route.call_count == 4
+    cache.invalidate()
+    client._get("/products", api_domain="products")
+    assert route.call_count == 5
+
+
+def test_memory_backend_is_lru():
+    backend = MemoryCacheBackend(max_entries=2)
+    entry = CachedResponse(path="/p", content=b"{}", expires_at=time.time() + 60)
+    backend.set("a", entry)
+    backend.set("b", entry)
+    backend.get("a")
+    backend.set("c", entry)
+    assert sorted(backend.keys()) == ["a", "c"]
+
+
+def test_file_backend_round_trip_and_eviction(tmp_path):
+    backend = FileCacheBackend(tmp_path, max_entries=2)
+    entry = CachedResponse(path="/p", content=b'{"x": "\xc3\xa9"}', expires_at=123.0, headers={"ETag": '"v1"'})
+    backend.set("a", entry)
+    assert backend.get("a") == entry
+    backend.set("b", entry)
+    backend.set("c", entry)
+    assert len(backend.keys()) == 2
+    backend.delete("c")
+    backend.clear()
+    assert backend.keys() == []
+
+
+def test_file_backend_sweeps_in_batches_and_tolerates_concurrent_deletes(tmp_path, monkeypatch):
+    backend = FileCacheBackend(tmp_path, max_entries=20)
+    entry = CachedResponse(path="/p", content=b"{}", expires_at=123.0)
+    for n in range(21):
+        backend.set(str(n), entry)
+    assert len(backend.keys()) == 20
+    backend.set("21", entry)
+    assert len(backend.keys()) == 21  # within the margin until the next sweep
+    listed = backend._files()
+    backend.delete("21")  # removed by another process between the listing and the stat
+    monkeypatch.setattr(backend, "_files", lambda: listed)
+    backend.set("22", entry)
+    monkeypatch.undo()
+    assert len(backend.keys()) == 21
+
+
+def test_file_backend_is_shared_between_clients(respx_mock, tmp_path):
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    BaseSyncClient(_config(ResponseCache(FileCacheBackend(tmp_path))))._get("/products", api_domain="products")
+    BaseSyncClient(_config(ResponseCache(FileCacheBackend(tmp_path))))._get("/products", api_domain="products")
+    assert route.call_count == 1
+
+
+def test_cache_metrics(respx_mock):
+    respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    metrics = MetricsCollector()
+    client = BaseSyncClient(_config(ResponseCache(), hooks=[metrics]))
+    client._get("/products", api_domain="products")
+    client._get("/products", api_domain="products")
+    text = metrics.to_prometheus()
+    assert 'hotmart_cache_requests_total{method="GET",path="/products",result="hit"} 1' in text
+    assert 'hotmart_cache_requests_total{method="GET",path="/products",result="miss"} 1' in text
+
+
+def test_async_client_uses_cache(respx_mock):
+    route = respx_mock.get(f"{CLUB}/modules").mock(return_value=httpx.Response(200, json=[{"module_id": "m1"}]))
+
+    async def run():
+        async with BaseAsyncClient(_config(ResponseCache())) as client:
+            await client._get("/modules", api_domain="club")
+            return await client._get("/modules", api_domain="club")
+
+    assert asyncio.run(run()) == [{"module_id": "m1"}]
+    assert route.call_count == 1
+
+
+def test_stale_entries_are_revalidated_with_validators(respx_mock):
+    validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(side_effect=[
+        httpx.Response(200, json=PAGE, headers=validators),
+        httpx.Response(304, headers={"ETag": '"v1"'}),
+    ])
+    cache = ResponseCache(ttls={"/products": 0})
+    products = Products(BaseSyncClient(_config(cache)))
+    first = products.list()
+    second = products.list()
+    assert route.call_count == 2
+    assert "if-none-match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert route.calls[1].request.headers["If-Modified-Since"] == validators["Last-Modified"]
+    assert second.items[0].name == "Course"
+    assert second is not first  # parsed again unless reuse_models is set
+    assert (cache.not_modified, cache.bytes_saved) == (1, len(route.calls[0].response.content))
+
+
+def test_reuse_models_skips_parsing_on_304(respx_mock):
+    respx_mock.get(f"{PRODUCTS}/products").mock(side_effect=[
+        httpx.Response(200, json=PAGE, headers={"ETag": '"v1"'}),
+        httpx.Response(304),
+        httpx.Response(200, json={"items": [], "page_info": {}}, headers={"ETag": '"v2"'}),
+    ])
+    metrics = MetricsCollector()
+    cache = ResponseCache(ttls={"/products": 0}, reuse_models=True)
+    products = Products(BaseSyncClient(_config(cache, hooks=[metrics])))
+    first = products.list()
+    assert products.list() is first
+    assert products.list().items == []  # a 200 replaces the entry and its model
+    text = metrics.to_prometheus()
+    assert 'hotmart_not_modified_total{method="GET",path="/products"} 1' in text
+    size = len(httpx.Response(200, json=PAGE).content)
+    assert f'hotmart_bytes_saved_total{{method="GET",path="/products"}} {size}' in text
+    assert cache.validation_saved > 0
+
+
+def test_reuse_models_skips_parsing_on_fresh_hits(respx_mock):
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(
+        return_value=httpx.Response(200, json=PAGE, headers={"ETag": '"v1"'})
+    )
+    cache = ResponseCache(ttls={"/products": 60}, reuse_models=True)
+    products = Products(BaseSyncClient(_config(cache)))
+    first = products.list()
+    assert products.list() is first
+    assert route.call_count == 1
+
+
+def test_entries_without_validators_are_refetched(respx_mock):
+    route = respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    client = BaseSyncClient(_config(ResponseCache(ttls={"/products": 0})))
+    client._get("/products", api_domain="products")
+    client._get("/products", api_domain="products")
+    assert route.call_count == 2
+    assert "if-none-match" not in route.calls[1].request.headers
+    assert "if-modified-since" not in route.calls[1].request.headers
+
+
+def test_async_client_revalidates(respx_mock):
+    route = respx_mock.get(f"{CLUB}/modules").mock(side_effect=[
+        httpx.Response(200, json=[{"module_id": "m1"}], headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+        httpx.Response(304),
+    ])
+
+    async def run():
+        async with BaseAsyncClient(_config(ResponseCache(ttls={"/modules": 0}))) as client:
+            await client._get("/modules", api_domain="club")
+            return await client._get("/modules", api_domain="club")
+
+    assert asyncio.run(run()) == [{"module_id": "m1"}]
+    assert "If-Modified-Since" in route.calls[1].request.headers
+
+
+def test_async_client_reads_and_writes_file_cache_off_the_loop(respx_mock, tmp_path):
+    import threading
+
+    respx_mock.get(f"{PRODUCTS}/products").mock(return_value=httpx.Response(200, json=PAGE))
+    backend = FileCacheBackend(tmp_path)
+    threads = set()
+    for name in ("get", "set"):
+        method = getattr(backend, name)
+
+        def record(*args, method=method):
+            threads.add(threading.get_ident())
+            return method(*args)
+
+        setattr(backend, name, record)
+
+    async def run():
+        async with BaseAsyncClient(_config(ResponseCache(backend))) as client:
+            await client._get("/products", api_domain="products")
+            return await client._get("/products", api_domain="products")
+
+    assert asyncio.run(run()) == PAGE
+    assert threads and threading.get_ident() not in threads
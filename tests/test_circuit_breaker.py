@@ -0,0 +1,149 @@
+import asyncio
+
+import httpx
+import pytest
+
+from hotmart import CircuitBreaker, CircuitOpenError, MetricsCollector
+from hotmart._base_client import BaseAsyncClient, BaseSyncClient
+from hotmart._config import ClientConfig
+from hotmart._exceptions import InternalServerError, NotFoundError
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
+CLUB = "https://developers.hotmart.com/club/api/v1"
+
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("hotmart._circuit_breaker.time.monotonic", lambda: now[0])
+    return now
+
+
+def _client(breaker, **overrides):
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x",
+                          circuit_breaker=breaker, **{"max_retries": 0, **overrides})
+    return BaseSyncClient(config)
+
+
+def test_opens_at_failure_rate():
+    breaker = CircuitBreaker(failure_threshold=0.5, minimum_calls=4, window_size=4)
+    for failure in (False, True, False):
+        assert breaker.record("payments", failure=failure) is None
+    assert breaker.record("payments", failure=True) == "open"
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.before_call("payments")
+    assert info.value.api_domain == "payments"
+    assert info.value.retry_after > 0
+    assert breaker.state("club") == "closed"
+
+
+def test_window_forgets_old_failures():
+    breaker = CircuitBreaker(failure_threshold=0.5, minimum_calls=4, window_size=4)
+    for failure in (True, False, False, False, False, True, False):
+        assert breaker.record("payments", failure=failure) is None
+    assert breaker.state("payments") == "closed"
+
+
+def test_half_open_probe_closes_or_reopens(clock):
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1, recovery_timeout=10)
+    breaker.record("payments", failure=True)
+    clock[0] += 10
+    assert breaker.before_call("payments") == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("payments")  # only one probe at a time
+    assert breaker.record("payments", failure=True) == "open"
+
+    clock[0] += 10
+    breaker.before_call("payments")
+    assert breaker.record("payments", failure=False) == "closed"
+    assert breaker.before_call("payments") is None
+
+
+def test_lost_probe_slot_expires(clock):
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1, recovery_timeout=10)
+    breaker.record("payments", failure=True)
+    clock[0] += 10
+    breaker.before_call("payments")  # this probe never reports back
+    clock[0] += 10
+    assert breaker.before_call("payments") is None
+
+
+def test_client_fails_fast_without_retrying(respx_mock, monkeypatch):
+    monkeypatch.setattr("hotmart._base_client.get_retry_delay", lambda attempt, response=None: 0.0)
+    route = respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(503))
+    breaker = CircuitBreaker(minimum_calls=2, window_size=2, recovery_timeout=60)
+    client = _client(breaker, max_retries=5)
+    with pytest.raises(CircuitOpenError):
+        client._get("/test")
+    assert route.call_count == 2  # opened after two failures instead of running all six attempts
+    with pytest.raises(CircuitOpenError):
+        client._get("/test")
+    assert route.call_count == 2
+
+
+def test_other_domains_and_client_errors_do_not_trip(respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(404, json={}))
+    respx_mock.get(f"{CLUB}/test").mock(return_value=httpx.Response(500))
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+    client = _client(breaker)
+    with pytest.raises(InternalServerError):
+        client._get("/test", api_domain="club")
+    assert breaker.state("club") == "open"
+    with pytest.raises(NotFoundError):
+        client._get("/test")
+    assert breaker.state("payments") == "closed"
+
+
+def test_transport_errors_count_as_failures(respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(side_effect=httpx.ConnectError("down"))
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+    with pytest.raises(httpx.ConnectError):
+        _client(breaker)._get("/test")
+    assert breaker.state("payments") == "open"
+
+
+def test_resend_after_401_goes_through_the_breaker(respx_mock):
+    breaker = CircuitBreaker(failure_threshold=0.5, minimum_calls=2, window_size=2)
+    route = respx_mock.get(f"{BASE}/test").mock(side_effect=[httpx.Response(401), httpx.Response(500)])
+    client = _client(breaker)
+    with pytest.raises(InternalServerError):
+        client._get("/test")
+    assert route.call_count == 2
+    with pytest.raises(CircuitOpenError):  # the resent request's 500 was recorded
+        client._get("/test")
+
+
+def test_state_changes_are_exported_as_metrics(respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(500))
+    metrics = MetricsCollector()
+    client = _client(CircuitBreaker(minimum_calls=1, window_size=1), hooks=[metrics])
+    with pytest.raises(InternalServerError):
+        client._get("/test")
+    text = metrics.to_prometheus()
+    assert "# TYPE hotmart_circuit_state gauge" in text
+    assert 'hotmart_circuit_state{api_domain="payments"} 2' in text
+    assert 'hotmart_circuit_transitions_total{api_domain="payments",state="open"} 1' in text
+    assert 'error="CircuitOpenError"' not in text
+
+
+def test_async_client_uses_breaker(respx_mock):
+    route = respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(502))
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=3,
+                          circuit_breaker=breaker)
+
+    async def run():
+        async with BaseAsyncClient(config) as client:
+            await client._get("/test")
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(run())
+    assert route.call_count == 1
@@ -98,3 +98,97 @@ def test_uses_sandbox_url(respx_mock):
     c = BaseSyncClient(config)
     result = c._get("/test", cast_to=M)
     assert result.x == 1
+
+def test_raw_response_mode_returns_dict(respx_mock):
+    from pydantic import BaseModel
+    class M(BaseModel):
+        x: int
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"x": "1"}))
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0,
+                          response_mode="raw")
+    assert BaseSyncClient(config)._get("/test", cast_to=M) == {"x": "1"}
+
+def test_with_options_overrides_mode_and_shares_state(client, respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"x": 1}))
+    raw = client.with_options(response_mode="raw")
+    assert raw._config.response_mode == "raw"
+    assert client._config.response_mode == "validate"
+    assert raw._http is client._http
+    assert raw._token_manager is client._token_manager
+    assert raw._rate_limiter is client._rate_limiter
+
+def test_with_options_rebinds_hotmart_resources():
+    from hotmart import Hotmart
+    c = Hotmart(client_id="cid", client_secret="csec", basic="Basic x")
+    raw = c.with_options(response_mode="raw")
+    assert raw.sales._client is raw
+    assert c.sales._client is c
+
+
+def _mock_api(seen: list[str]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path.endswith("/oauth/token"):
+            return httpx.Response(200, json={"access_token": "pooled", "token_type": "bearer", "expires_in": 86400})
+        assert request.headers["authorization"] == "Bearer pooled"
+        return httpx.Response(200, json={"items": [], "page_info": {}})
+
+    return httpx.MockTransport(handler)
+
+
+def test_custom_transport_serves_auth_and_api_calls():
+    from hotmart import Hotmart
+
+    seen: list[str] = []
+    with Hotmart(client_id="cid", client_secret="csec", basic="Basic x", transport=_mock_api(seen)) as hotmart:
+        hotmart.sales.history()
+    assert seen == ["/security/oauth/token", "/payments/api/v1/sales/history"]
+
+
+def test_pool_limits_come_from_config():
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x",
+                          max_connections=7, max_keepalive_connections=3, keepalive_expiry=30.0)
+    limits = config.limits()
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (7, 3, 30.0)
+    client = BaseSyncClient(config)
+    assert client._http._transport._pool._max_connections == 7
+
+
+def test_injected_http_client_is_shared_and_left_open():
+    from hotmart import Hotmart
+
+    seen: list[str] = []
+    shared = httpx.Client(transport=_mock_api(seen))
+    first = Hotmart(client_id="cid", client_secret="csec", basic="Basic x", http_client=shared)
+    second = Hotmart(client_id="cid2", client_secret="csec", basic="Basic x", http_client=shared)
+    assert first._http is second._http is shared
+    first.sales.history()
+    first.close()
+    second.sales.history()
+    assert not shared.is_closed
+    shared.close()
+
+
+def test_http_client_type_must_match_client():
+    from hotmart import AsyncHotmart, Hotmart
+
+    with pytest.raises(TypeError):
+        Hotmart(client_id="cid", client_secret="csec", basic="Basic x", http_client=httpx.AsyncClient())
+    with pytest.raises(TypeError):
+        AsyncHotmart(client_id="cid", client_secret="csec", basic="Basic x", http_client=httpx.Client())
+
+
+def test_async_client_reuses_pool_for_auth():
+    import asyncio
+
+    from hotmart import AsyncHotmart
+
+    seen: list[str] = []
+
+    async def run():
+        async with AsyncHotmart(client_id="cid", client_secret="csec", basic="Basic x",
+                                transport=_mock_api(seen)) as hotmart:
+            await hotmart.sales.history()
+
+    asyncio.run(run())
+    assert seen == ["/security/oauth/token", "/payments/api/v1/sales/history"]
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from hotmart import Hooks
+from hotmart._base_client import BaseAsyncClient, BaseSyncClient
+from hotmart._coalesce import AsyncSingleFlight, SingleFlight
+from hotmart._config import ClientConfig
+from hotmart._exceptions import NotFoundError
+from hotmart.models.products import OfferItem
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
+
+
+class Joins(Hooks):
+    def __init__(self):
+        self.count = 0
+
+    def on_coalesced(self, request):
+        self.count += 1
+
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+
+def _config(**overrides):
+    return ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0,
+                        coalesce_requests=True, **overrides)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _concurrent_gets(respx_mock, path, response, callers=5):
+    """First caller's request blocks in the transport until every other caller has joined it."""
+    joins = Joins()
+    client = BaseSyncClient(_config(hooks=[joins]))
+    started, release = threading.Event(), threading.Event()
+
+    def slow(request):
+        started.set()
+        release.wait(5)
+        return response
+
+    route = respx_mock.get(f"{BASE}{path}").mock(side_effect=slow)
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(client._get(path, cast_to=OfferItem))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    threads[0].start()
+    assert started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    _wait_for(lambda: joins.count == callers - 1)
+    release.set()
+    for t in threads:
+        t.join()
+    return route, results, errors
+
+
+def test_identical_gets_share_one_call_and_result(respx_mock):
+    route, results, errors = _concurrent_gets(respx_mock, "/offers", httpx.Response(200, json={"code": "off1"}))
+    assert route.call_count == 1
+    assert len(results) == 5 and not errors
+    assert all(r is results[0] for r in results)
+
+
+def test_errors_are_shared(respx_mock):
+    route, results, errors = _concurrent_gets(respx_mock, "/missing", httpx.Response(404, json={}), callers=3)
+    assert route.call_count == 1
+    assert len(errors) == 3 and all(isinstance(e, NotFoundError) for e in errors)
+
+
+def test_sequential_and_different_requests_are_not_coalesced(respx_mock):
+    route = respx_mock.get(url__startswith=f"{BASE}/offers").mock(return_value=httpx.Response(200, json={}))
+    client = BaseSyncClient(_config())
+    client._get("/offers", params={"a": 1})
+    client._get("/offers", params={"a": 1})
+    client._get("/offers", params={"a": 2})
+    assert route.call_count == 3
+
+
+def test_disabled_by_default():
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x")
+    assert BaseSyncClient(config)._inflight is None
+
+
+def test_async_gets_share_one_call(respx_mock):
+    route = respx_mock.get(f"{BASE}/offers").mock(return_value=httpx.Response(200, json={"code": "off1"}))
+
+    async def run():
+        async with BaseAsyncClient(_config()) as client:
+            return await asyncio.gather(*(client._get("/offers", cast_to=OfferItem) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert route.call_count == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_async_cancelled_waiter_does_not_cancel_others():
+    flight = AsyncSingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("done", True)
+
+
+def test_single_flight_clears_key_after_call():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
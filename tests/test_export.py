@@ -0,0 +1,90 @@
+import csv
+import json
+
+import pytest
+
+from hotmart._export import Exporter, model_columns
+from hotmart.models.sales import SaleHistoryItem
+
+ITEMS = [
+    {
+        "product": {"id": 1, "name": "Course"},
+        "buyer": {"name": "Paula", "email": "p@example.com"},
+        "purchase": {"transaction": f"HP{n}", "order_date": 1700000000000 + n,
+                     "price": {"value": 97.0, "currency_code": "BRL"},
+                     "payment": {"type": "PIX", "installments_number": 1},
+                     "hotmart_fee": {"total": 9.7}},
+    }
+    for n in range(5)
+]
+
+
+def test_model_columns_flattens_nested_models():
+    columns = dict(model_columns(SaleHistoryItem))
+    assert columns[("purchase", "price", "value")] == "float"
+    assert columns[("purchase", "order_date")] == "int"
+    assert columns[("purchase", "payment", "type")] == "str"
+    assert columns[("purchase", "hotmart_fee", "total")] == "float"
+    assert columns[("buyer", "email")] == "str"
+
+
+def test_csv_export_writes_header_and_rows(tmp_path):
+    path = tmp_path / "sales.csv"
+    with Exporter(path, model=SaleHistoryItem, format="csv", batch_size=2) as out:
+        for item in ITEMS:
+            out.add(item)
+    assert out.rows_written == 5
+    rows = list(csv.DictReader(path.open()))
+    assert len(rows) == 5
+    assert rows[0]["purchase.transaction"] == "HP0"
+    assert rows[0]["purchase.price.value"] == "97.0"
+    assert rows[0]["producer.name"] == ""
+
+
+def test_ndjson_export_keeps_nested_items(tmp_path):
+    path = tmp_path / "sales.ndjson"
+    with Exporter(path, model=SaleHistoryItem, format="ndjson") as out:
+        for item in ITEMS:
+            out.add(item)
+    lines = path.read_text().splitlines()
+    assert json.loads(lines[4]) == ITEMS[4]
+
+
+def test_parquet_export_writes_row_group_per_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "sales.parquet"
+    with Exporter(path, model=SaleHistoryItem, format="parquet", batch_size=2) as out:
+        for item in ITEMS:
+            out.add(item)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 5
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read(columns=["purchase.transaction", "purchase.price.value"])
+    assert table.column("purchase.transaction").to_pylist()[0] == "HP0"
+
+
+def test_exporter_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        Exporter(tmp_path / "x", model=SaleHistoryItem, format="xlsx")
+
+
+def test_coerce_is_lossless():
+    from hotmart._export import _coerce
+
+    assert _coerce("false", "bool") is False
+    assert _coerce("True", "bool") is True
+    assert _coerce(12.0, "int") == 12
+    assert _coerce("12", "int") == 12
+    assert _coerce("9.5", "float") == 9.5
+    for value, kind in [(12.9, "int"), ("abc", "int"), ("maybe", "bool"), (2, "bool"), (True, "int")]:
+        with pytest.raises(ValueError):
+            _coerce(value, kind)
+    assert _coerce(12.9, "int", strict=False) == "12.9"
+
+
+def test_parquet_export_rejects_lossy_values(tmp_path):
+    pytest.importorskip("pyarrow")
+    item = {**ITEMS[0], "purchase": {**ITEMS[0]["purchase"], "order_date": 1700000000000.5}}
+    with pytest.raises(ValueError, match="order_date|1700000000000.5"), \
+            Exporter(tmp_path / "out.parquet", model=SaleHistoryItem, format="parquet") as out:
+        out.add(item)
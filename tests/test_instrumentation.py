@@ -0,0 +1,186 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from hotmart import Hooks, MetricsCollector
+from hotmart._base_client import BaseAsyncClient, BaseSyncClient
+from hotmart._config import ClientConfig
+from hotmart._exceptions import InternalServerError, NotFoundError
+from hotmart._instrumentation import route
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
+
+
+class Item(BaseModel):
+    foo: str
+
+
+class Recorder(Hooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, request):
+        self.events.append(("request", request.method, request.path))
+
+    def on_rate_limit_wait(self, request, *, priority, delay):
+        self.events.append(("wait", priority))
+
+    def on_response(self, request, *, status_code, duration, bytes_sent, bytes_received):
+        self.events.append(("response", status_code, bytes_received))
+
+    def on_retry(self, request, *, attempt, delay, status_code):
+        self.events.append(("retry", attempt, status_code))
+
+    def on_validation(self, request, *, model, mode, duration):
+        self.events.append(("validation", model, mode))
+
+    def on_request_end(self, request, *, duration, error):
+        self.events.append(("end", type(error).__name__ if error else None))
+
+    def on_token_refresh(self, *, duration, error):
+        self.events.append(("token", error))
+
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+
+def _config(*hooks, **overrides):
+    return ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", hooks=hooks, **overrides)
+
+
+def test_no_hooks_means_no_dispatcher():
+    client = BaseSyncClient(_config())
+    assert client._hooks is None
+    assert client._token_manager._hooks is None
+
+
+def test_events_in_order(respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+    recorder = Recorder()
+    assert BaseSyncClient(_config(recorder))._get("/test", cast_to=Item).foo == "bar"
+    assert recorder.events == [
+        ("request", "GET", "/test"),
+        ("token", None),
+        ("response", 200, 13),
+        ("validation", "Item", "validate"),
+        ("end", None),
+    ]
+
+
+def test_retry_and_error_events(respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(side_effect=[
+        httpx.Response(429, headers={"RateLimit-Reset": "0"}),
+        httpx.Response(404, json={}),
+    ])
+    recorder = Recorder()
+    with pytest.raises(NotFoundError):
+        BaseSyncClient(_config(recorder, max_retries=1))._get("/test", cast_to=Item)
+    assert recorder.events[2:] == [
+        ("response", 429, 0),
+        ("retry", 1, 429),
+        ("response", 404, 2),
+        ("end", "NotFoundError"),
+    ]
+
+
+def test_rate_limit_wait_event(respx_mock):
+    class SlowPolicy:
+        def reserve(self, api_domain, priority="interactive"):
+            return 0.001
+
+        def update(self, headers, api_domain="payments"):
+            pass
+
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+    recorder = Recorder()
+    BaseSyncClient(_config(recorder, rate_limiter=SlowPolicy(), priority="batch"))._get("/test", cast_to=Item)
+    assert recorder.events[1] == ("wait", "batch")
+
+
+def test_failing_hook_does_not_break_request(respx_mock, caplog):
+    class Broken(Hooks):
+        def on_response(self, request, **_):
+            raise RuntimeError("boom")
+
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+    recorder = Recorder()
+    result = BaseSyncClient(_config(Broken(), recorder))._get("/test", cast_to=Item)
+    assert result.foo == "bar"
+    assert ("response", 200, 13) in recorder.events
+    assert "on_response" in caplog.text
+
+
+def test_async_client_emits_events(respx_mock):
+    respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+    recorder = Recorder()
+
+    async def run():
+        async with BaseAsyncClient(_config(recorder)) as client:
+            return await client._get("/test", cast_to=Item)
+
+    assert asyncio.run(run()).foo == "bar"
+    assert [e[0] for e in recorder.events] == ["request", "token", "response", "validation", "end"]
+
+
+def test_route_collapses_ids():
+    assert route("/subscriptions/ABC123/cancel") == "/subscriptions/{id}/cancel"
+    assert route("/coupon/product/4567") == "/coupon/product/{id}"
+    assert route("/sales/history") == "/sales/history"
+
+
+def test_metrics_collector_prometheus(respx_mock):
+    respx_mock.get(f"{BASE}/coupon/product/1").mock(return_value=httpx.Response(200, json={"foo": "a"}))
+    respx_mock.get(f"{BASE}/coupon/product/2").mock(return_value=httpx.Response(500))
+    metrics = MetricsCollector(buckets=(0.5, 30.0))
+    client = BaseSyncClient(_config(metrics, max_retries=0))
+    client._get("/coupon/product/1", cast_to=Item)
+    with pytest.raises(InternalServerError):
+        client._get("/coupon/product/2", cast_to=Item)
+
+    snapshot = metrics.snapshot()
+    statuses = {e["labels"]["status"]: e["value"] for e in snapshot["hotmart_requests_total"]}
+    assert statuses == {"200": 1, "500": 1}
+    [latency] = snapshot["hotmart_request_duration_seconds"]
+    assert latency["labels"] == {"method": "GET", "path": "/coupon/product/{id}"}
+    assert latency["count"] == 2
+
+    text = metrics.to_prometheus()
+    assert "# TYPE hotmart_request_duration_seconds histogram" in text
+    assert 'hotmart_request_duration_seconds_bucket{method="GET",path="/coupon/product/{id}",le="+Inf"} 2' in text
+    assert 'hotmart_requests_total{method="GET",path="/coupon/product/{id}",status="500"} 1' in text
+    assert ('hotmart_request_errors_total{method="GET",path="/coupon/product/{id}",'
+            'error="InternalServerError"} 1') in text
+    assert "hotmart_token_refresh_duration_seconds_count 1" in text
+
+    metrics.reset()
+    assert metrics.to_prometheus() == ""
+
+
+def test_opentelemetry_spans(respx_mock):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from hotmart import OpenTelemetryHooks
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    respx_mock.get(f"{BASE}/subscriptions/S1/x").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+
+    hooks = OpenTelemetryHooks(provider.get_tracer("test"))
+    BaseSyncClient(_config(hooks))._get("/subscriptions/S1/x", cast_to=Item)
+
+    token, call = exporter.get_finished_spans()
+    assert token.name == "hotmart token refresh"
+    assert call.name == "GET /subscriptions/{id}/x"
+    assert call.attributes["http.response.status_code"] == 200
+    assert [e.name for e in call.events] == ["response", "validation"]
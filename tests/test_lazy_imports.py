@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import hotmart
+import hotmart.models
+from hotmart import Hotmart
+
+CREDENTIALS = {"client_id": "cid", "client_secret": "csec", "basic": "Basic x"}
+
+
+def _loaded_after(code):
+    script = f"import sys\n{code}\nprint(' '.join(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+    return set(out.stdout.split())
+
+
+def test_import_loads_nothing_heavy():
+    loaded = _loaded_after("import hotmart")
+    assert not {"httpx", "pydantic", "hotmart._client", "hotmart.models"} & loaded
+
+
+def test_resources_are_imported_on_first_access():
+    setup = "import hotmart\nclient = hotmart.Hotmart(client_id='a', client_secret='b', basic='c')"
+    loaded = _loaded_after(setup)
+    assert not any(name.startswith(("hotmart.resources", "hotmart.models")) for name in loaded)
+    loaded = _loaded_after(f"{setup}\nclient.sales")
+    assert "hotmart.resources.sales" in loaded
+    assert "hotmart.resources.club" not in loaded
+
+
+def test_every_export_resolves():
+    for module in (hotmart, hotmart.models):
+        for name in module.__all__:
+            assert getattr(module, name) is not None, name
+        assert set(module.__all__) <= set(dir(module))
+
+
+def test_resources_are_cached_and_rebound_by_with_options():
+    client = Hotmart(**CREDENTIALS)
+    assert client.sales is client.sales
+    assert client.sales._client is client
+    raw = client.with_options(response_mode="raw")
+    assert raw.sales._client is raw
+    assert client.sales._client is client
@@ -0,0 +1,122 @@
+import asyncio
+
+import httpx
+import pytest
+
+from hotmart import PaginationCursor
+from hotmart._base_client import BaseAsyncClient, BaseSyncClient
+from hotmart._config import ClientConfig
+from hotmart.resources.coupons import Coupons
+from hotmart.resources.sales import AsyncSales, Sales
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
+
+PAGE1 = {
+    "items": [{"purchase": {"transaction": "HP1"}}, {"purchase": {"transaction": "HP2"}}],
+    "page_info": {"next_page_token": "tok2"},
+}
+PAGE2 = {
+    "items": [{"purchase": {"transaction": "HP3"}}, {"purchase": {"transaction": "HP4"}}],
+    "page_info": {},
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+
+@pytest.fixture
+def config():
+    return ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+
+
+def pages(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=PAGE2 if request.url.params.get("page_token") == "tok2" else PAGE1)
+
+
+def test_cursor_json_round_trip():
+    cursor = PaginationCursor(method="Sales.history", args=("p1",), filters={"buyer_name": "Paula"},
+                              page_token="tok2", offset=1)
+    assert PaginationCursor.from_json(cursor.to_json()) == cursor
+
+
+def test_cursor_tracks_position(config, respx_mock):
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=pages)
+    pager = Sales(BaseSyncClient(config)).history_autopaginate(buyer_name="Paula")
+    next(pager)
+    next(pager)
+    next(pager)
+    cursor = pager.cursor
+    assert (cursor.method, cursor.page_token, cursor.offset) == ("Sales.history", "tok2", 1)
+    assert cursor.filters == {"buyer_name": "Paula"}
+    list(pager)
+    assert pager.cursor.exhausted
+
+
+def test_resume_skips_consumed_items(config, respx_mock):
+    route = respx_mock.get(f"{BASE}/sales/history").mock(side_effect=pages)
+    sales = Sales(BaseSyncClient(config))
+    pager = sales.history_autopaginate(buyer_name="Paula")
+    next(pager)
+    next(pager)
+    next(pager)
+    saved = pager.cursor.to_json()
+
+    resumed = sales.history_autopaginate(resume_from=PaginationCursor.from_json(saved))
+    assert [i.purchase.transaction for i in resumed] == ["HP4"]
+    assert route.calls[-1].request.url.params["page_token"] == "tok2"
+    assert route.calls[-1].request.url.params["buyer_name"] == "Paula"
+
+
+def test_resume_with_prefetch(config, respx_mock):
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=pages)
+    cursor = PaginationCursor(method="Sales.history", offset=1)
+    resumed = Sales(BaseSyncClient(config)).history_autopaginate(prefetch=2, resume_from=cursor)
+    assert [i.purchase.transaction for i in resumed] == ["HP2", "HP3", "HP4"]
+
+
+def test_resume_keeps_positional_args(config, respx_mock):
+    respx_mock.get(f"{BASE}/coupon/product/p1").mock(return_value=httpx.Response(200, json={
+        "items": [{"code": "A"}, {"code": "B"}], "page_info": {},
+    }))
+    cursor = PaginationCursor(method="Coupons.list", args=("p1",), offset=1)
+    resumed = Coupons(BaseSyncClient(config)).list_autopaginate("p1", resume_from=cursor)
+    assert [c.code for c in resumed] == ["B"]
+
+
+def test_exhausted_cursor_yields_nothing(config, respx_mock):
+    route = respx_mock.get(f"{BASE}/sales/history").mock(side_effect=pages)
+    cursor = PaginationCursor(method="Sales.history", exhausted=True)
+    assert list(Sales(BaseSyncClient(config)).history_autopaginate(resume_from=cursor)) == []
+    assert not route.called
+
+
+def test_resume_rejects_cursor_of_other_method(config):
+    cursor = PaginationCursor(method="Sales.commissions")
+    with pytest.raises(ValueError, match="Sales.commissions"):
+        Sales(BaseSyncClient(config)).history_autopaginate(resume_from=cursor)
+
+
+def test_resume_rejects_mismatched_filters(config):
+    cursor = PaginationCursor(method="Sales.history", filters={"buyer_name": "Paula"})
+    with pytest.raises(ValueError):
+        Sales(BaseSyncClient(config)).history_autopaginate(buyer_name="Ana", resume_from=cursor)
+
+
+def test_async_resume_accepts_sync_cursor(config, respx_mock):
+    respx_mock.get(f"{BASE}/sales/history").mock(side_effect=pages)
+    cursor = PaginationCursor(method="Sales.history", page_token="tok2", offset=1)
+
+    async def collect():
+        async with BaseAsyncClient(config) as client:
+            pager = AsyncSales(client).history_autopaginate(resume_from=cursor)
+            items = [item async for item in pager]
+            return items, pager.cursor
+
+    items, final = asyncio.run(collect())
+    assert [i.purchase.transaction for i in items] == ["HP4"]
+    assert final.exhausted
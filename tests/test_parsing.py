@@ -0,0 +1,77 @@
+import pytest
+
+from hotmart._config import ClientConfig
+from hotmart._parsing import construct, parse
+from hotmart.models.pagination import PaginatedResponse
+from hotmart.models.sales import SaleHistoryItem, SalePurchase
+
+PAGE = {
+    "items": [{
+        "purchase": {"transaction": "HP1", "price": {"value": "10.5"}, "status": "APPROVED"},
+        "buyer": {"name": "Paula"},
+        "custom": {"k": 1},
+    }],
+    "page_info": {"next_page_token": "tok2"},
+}
+
+
+def test_raw_returns_data_untouched():
+    assert parse(PaginatedResponse[SaleHistoryItem], PAGE, "raw") is PAGE
+
+
+def test_construct_builds_nested_models_without_validation():
+    page = construct(PaginatedResponse[SaleHistoryItem], PAGE)
+    item = page.items[0]
+    assert isinstance(item, SaleHistoryItem)
+    assert isinstance(item.purchase, SalePurchase)
+    assert item.purchase.transaction == "HP1"
+    assert item.purchase.price.value == "10.5"  # not coerced to float
+    assert item.custom == {"k": 1}  # extra fields preserved
+    assert page.page_info.next_page_token == "tok2"
+
+
+def test_construct_fills_defaults_for_missing_fields():
+    item = construct(SaleHistoryItem, {"purchase": None})
+    assert item.purchase is None
+    assert item.buyer is None
+
+
+def test_validate_coerces_types():
+    page = parse(PaginatedResponse[SaleHistoryItem], PAGE, "validate")
+    assert page.items[0].purchase.price.value == 10.5
+
+
+def test_config_rejects_unknown_response_mode():
+    with pytest.raises(ValueError):
+        ClientConfig(client_id="c", client_secret="s", basic="b", response_mode="fast")
+
+
+def test_parse_json_validate_uses_single_pass(monkeypatch):
+    import json as stdlib_json
+
+    from hotmart import _parsing
+    from hotmart._parsing import parse_json
+
+    monkeypatch.setattr(_parsing, "load_json", lambda content: pytest.fail("decoder must not be called"))
+    page = parse_json(PaginatedResponse[SaleHistoryItem], stdlib_json.dumps(PAGE).encode(), "validate")
+    assert page.items[0].purchase.transaction == "HP1"
+
+
+def test_parse_json_uses_custom_decoder():
+    from hotmart._parsing import parse_json
+
+    calls: list[bytes] = []
+    def decoder(content: bytes):
+        calls.append(content)
+        return {"items": [], "page_info": None}
+
+    page = parse_json(PaginatedResponse[SaleHistoryItem], b"ignored", "validate", decoder)
+    assert calls == [b"ignored"]
+    assert page.items == []
+
+
+def test_load_json_falls_back_to_stdlib(monkeypatch):
+    from hotmart import _parsing
+
+    monkeypatch.setattr(_parsing, "orjson", None)
+    assert _parsing.load_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
@@ -1,6 +1,7 @@
 import time
 
 import httpx
+import pytest
 
 from hotmart._rate_limit import RateLimitTracker
 
@@ -33,3 +34,286 @@ def test_update_ignores_missing_headers():
     tracker = RateLimitTracker()
     tracker.update(httpx.Headers({}))
     assert tracker._remaining == 500  # default unchanged
+
+
+def test_wait_if_needed_reserves_a_slot_per_call(monkeypatch):
+    slept: list[float] = []
+    monkeypatch.setattr("time.sleep", lambda s: slept.append(s))
+    tracker = RateLimitTracker()
+    tracker._remaining = 2
+    tracker._reset_at = time.time() + 5.0
+    tracker.wait_if_needed()
+    tracker.wait_if_needed()
+    assert not slept
+    tracker.wait_if_needed()
+    assert slept and slept[0] > 0
+
+
+def _headers(remaining: int, reset: float, limit: int | None = None) -> httpx.Headers:
+    values = {"RateLimit-Remaining": str(remaining), "RateLimit-Reset": str(reset)}
+    if limit is not None:
+        values["RateLimit-Limit"] = str(limit)
+    return httpx.Headers(values)
+
+
+def test_pacing_does_not_wait_before_first_headers():
+    from hotmart._rate_limit import PacingRateLimiter
+
+    limiter = PacingRateLimiter()
+    assert [limiter.reserve("payments") for _ in range(20)] == [0.0] * 20
+
+
+def test_pacing_spreads_budget_over_window(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=5)
+    limiter.update(_headers(remaining=15, reset=10), "payments")  # 10 usable calls over 10s
+    delays = [limiter.reserve("payments") for _ in range(4)]
+    assert delays == pytest.approx([0.0, 1.0, 2.0, 3.0])
+
+
+def test_pacing_allows_bursts(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=0, burst=3)
+    limiter.update(_headers(remaining=10, reset=10), "payments")
+    delays = [limiter.reserve("payments") for _ in range(5)]
+    assert delays == pytest.approx([0.0, 0.0, 0.0, 1.0, 2.0])
+
+
+def test_pacing_waits_for_reset_when_budget_is_spent(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=5, window=60)
+    limiter.update(_headers(remaining=5, reset=4, limit=65), "payments")
+    assert limiter.reserve("payments") == pytest.approx(4.0)
+    assert limiter.reserve("payments") == pytest.approx(5.0)  # new window paced at 60s / 60 calls
+
+
+def test_pacing_keeps_one_bucket_per_domain(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=0)
+    limiter.update(_headers(remaining=1, reset=30), "payments")
+    limiter.reserve("payments")
+    assert limiter.reserve("payments") == pytest.approx(30.0)
+    assert limiter.reserve("club") == 0.0
+
+
+def test_pacing_rejects_invalid_settings():
+    from hotmart._rate_limit import PacingRateLimiter
+
+    with pytest.raises(ValueError):
+        PacingRateLimiter(headroom=-1)
+    with pytest.raises(ValueError):
+        PacingRateLimiter(burst=0)
+
+
+def test_client_uses_configured_policy(respx_mock):
+    from hotmart._base_client import BaseSyncClient
+    from hotmart._config import ClientConfig
+
+    class Recorder:
+        def __init__(self):
+            self.calls = []
+
+        def reserve(self, api_domain, priority="interactive"):
+            self.calls.append(("reserve", api_domain))
+            return 0.0
+
+        def update(self, headers, api_domain="payments"):
+            self.calls.append(("update", api_domain))
+
+    respx_mock.post("https://api-sec-vlc.hotmart.com/security/oauth/token").mock(return_value=httpx.Response(
+        200, json={"access_token": "tok", "token_type": "bearer", "expires_in": 86400},
+    ))
+    respx_mock.get("https://developers.hotmart.com/club/api/v1/modules").mock(return_value=httpx.Response(200, json={}))
+    policy = Recorder()
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", rate_limiter=policy)
+    BaseSyncClient(config)._get("/modules", api_domain="club")
+    assert policy.calls == [("reserve", "club"), ("update", "club")]
+
+
+def test_pacing_ignores_stale_remaining_within_window(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=0)
+    limiter.update(_headers(remaining=100, reset=30), "payments")
+    limiter.update(_headers(remaining=90, reset=30), "payments")
+    limiter.update(_headers(remaining=95, reset=30), "payments")  # older response arriving late
+    with limiter._backend.bucket("default.payments") as bucket:
+        assert bucket.remaining == 90
+
+
+def test_file_backend_shares_budget_between_limiters(tmp_path, monkeypatch):
+    from hotmart._rate_limit import FileRateLimitBackend, PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    first = PacingRateLimiter(headroom=0, backend=FileRateLimitBackend(tmp_path), namespace="cid")
+    second = PacingRateLimiter(headroom=0, backend=FileRateLimitBackend(tmp_path), namespace="cid")
+    other = PacingRateLimiter(headroom=0, backend=FileRateLimitBackend(tmp_path), namespace="other")
+    first.update(_headers(remaining=10, reset=10), "payments")
+    assert first.reserve("payments") == pytest.approx(0.0)
+    assert second.reserve("payments") == pytest.approx(1.0)
+    assert first.reserve("payments") == pytest.approx(2.0)
+    assert other.reserve("payments") == 0.0
+
+
+def test_file_backend_coordinates_processes(tmp_path):
+    import subprocess
+    import sys
+
+    from hotmart._rate_limit import FileRateLimitBackend, PacingRateLimiter
+
+    backend = FileRateLimitBackend(tmp_path)
+    limiter = PacingRateLimiter(headroom=0, backend=backend, namespace="cid")
+    limiter.update(_headers(remaining=1000, reset=600), "payments")
+
+    script = (
+        "import sys\n"
+        "from hotmart._rate_limit import FileRateLimitBackend, PacingRateLimiter\n"
+        "limiter = PacingRateLimiter(headroom=0, backend=FileRateLimitBackend(sys.argv[1]), namespace='cid')\n"
+        "for _ in range(25):\n"
+        "    limiter.reserve('payments')\n"
+    )
+    procs = [subprocess.Popen([sys.executable, "-c", script, str(tmp_path)]) for _ in range(4)]
+    assert all(p.wait(timeout=30) == 0 for p in procs)
+    with backend.bucket("cid.payments") as bucket:
+        assert bucket.remaining == 900
+
+
+def test_clients_with_same_client_id_share_backend(tmp_path, monkeypatch):
+    from hotmart._base_client import BaseSyncClient
+    from hotmart._config import ClientConfig
+    from hotmart._rate_limit import FileRateLimitBackend
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    backend = FileRateLimitBackend(tmp_path)
+
+    def client(client_id):
+        config = ClientConfig(client_id=client_id, client_secret="s", basic="Basic x", rate_limit_backend=backend)
+        return BaseSyncClient(config)
+
+    a, b, c = client("cid"), client("cid"), client("other")
+    a._rate_limiter.update(_headers(remaining=15, reset=10), "payments")  # 10 usable after headroom
+    a._rate_limiter.reserve("payments")
+    assert b._rate_limiter.reserve("payments") == pytest.approx(1.0)
+    assert c._rate_limiter.reserve("payments") == 0.0
+
+
+def test_batch_backs_off_first_when_budget_is_low(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=0, interactive_reserve=10)
+    limiter.update(_headers(remaining=8, reset=20), "payments")
+    assert limiter.reserve("payments", "batch") == pytest.approx(20.0)  # waits for the reset
+    assert limiter.reserve("payments", "interactive") == 0.0  # still has the reserved budget
+
+
+def test_lanes_share_one_schedule(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    limiter = PacingRateLimiter(headroom=0, interactive_reserve=50)
+    limiter.update(_headers(remaining=100, reset=100), "payments")
+    assert limiter.reserve("payments", "batch") == 0.0
+    assert limiter.reserve("payments", "interactive") == pytest.approx(2.0)  # after the batch slot
+    assert limiter.reserve("payments", "batch") == pytest.approx(2.0 + 98 / 99)
+
+
+def test_busy_lanes_together_stay_within_the_window_budget(monkeypatch):
+    from hotmart._rate_limit import PacingRateLimiter
+
+    clock = [1000.0]
+    monkeypatch.setattr("time.time", lambda: clock[0])
+    limiter = PacingRateLimiter(headroom=5, interactive_reserve=20)
+    limiter.update(_headers(remaining=100, reset=60, limit=100), "payments")
+    reset_at = 1060.0
+    ready = {"interactive": 1000.0, "batch": 1000.0}  # each lane sends again as soon as it may
+    sends: list[float] = []
+    while min(ready.values()) < reset_at:
+        lane = min(ready, key=ready.__getitem__)
+        clock[0] = ready[lane]
+        send_at = clock[0] + limiter.reserve("payments", lane)
+        if send_at < reset_at:
+            sends.append(send_at)
+        ready[lane] = send_at + 0.001
+    assert len(sends) <= 100 - 5
+    assert sum(1 for t in sends if t < 1030.0) <= (100 - 5) / 2 + 2  # spread, not burnt in the first half
+
+
+def test_priority_is_validated_and_passed_to_policy(respx_mock):
+    from hotmart._base_client import BaseSyncClient
+    from hotmart._config import ClientConfig
+    from hotmart.resources.club import Club
+
+    with pytest.raises(ValueError):
+        ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", priority="urgent")
+
+    seen = []
+
+    class Recorder:
+        def reserve(self, api_domain, priority="interactive"):
+            seen.append(priority)
+            return 0.0
+
+        def update(self, headers, api_domain="payments"):
+            pass
+
+    respx_mock.post("https://api-sec-vlc.hotmart.com/security/oauth/token").mock(return_value=httpx.Response(
+        200, json={"access_token": "tok", "token_type": "bearer", "expires_in": 86400},
+    ))
+    respx_mock.get("https://developers.hotmart.com/club/api/v1/modules").mock(return_value=httpx.Response(200, json=[]))
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", rate_limiter=Recorder())
+    club = Club(BaseSyncClient(config))
+    club.modules(subdomain="x")
+    club.with_options(priority="batch").modules(subdomain="x")
+    assert seen == ["interactive", "batch"]
+
+
+def test_async_client_keeps_the_loop_running_while_the_file_bucket_is_locked(tmp_path, respx_mock):
+    import asyncio
+    import threading
+
+    from hotmart._base_client import BaseAsyncClient
+    from hotmart._config import ClientConfig
+    from hotmart._rate_limit import FileRateLimitBackend, rate_limit_namespace
+
+    respx_mock.post("https://api-sec-vlc.hotmart.com/security/oauth/token").mock(return_value=httpx.Response(
+        200, json={"access_token": "tok", "token_type": "bearer", "expires_in": 86400}))
+    respx_mock.get("https://developers.hotmart.com/payments/api/v1/test").mock(return_value=httpx.Response(200))
+    backend = FileRateLimitBackend(tmp_path)
+    held, release = threading.Event(), threading.Event()
+
+    def holder():  # another process keeps the bucket locked
+        with backend.bucket(f"{rate_limit_namespace('cid')}.payments"):
+            held.set()
+            release.wait(5)
+
+    async def run():
+        config = ClientConfig(client_id="cid", client_secret="s", basic="Basic x", rate_limit_backend=backend)
+        async with BaseAsyncClient(config) as client:
+            await client._token_manager.get_token()
+            request = asyncio.create_task(client._get("/test"))
+            ticks = 0
+            while not request.done() and ticks < 20:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            release.set()
+            await request
+            return ticks
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait()
+    try:
+        assert asyncio.run(run()) == 20  # the loop kept ticking while the request waited for the lock
+    finally:
+        release.set()
+        thread.join()
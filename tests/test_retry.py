@@ -1,6 +1,16 @@
+import email.utils
+import time
+
 import httpx
+import pytest
+
+from hotmart._base_client import BaseSyncClient
+from hotmart._config import ClientConfig
+from hotmart._exceptions import InternalServerError
+from hotmart._retry import RetryBudget, get_retry_delay, is_retryable
 
-from hotmart._retry import get_retry_delay, is_retryable
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
 
 
 def test_is_retryable_for_429():
@@ -44,3 +54,80 @@ def test_delay_uses_rate_limit_reset_header_for_429():
 def test_delay_caps_rate_limit_reset_at_30():
     resp = httpx.Response(429, headers={"RateLimit-Reset": "999"})
     assert get_retry_delay(0, response=resp) == 30.0
+
+
+def test_delay_honours_retry_after_seconds():
+    resp = httpx.Response(503, headers={"Retry-After": "7"})
+    assert get_retry_delay(0, response=resp) == 7.0
+
+
+def test_retry_after_takes_precedence_over_rate_limit_reset():
+    resp = httpx.Response(429, headers={"Retry-After": "2", "RateLimit-Reset": "40"})
+    assert get_retry_delay(0, response=resp) == 2.0
+
+
+def test_delay_honours_retry_after_http_date():
+    when = email.utils.formatdate(time.time() + 12, usegmt=True)
+    resp = httpx.Response(503, headers={"Retry-After": when})
+    assert 10.0 <= get_retry_delay(0, response=resp) <= 12.0
+
+
+def test_invalid_retry_after_falls_back_to_backoff():
+    resp = httpx.Response(503, headers={"Retry-After": "soon"})
+    assert get_retry_delay(0, response=resp) <= 1.0
+
+
+def test_retry_budget_limits_retries_to_ratio(monkeypatch):
+    monkeypatch.setattr("hotmart._retry.time.monotonic", lambda: 0.0)
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_retry_budget_refills_over_time(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("hotmart._retry.time.monotonic", lambda: now[0])
+    budget = RetryBudget(ratio=0, min_per_second=2, max_tokens=1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    now[0] += 0.5
+    assert budget.try_spend()
+
+
+def test_client_stops_retrying_when_budget_is_empty(respx_mock, monkeypatch):
+    monkeypatch.setattr("hotmart._base_client.get_retry_delay", lambda attempt, response=None: 0.0)
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+    route = respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(503))
+    budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=2)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=5, retry_budget=budget)
+    client = BaseSyncClient(config)
+    with pytest.raises(InternalServerError):
+        client._get("/test")
+    assert route.call_count == 3  # first attempt + the two retries the budget allowed
+    with pytest.raises(InternalServerError):
+        client._get("/test")
+    assert route.call_count == 4
+
+
+def test_resend_after_401_spends_the_retry_budget(respx_mock):
+    from hotmart._exceptions import AuthenticationError
+
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+    route = respx_mock.get(f"{BASE}/test").mock(return_value=httpx.Response(401))
+    budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=1)
+    config = ClientConfig(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0, retry_budget=budget)
+    client = BaseSyncClient(config)
+    with pytest.raises(AuthenticationError):
+        client._get("/test")
+    assert route.call_count == 2  # the resend took the only token
+    with pytest.raises(AuthenticationError):
+        client._get("/test")
+    assert route.call_count == 3  # budget empty: no resend
@@ -0,0 +1,114 @@
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from hotmart import Hotmart, SQLiteSync
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+BASE = "https://developers.hotmart.com/payments/api/v1"
+DAY_MS = 24 * 60 * 60 * 1000
+
+@pytest.fixture(autouse=True)
+def mock_token(respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={
+        "access_token": "tok", "token_type": "bearer", "expires_in": 86400,
+    }))
+
+@pytest.fixture
+def client():
+    return Hotmart(client_id="cid", client_secret="csec", basic="Basic x", max_retries=0)
+
+def _page(*items):
+    return httpx.Response(200, json={"items": list(items), "page_info": {}})
+
+
+def test_first_sync_uses_initial_start_and_stores_rows(client, respx_mock, tmp_path):
+    route = respx_mock.get(f"{BASE}/sales/history").mock(return_value=_page(
+        {"purchase": {"transaction": "HP1", "status": "APPROVED"}},
+        {"purchase": {"transaction": "HP2", "status": "APPROVED"}},
+    ))
+    with SQLiteSync(client, tmp_path / "h.db", initial_start_date=1000) as store:
+        result = store.sync_sales(transaction_status="APPROVED")
+        assert result.rows == 2
+        assert store.checkpoint("sales") == result.end_date
+    assert route.call_count == 1
+    assert route.calls[0].request.url.params["start_date"] == "1000"
+    assert route.calls[0].request.url.params["transaction_status"] == "APPROVED"
+    rows = sqlite3.connect(tmp_path / "h.db").execute("SELECT key FROM sales ORDER BY key").fetchall()
+    assert rows == [("HP1",), ("HP2",)]
+
+
+def test_first_sync_defaults_to_full_history_and_every_status(client, respx_mock, tmp_path):
+    from hotmart import PurchaseStatus
+    from hotmart._sqlite_sync import DEFAULT_INITIAL_START_DATE
+
+    def by_status(request):
+        status = request.url.params["transaction_status"]
+        if status == "REFUNDED":
+            return _page({"purchase": {"transaction": "HP9", "status": status}})
+        return _page()
+
+    route = respx_mock.get(f"{BASE}/sales/history").mock(side_effect=by_status)
+    with SQLiteSync(client, tmp_path / "h.db") as store:
+        assert store.sync_sales().rows == 1
+    sent = [call.request.url.params for call in route.calls]
+    assert {params["transaction_status"] for params in sent} == set(PurchaseStatus)
+    assert {params["start_date"] for params in sent} == {str(DEFAULT_INITIAL_START_DATE)}
+    (data,) = sqlite3.connect(tmp_path / "h.db").execute("SELECT data FROM sales").fetchone()
+    assert json.loads(data)["purchase"]["status"] == "REFUNDED"
+
+
+def test_second_sync_starts_from_checkpoint_minus_overlap_and_upserts(client, respx_mock, tmp_path):
+    route = respx_mock.get(f"{BASE}/sales/history").mock(side_effect=[
+        _page({"purchase": {"transaction": "HP1", "status": "WAITING_PAYMENT"}}),
+        _page({"purchase": {"transaction": "HP1", "status": "APPROVED"}}),
+    ])
+    with SQLiteSync(client, tmp_path / "h.db", overlap_ms=DAY_MS) as store:
+        first = store.sync_sales(transaction_status="WAITING_PAYMENT")
+        store.sync_sales(transaction_status="APPROVED")
+    assert int(route.calls[1].request.url.params["start_date"]) == first.end_date - DAY_MS
+    (data,) = sqlite3.connect(tmp_path / "h.db").execute("SELECT data FROM sales").fetchone()
+    assert json.loads(data)["purchase"]["status"] == "APPROVED"
+
+
+def test_subscriptions_sync_pulls_accession_and_cancelation_windows(client, respx_mock, tmp_path):
+    route = respx_mock.get(f"{BASE}/subscriptions").mock(side_effect=[
+        _page({"subscriber_code": "S1", "status": "ACTIVE"}),
+        _page({"subscriber_code": "S1", "status": "CANCELLED_BY_CUSTOMER"}, {"subscriber_code": "S2"}),
+    ])
+    with SQLiteSync(client, tmp_path / "h.db", initial_start_date=0) as store:
+        assert store.sync_subscriptions(product_id=7).rows == 3
+    assert "accession_date" in route.calls[0].request.url.params
+    assert "cancelation_date" in route.calls[1].request.url.params
+    assert route.calls[1].request.url.params["product_id"] == "7"
+    count = sqlite3.connect(tmp_path / "h.db").execute("SELECT COUNT(*) FROM subscriptions").fetchone()
+    assert count == (2,)
+
+
+def test_failed_sync_does_not_advance_checkpoint(client, respx_mock, tmp_path):
+    from hotmart import InternalServerError
+    respx_mock.get(f"{BASE}/sales/commissions").mock(return_value=httpx.Response(500))
+    with SQLiteSync(client, tmp_path / "h.db") as store:
+        with pytest.raises(InternalServerError):
+            store.sync_commissions()
+        assert store.checkpoint("commissions") is None
+
+
+def test_unknown_resource_raises(client, tmp_path):
+    with SQLiteSync(client, tmp_path / "h.db") as store, pytest.raises(ValueError):
+        store.sync("refunds")
+
+
+def test_sync_all_forwards_only_the_filters_each_resource_accepts(client, respx_mock, tmp_path):
+    routes = {path: respx_mock.get(f"{BASE}/{path}").mock(return_value=_page())
+              for path in ("sales/history", "sales/commissions", "sales/users", "subscriptions")}
+    with SQLiteSync(client, tmp_path / "h.db") as store:
+        store.sync_all(transaction_status="REFUNDED")
+        with pytest.raises(ValueError, match="colour"):
+            store.sync_all(colour="blue")
+    for path in ("sales/history", "sales/commissions", "sales/users"):
+        assert [call.request.url.params["transaction_status"] for call in routes[path].calls] == ["REFUNDED"]
+    assert routes["subscriptions"].call_count == 2
+    assert all("transaction_status" not in call.request.url.params for call in routes["subscriptions"].calls)
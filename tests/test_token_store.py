@@ -0,0 +1,170 @@
+import asyncio
+import os
+import threading
+import time
+
+import httpx
+import pytest
+
+from hotmart import CachedToken, FileTokenStore, TokenStore
+from hotmart._auth import AsyncTokenManager, TokenManager
+from hotmart._config import ClientConfig
+from hotmart._token_store import token_key
+
+TOKEN_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+KEY = token_key("cid", "csec")
+
+
+def _token_response(token: str = "tok123", expires_in: int = 86400) -> httpx.Response:
+    return httpx.Response(200, json={"access_token": token, "token_type": "bearer", "expires_in": expires_in})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FileTokenStore(tmp_path)
+
+
+@pytest.fixture
+def config(store):
+    return ClientConfig(client_id="cid", client_secret="csec", basic="Basic dGVzdA==", token_store=store)
+
+
+def test_file_store_round_trip(store, tmp_path):
+    assert isinstance(store, TokenStore)
+    assert store.get(KEY) is None
+    store.set(KEY, CachedToken(access_token="tok", expires_at=123.0))
+    assert store.get(KEY) == CachedToken(access_token="tok", expires_at=123.0)
+    assert os.stat(tmp_path / f"{KEY}.json").st_mode & 0o777 == 0o600
+    store.delete(KEY)
+    assert store.get(KEY) is None
+
+
+def test_file_store_ignores_corrupt_file(store, tmp_path):
+    (tmp_path / f"{KEY}.json").write_text("{not json")
+    assert store.get(KEY) is None
+
+
+def test_key_does_not_contain_secret():
+    assert "csec" not in token_key("cid", "csec")
+    assert token_key("cid", "csec") != token_key("cid", "other")
+
+
+def test_refreshed_token_is_published(config, store, respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response("shared"))
+    assert TokenManager(config).get_token() == "shared"
+    assert store.get(KEY).access_token == "shared"
+
+
+def test_managers_reuse_stored_token(config, store, respx_mock):
+    route = respx_mock.post(TOKEN_URL).mock(return_value=_token_response())
+    store.set(KEY, CachedToken(access_token="from_other_process", expires_at=time.time() + 3600))
+    assert TokenManager(config).get_token() == "from_other_process"
+    assert not route.called
+
+
+def test_expiring_stored_token_is_refreshed(config, store, respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response("fresh"))
+    store.set(KEY, CachedToken(access_token="stale", expires_at=time.time() + 60))
+    assert TokenManager(config).get_token() == "fresh"
+    assert store.get(KEY).access_token == "fresh"
+
+
+def test_many_managers_refresh_once(config, respx_mock):
+    route = respx_mock.post(TOKEN_URL).mock(return_value=_token_response())
+    managers = [TokenManager(config) for _ in range(8)]
+    threads = [threading.Thread(target=m.get_token) for m in managers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert route.call_count == 1
+    assert {m._token for m in managers} == {"tok123"}
+
+
+def test_invalidate_keeps_newer_shared_token(config, store, respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response("mine"))
+    manager = TokenManager(config)
+    manager.get_token()
+    store.set(KEY, CachedToken(access_token="newer", expires_at=time.time() + 3600))
+    manager.invalidate()
+    assert store.get(KEY).access_token == "newer"
+
+
+def test_invalidate_drops_own_shared_token(config, store, respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response("mine"))
+    manager = TokenManager(config)
+    manager.get_token()
+    manager.invalidate()
+    assert store.get(KEY) is None
+
+
+def test_async_managers_share_store(config, store, respx_mock):
+    route = respx_mock.post(TOKEN_URL).mock(return_value=_token_response("async_shared"))
+
+    async def run():
+        managers = [AsyncTokenManager(config) for _ in range(4)]
+        return await asyncio.gather(*(m.get_token() for m in managers))
+
+    assert set(asyncio.run(run())) == {"async_shared"}
+    assert route.call_count == 1
+    assert TokenManager(config).get_token() == "async_shared"
+
+
+def test_async_managers_outnumbering_workers_do_not_deadlock(config, respx_mock):
+    from concurrent.futures import ThreadPoolExecutor
+
+    route = respx_mock.post(TOKEN_URL).mock(return_value=_token_response("few_workers"))
+
+    async def run():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        managers = [AsyncTokenManager(config) for _ in range(6)]
+        return await asyncio.wait_for(asyncio.gather(*(m.get_token() for m in managers)), timeout=5)
+
+    assert set(asyncio.run(run())) == {"few_workers"}
+    assert route.call_count == 1
+
+
+def test_async_cancel_while_locking_releases_store_lock(config, store, respx_mock):
+    respx_mock.post(TOKEN_URL).mock(return_value=_token_response())
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with store.lock(KEY):
+            held.set()
+            release.wait()
+
+    async def run():
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait()
+        task = asyncio.create_task(AsyncTokenManager(config).get_token())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+        thread.join()
+        await asyncio.sleep(0.2)
+        return await asyncio.wait_for(AsyncTokenManager(config).get_token(), timeout=5)
+
+    assert asyncio.run(run()) == "tok123"
+
+
+def test_default_directory_is_private_to_the_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    FileTokenStore().set(KEY, CachedToken("tok", 1.0))
+    directory = tmp_path / "hotmart-python"
+    assert (directory / f"{KEY}.json").exists()
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+
+def test_refuses_directories_of_other_users_and_symlinks(tmp_path, monkeypatch):
+    target = tmp_path / "real"
+    target.mkdir()
+    (tmp_path / "link").symlink_to(target)
+    with pytest.raises(PermissionError):
+        FileTokenStore(tmp_path / "link")
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(target).st_uid + 1)
+    with pytest.raises(PermissionError):
+        FileTokenStore(target)